@@ -0,0 +1,70 @@
+"""
+Benchmark de la validación de argumentos de las APIs generadas.
+
+Mide llamadas por segundo de ``OrderflowApi.klines_get`` con la validación
+de ``@validate_call`` activa, con ``fast_api`` y con
+``set_argument_validation(False)``. Las respuestas salen de una
+``ResponseCache`` precargada para que la red no oculte la diferencia; la
+columna ``µs/llamada`` es el coste completo en el cliente (argumentos,
+serialización y deserialización).
+
+Uso:
+    poetry run python benchmarks/argument_validation.py --calls 50000
+"""
+
+import argparse
+import time
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.fast_api import fast_api, set_argument_validation
+from hyblock_capital_sdk.response_cache import ResponseCache
+from hyblock_capital_sdk.testing import StandInServer
+
+KWARGS = {"coin": "BTC", "timeframe": "1m", "exchange": "binance", "limit": 1000}
+
+
+def calls_per_second(orderflow_api, calls: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(calls):
+            orderflow_api.klines_get(**KWARGS)
+        best = min(best, time.perf_counter() - started)
+    return calls / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with StandInServer() as server:
+        api_client = hc.ApiClient(server.configuration())
+        api_client.response_cache = ResponseCache(ttl=float("inf"))
+        hc.OrderflowApi(api_client).klines_get(**KWARGS)
+
+    results = {
+        "validate_call": calls_per_second(
+            hc.OrderflowApi(api_client), args.calls, args.repeat
+        ),
+        "fast_api": calls_per_second(
+            fast_api(hc.OrderflowApi)(api_client), args.calls, args.repeat
+        ),
+    }
+    set_argument_validation(False)
+    try:
+        results["set_argument_validation(False)"] = calls_per_second(
+            hc.OrderflowApi(api_client), args.calls, args.repeat
+        )
+    finally:
+        set_argument_validation(True)
+
+    base = results["validate_call"]
+    print(f"{'variante':<32} {'llamadas/s':>11} {'µs/llamada':>11} {'speedup':>8}")
+    for name, rate in results.items():
+        print(f"{name:<32} {rate:>11.0f} {1e6 / rate:>11.2f} {rate / base:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark del transporte HTTP/2 frente al pool HTTP/1.1 de urllib3.
+
+Levanta dos servidores locales con la misma latencia por respuesta: uno
+HTTP/1.1 (``StandInServer``) y otro HTTP/2 sin TLS (h2, prior knowledge)
+que responde el mismo payload de ``/klines``.
+Luego lanza ``--requests`` GETs con ``--concurrency`` hilos compartiendo un
+``ApiClient`` por transporte. Con el pool HTTP/1.1 limitado a ``--pool``
+conexiones, las peticiones que no caben esperan o abren conexiones nuevas;
+con HTTP/2 todas se multiplexan sobre una conexión.
+
+Requiere el extra http2: ``pip install hyblock-capital-sdk[http2]``.
+
+Uso:
+    poetry run python benchmarks/http2_transport.py --requests 2000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import h2.config
+import h2.connection
+import h2.events
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.testing import StandInServer
+
+PAYLOAD = StandInServer().payload("/klines")
+RESPONSE_HEADERS = [
+    (":status", "200"),
+    ("content-type", "application/json"),
+    ("content-length", str(len(PAYLOAD))),
+]
+
+
+class H2Protocol(asyncio.Protocol):
+    """Servidor HTTP/2 mínimo que responde ``PAYLOAD`` a cada stream."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data):
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                asyncio.get_running_loop().call_later(
+                    self.latency, self.respond, event.stream_id
+                )
+        self.transport.write(self.conn.data_to_send())
+
+    def respond(self, stream_id):
+        if self.transport.is_closing():
+            return
+        self.conn.send_headers(stream_id, RESPONSE_HEADERS)
+        self.conn.send_data(stream_id, PAYLOAD, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+
+
+def start_h2_server(latency: float) -> int:
+    """Arranca el servidor HTTP/2 en un hilo y retorna su puerto."""
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(
+        loop.create_server(lambda: H2Protocol(latency), "127.0.0.1", 0)
+    )
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return server.sockets[0].getsockname()[1]
+
+
+def run(api_client: hc.ApiClient, requests: int, concurrency: int) -> float:
+    """
+    Ejecuta ``requests`` peticiones con ``concurrency`` hilos.
+
+    Returns:
+        Peticiones por segundo
+    """
+    orderflow_api = hc.OrderflowApi(api_client)
+
+    def call(_):
+        orderflow_api.klines_get(coin="BTC", timeframe="1m", exchange="binance")
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(call, range(requests)))
+    return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--pool", type=int, default=10)
+    args = parser.parse_args()
+    # urllib3 avisa de cada conexión descartada por pool lleno
+    logging.getLogger("urllib3").setLevel(logging.ERROR)
+
+    http1_server = StandInServer(latency=args.latency).start()
+    hosts = {
+        "urllib3": http1_server.host,
+        "http2": f"http://127.0.0.1:{start_h2_server(args.latency)}",
+    }
+    print(f"{'transporte':>10} {'req/s':>10}")
+    for transport, host in hosts.items():
+        config = hc.Configuration(host=host)
+        config.transport = transport
+        config.connection_pool_maxsize = args.pool
+        api_client = hc.ApiClient(config)
+        run(api_client, args.concurrency, args.concurrency)  # calentamiento
+        rate = run(api_client, args.requests, args.concurrency)
+        print(f"{transport:>10} {rate:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
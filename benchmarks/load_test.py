@@ -0,0 +1,163 @@
+"""
+Prueba de carga del SDK contra el servidor local ``StandInServer``.
+
+Lanza peticiones concurrentes de las APIs generadas (por defecto ``/klines``,
+``/liquidationLevels`` y ``/catalog``) durante un tiempo fijo y reporta el
+throughput, los percentiles de latencia y los códigos HTTP recibidos. El
+servidor simula latencia, errores, 429 y tamaño de payloads, así que sirve
+para ver cómo se comporta el cliente (pool de conexiones, transporte,
+deserialización) bajo condiciones parecidas a las de producción.
+
+Uso:
+    poetry run python benchmarks/load_test.py --threads 16 --duration 10 \\
+        --latency 0.03 --jitter 0.01 --rate-limit-rate 0.01 --list-size 200
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.exceptions import ApiException
+from hyblock_capital_sdk.testing import StandInServer, api_routes
+
+DEFAULT_PATHS = ("/klines", "/liquidationLevels", "/catalog")
+QUERY = {"coin": "BTC", "timeframe": "1m", "exchange": "binance"}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Percentil ``q`` (0-100) por el método del rango más cercano."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run(
+    api_client: hc.ApiClient,
+    paths: List[str],
+    threads: int,
+    duration: float,
+) -> Dict[str, Any]:
+    """
+    Ejecuta la carga con ``threads`` hilos durante ``duration`` segundos.
+
+    Cada hilo recorre ``paths`` en orden; cada petición se serializa, se envía
+    y se deserializa en el modelo de la ruta, como en las APIs generadas.
+
+    Returns:
+        Diccionario con peticiones, throughput, latencias (ms) y códigos HTTP
+    """
+    routes = api_routes()
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(offset: int) -> None:
+        local_latencies = []
+        local_statuses: Counter = Counter()
+        i = offset
+        while time.perf_counter() < deadline:
+            path = paths[i % len(paths)]
+            i += 1
+            started = time.perf_counter()
+            try:
+                _, url, headers, _, _ = api_client.param_serialize(
+                    "GET", path, query_params=list(QUERY.items())
+                )
+                response = api_client.call_api("GET", url, header_params=headers)
+                response.read()
+                api_client.response_deserialize(response, {"200": routes[path]})
+                status = response.status
+            except ApiException as e:
+                status = e.status
+            except Exception as e:
+                status = type(e).__name__
+            local_latencies.append(time.perf_counter() - started)
+            local_statuses[status] += 1
+        with lock:
+            latencies.extend(local_latencies)
+            statuses.update(local_statuses)
+
+    started = time.perf_counter()
+    workers = [
+        threading.Thread(target=worker, args=(n,), daemon=True) for n in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "threads": threads,
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed,
+        "latency_ms": {
+            "mean": 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+            "p50": 1000 * percentile(latencies, 50),
+            "p90": 1000 * percentile(latencies, 90),
+            "p99": 1000 * percentile(latencies, 99),
+            "max": 1000 * max(latencies, default=0.0),
+        },
+        "statuses": {str(k): v for k, v in sorted(statuses.items(), key=str)},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--paths", nargs="*", default=list(DEFAULT_PATHS))
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--list-size", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Salida en JSON")
+    args = parser.parse_args()
+
+    unknown = set(args.paths) - set(api_routes())
+    if unknown:
+        parser.error(f"Rutas desconocidas: {', '.join(sorted(unknown))}")
+
+    with StandInServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=0,
+        list_size=args.list_size,
+    ) as server:
+        # sin reintentos de urllib3: cada 429 o error se cuenta tal cual
+        config = server.configuration(retries=False)
+        config.connection_pool_maxsize = args.threads
+        api_client = hc.ApiClient(config)
+        result = run(api_client, args.paths, args.threads, args.duration)
+
+    if args.json:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+        return 0
+    latency = result["latency_ms"]
+    print(f"hilos:       {result['threads']}")
+    print(f"peticiones:  {result['requests']} en {result['seconds']:.1f}s")
+    print(f"throughput:  {result['requests_per_second']:.1f} req/s")
+    print(
+        f"latencia ms: media {latency['mean']:.1f}  p50 {latency['p50']:.1f}  "
+        f"p90 {latency['p90']:.1f}  p99 {latency['p99']:.1f}  "
+        f"max {latency['max']:.1f}"
+    )
+    print(f"códigos:     {result['statuses']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
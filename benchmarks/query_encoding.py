@@ -0,0 +1,122 @@
+"""
+Benchmark de la codificación de la query string.
+
+Compara, para combinaciones típicas de parámetros de los endpoints (coin,
+exchange, timeframe, limit, startTime...):
+
+- ``generic``: ``sanitize_for_serialization`` + ``parameters_to_url_query``
+  sin el camino rápido (el comportamiento anterior)
+- ``encode_query``: el codificador de una pasada con memorización
+- ``param_serialize`` completo con y sin el camino rápido
+
+Antes de medir comprueba que ambos caminos producen la misma query.
+
+Uso:
+    poetry run python benchmarks/query_encoding.py --requests 100000
+"""
+
+import argparse
+import random
+import time
+from unittest.mock import patch
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.query import encode_query
+
+COINS = ("BTC", "ETH", "SOL", "XRP", "DOGE", "1000PEPE")
+EXCHANGES = ("binance", "bybit", "okx", "binance_perp_stable")
+TIMEFRAMES = ("1m", "5m", "15m", "1h", "4h", "1d")
+
+
+def make_params(n: int, seed: int = 0):
+    """Genera ``n`` listas de parámetros como las de las APIs generadas."""
+    rng = random.Random(seed)
+    params = []
+    for i in range(n):
+        query = [
+            ("coin", rng.choice(COINS)),
+            ("timeframe", rng.choice(TIMEFRAMES)),
+            ("exchange", rng.choice(EXCHANGES)),
+            ("limit", rng.choice((100, 500, 1000))),
+            ("startTime", str(1704067200 + 60 * i)),
+        ]
+        if i % 3 == 0:
+            query.append(("bucket", rng.random() * 10))
+        if i % 5 == 0:
+            query.append(("sort", "asc"))
+        params.append(query)
+    return params
+
+
+def generic_path():
+    """Contexto que desactiva el camino rápido en ``ApiClient``."""
+    return patch("hyblock_capital_sdk.api_client.encode_query", lambda *a: None)
+
+
+def measure(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    api_client = hc.ApiClient(hc.Configuration(host="http://localhost"))
+    params = make_params(args.requests)
+
+    def generic():
+        for query in params:
+            api_client.parameters_to_url_query(
+                api_client.sanitize_for_serialization(query), None
+            )
+
+    def fast():
+        for query in params:
+            encode_query(query)
+
+    def serialize():
+        for query in params:
+            api_client.param_serialize(
+                "GET",
+                "/klines",
+                query_params=list(query),
+                header_params={"Accept": "application/json"},
+                auth_settings=["Api Key"],
+            )
+
+    with generic_path():
+        expected = [
+            api_client.parameters_to_url_query(
+                api_client.sanitize_for_serialization(q), None
+            )
+            for q in params
+        ]
+    assert [encode_query(q) for q in params] == expected
+
+    results = {}
+    with generic_path():
+        results["generic"] = measure(generic, args.repeat)
+        results["param_serialize (generic)"] = measure(serialize, args.repeat)
+    results["encode_query"] = measure(fast, args.repeat)
+    results["param_serialize (fast)"] = measure(serialize, args.repeat)
+
+    print(f"{'camino':<28} {'µs/petición':>12} {'speedup':>8}")
+    baselines = {
+        "encode_query": "generic",
+        "param_serialize (fast)": "param_serialize (generic)",
+    }
+    for name, seconds in results.items():
+        base = baselines.get(name)
+        speedup = f"{results[base] / seconds:.2f}x" if base else ""
+        print(f"{name:<28} {seconds / args.requests * 1e6:>12.2f} {speedup:>8}")
+
+
+if __name__ == "__main__":
+    main()
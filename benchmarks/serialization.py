@@ -0,0 +1,57 @@
+"""
+Benchmark de la serialización de listas de modelos a JSON.
+
+Compara ``json.dumps([m.to_dict() for m in models])`` y
+``[m.to_json() for m in models]`` con ``to_json_many``, que escribe la lista
+completa a bytes JSON sin diccionarios intermedios.
+
+Uso:
+    poetry run python benchmarks/serialization.py --rows 10000
+"""
+
+import argparse
+import json
+import time
+
+from hyblock_capital_sdk.serialization import to_json_many
+from hyblock_capital_sdk.testing import resolve_model, synthetic_rows
+
+MODELS = ["Klines", "LiquidationHeatmap", "VolumeProfile", "OpenInterestProfile"]
+
+
+def best_time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--models", nargs="+", default=MODELS)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'modelo':<22} {'to_dict+dumps':>14} {'to_json':>10} "
+        f"{'to_json_many':>13} {'speedup':>8}"
+    )
+    for name in args.models:
+        cls = resolve_model(name)
+        models = [cls.from_dict(row) for row in synthetic_rows(cls, args.rows)]
+        baseline = best_time(
+            lambda: json.dumps([m.to_dict() for m in models]).encode(), args.repeat
+        )
+        per_model = best_time(lambda: [m.to_json() for m in models], args.repeat)
+        bulk = best_time(lambda: to_json_many(models), args.repeat)
+        print(
+            f"{name:<22} {baseline * 1e3:>11.1f} ms {per_model * 1e3:>7.1f} ms "
+            f"{bulk * 1e3:>10.1f} ms {baseline / bulk:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
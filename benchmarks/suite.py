@@ -0,0 +1,233 @@
+"""
+Suite de benchmarks de serialización, deserialización y transporte.
+
+Mide, para cada modelo de ``hyblock_capital_sdk.models`` y cada tamaño de
+respuesta (por defecto 1k, 10k y 100k filas) con payloads sintéticos:
+
+- ``from_dict``: ``Model.from_dict`` sobre cada fila ya decodificada
+- ``to_dict``: ``to_dict`` de cada instancia
+- ``deserialize``: ``ApiClient.deserialize`` del texto JSON completo
+- ``roundtrip``: ``call_api`` + ``response_deserialize`` contra un servidor
+  HTTP local que sirve el payload
+
+y, una vez por tamaño, ``param_serialize`` de una petición típica repetida
+tantas veces como filas. Los resultados se guardan en JSON para compararlos
+entre versiones del SDK regenerado.
+
+Uso:
+    poetry run python benchmarks/suite.py --output results/main.json
+    poetry run python benchmarks/suite.py --models Klines --sizes 1000 \\
+        --compare results/main.json --threshold 0.2
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.testing import StandInServer, model_classes, synthetic_rows
+
+OPERATIONS = ("from_dict", "to_dict", "deserialize", "roundtrip")
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+class StubServer(StandInServer):
+    """``StandInServer`` que sirve payloads registrados por ruta."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.payloads: Dict[str, bytes] = {}
+
+    def payload(self, path: str) -> Optional[bytes]:
+        return self.payloads.get(path)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """
+    Ejecuta una función ``repeat`` veces.
+
+    Returns:
+        Diccionario con el mejor tiempo (``seconds``) y la media (``mean``)
+    """
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return {"seconds": min(times), "mean": sum(times) / len(times)}
+
+
+def bench_model(
+    api_client: hc.ApiClient,
+    server: StubServer,
+    name: str,
+    size: int,
+    repeat: int,
+) -> List[Dict[str, Any]]:
+    """Mide todas las operaciones de un modelo con ``size`` filas."""
+    cls = model_classes()[name]
+    rows = synthetic_rows(cls, size)
+    text = json.dumps(rows)
+    objs = [cls.from_dict(row) for row in rows]
+    response_type = f"List[{name}]"
+    path = f"/bench/{name}/{size}"
+    server.payloads[path] = text.encode()
+
+    def roundtrip():
+        response = api_client.call_api("GET", server.host + path)
+        response.read()
+        api_client.response_deserialize(response, {"200": response_type})
+
+    operations = {
+        "from_dict": lambda: [cls.from_dict(row) for row in rows],
+        "to_dict": lambda: [obj.to_dict() for obj in objs],
+        "deserialize": lambda: api_client.deserialize(
+            text, response_type, "application/json"
+        ),
+        "roundtrip": roundtrip,
+    }
+    results = []
+    for operation, func in operations.items():
+        result = {"model": name, "rows": size, "operation": operation}
+        result.update(measure(func, repeat))
+        result["rows_per_second"] = size / result["seconds"]
+        results.append(result)
+    del server.payloads[path]
+    return results
+
+
+def bench_param_serialize(
+    api_client: hc.ApiClient, size: int, repeat: int
+) -> Dict[str, Any]:
+    """Mide ``size`` llamadas a ``param_serialize`` de una petición típica."""
+    query = [
+        ("coin", "BTC"),
+        ("timeframe", "1m"),
+        ("exchange", "binance"),
+        ("limit", 1000),
+        ("startTime", "1704067200"),
+    ]
+
+    def run():
+        for _ in range(size):
+            api_client.param_serialize(
+                "GET",
+                "/klines",
+                query_params=list(query),
+                header_params={"Accept": "application/json"},
+                auth_settings=["Api Key"],
+            )
+
+    result = {"model": "-", "rows": size, "operation": "param_serialize"}
+    result.update(measure(run, repeat))
+    result["rows_per_second"] = size / result["seconds"]
+    return result
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(models: List[str], sizes: List[int], repeat: int) -> Dict[str, Any]:
+    """
+    Ejecuta la suite completa.
+
+    Returns:
+        Diccionario con ``meta`` (entorno) y ``results`` (una entrada por
+        modelo, tamaño y operación)
+    """
+    server = StubServer().start()
+    api_client = hc.ApiClient(
+        hc.Configuration(host=server.host, api_key={"Api Key": "bench"})
+    )
+    results = []
+    try:
+        for size in sizes:
+            results.append(bench_param_serialize(api_client, size, repeat))
+            for name in models:
+                results.extend(bench_model(api_client, server, name, size, repeat))
+                print(f"{name} x {size}", file=sys.stderr)
+    finally:
+        server.stop()
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "revision": git_revision(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float):
+    """
+    Compara dos ejecuciones e imprime las diferencias.
+
+    Returns:
+        Lista de resultados más lentos que ``1 + threshold`` veces la base
+    """
+    key = lambda r: (r["model"], r["rows"], r["operation"])  # noqa: E731
+    base = {key(r): r for r in baseline["results"]}
+    regressions = []
+    print(f"{'modelo':<40} {'filas':>7} {'operación':<16} {'ratio':>6}")
+    for result in current["results"]:
+        previous = base.get(key(result))
+        if previous is None:
+            continue
+        ratio = result["seconds"] / previous["seconds"]
+        flag = " <-- regresión" if ratio > 1 + threshold else ""
+        print(
+            f"{result['model']:<40} {result['rows']:>7} "
+            f"{result['operation']:<16} {ratio:>6.2f}{flag}"
+        )
+        if flag:
+            regressions.append(result)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--models", nargs="*", help="Modelos a medir (todos)")
+    parser.add_argument("--sizes", nargs="*", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Archivo JSON donde guardar resultados")
+    parser.add_argument("--compare", help="Resultados JSON de referencia")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    models = args.models or sorted(model_classes())
+    unknown = set(models) - set(model_classes())
+    if unknown:
+        parser.error(f"Modelos desconocidos: {', '.join(sorted(unknown))}")
+
+    current = run_suite(models, args.sizes, args.repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(current, baseline, args.threshold):
+            return 1
+    elif not args.output:
+        json.dump(current, sys.stdout, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
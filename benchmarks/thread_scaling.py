@@ -0,0 +1,67 @@
+"""
+Benchmark de escalado de un ApiClient compartido entre hilos.
+
+Levanta un ``StandInServer`` que responde con una latencia fija y mide el
+throughput de ``OrderflowApi.klines_get`` con un único ``ApiClient``
+compartido por 1, 2, 4, ... hilos, hasta ``connection_pool_maxsize``. Como el
+camino de la petición no toma locks, el throughput debería crecer de forma
+casi lineal con el número de hilos mientras haya conexiones libres.
+
+Uso:
+    poetry run python benchmarks/thread_scaling.py --requests 400 --pool 16
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.testing import StandInServer
+
+
+def run(api_client: hc.ApiClient, threads: int, requests: int) -> float:
+    """
+    Ejecuta ``requests`` peticiones repartidas entre ``threads`` hilos.
+
+    Returns:
+        Peticiones por segundo
+    """
+    orderflow_api = hc.OrderflowApi(api_client)
+
+    def call(_):
+        orderflow_api.klines_get(coin="BTC", timeframe="1m", exchange="binance")
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(call, range(requests)))
+    return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--pool", type=int, default=16)
+    args = parser.parse_args()
+
+    server = StandInServer(latency=args.latency).start()
+
+    config = server.configuration()
+    config.connection_pool_maxsize = args.pool
+    api_client = hc.ApiClient(config)
+    run(api_client, args.pool, args.pool)  # abre las conexiones
+
+    baseline = None
+    threads = 1
+    print(f"{'hilos':>6} {'req/s':>10} {'speedup':>8} {'eficiencia':>10}")
+    while threads <= args.pool:
+        rate = run(api_client, threads, args.requests)
+        baseline = baseline or rate
+        speedup = rate / baseline
+        print(f"{threads:>6} {rate:>10.1f} {speedup:>8.2f} {speedup / threads:>10.0%}")
+        threads *= 2
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Herramientas de análisis local sobre las respuestas del SDK de Hyblock Capital.
+
+Los módulos de este paquete operan con arrays de NumPy sobre los modelos que
+retornan las APIs generadas, evitando bucles por fila en Python. NumPy es una
+dependencia opcional: instálala con ``pip install hyblock-capital-sdk[analytics]``.
+"""
+
+try:
+    import numpy  # noqa: F401
+except ImportError as e:  # pragma: no cover - depende del entorno
+    raise ImportError(
+        "hyblock_capital_sdk.analytics requiere NumPy. "
+        "Instálalo con: pip install hyblock-capital-sdk[analytics]"
+    ) from e
+
+from ..series import TIMEFRAME_SECONDS, timeframe_seconds
+from .aggregation import (
+    AGGREGATION_TYPES,
+    ExchangeAggregate,
+    ExchangeSeriesCache,
+    aggregate_exchanges,
+)
+from .alignment import AlignedSeries, align_on_open_date
+from .buckets import (
+    SIZE_BUCKETS,
+    BucketCache,
+    BucketColumns,
+    build_bucket_columns,
+    parse_buckets,
+)
+from .liquidation_pools import (
+    LEVERAGE_TIERS,
+    LiquidationPool,
+    LiquidationPools,
+    aggregate_liquidation_levels,
+)
+from .profile import Profile, ProfileEngine, merge_profiles
+from .resample import RESAMPLE_RULES, resample, resample_columns
+
+__all__ = [
+    "AGGREGATION_TYPES",
+    "ExchangeAggregate",
+    "ExchangeSeriesCache",
+    "aggregate_exchanges",
+    "AlignedSeries",
+    "align_on_open_date",
+    "SIZE_BUCKETS",
+    "BucketCache",
+    "BucketColumns",
+    "build_bucket_columns",
+    "parse_buckets",
+    "LEVERAGE_TIERS",
+    "LiquidationPool",
+    "LiquidationPools",
+    "aggregate_liquidation_levels",
+    "Profile",
+    "ProfileEngine",
+    "merge_profiles",
+    "RESAMPLE_RULES",
+    "TIMEFRAME_SECONDS",
+    "resample",
+    "resample_columns",
+    "timeframe_seconds",
+]
@@ -0,0 +1,65 @@
+"""
+Utilidades internas para convertir respuestas de la API en columnas de NumPy.
+"""
+
+from typing import Any, List, Optional
+
+import numpy as np
+
+
+def camel_case(field: str) -> str:
+    """
+    Convierte un nombre de atributo a la convención camelCase del JSON.
+
+    Args:
+        field: Nombre en snake_case (ej: "open_date")
+
+    Returns:
+        Nombre en camelCase (ej: "openDate")
+    """
+    head, *tail = field.split("_")
+    return head + "".join(part[:1].upper() + part[1:] for part in tail)
+
+
+def column(
+    records: List[Any],
+    field: str,
+    alias: Optional[str] = None,
+    dtype: Any = np.float64,
+) -> np.ndarray:
+    """
+    Extrae un campo de todos los registros como un array de NumPy.
+
+    Los modelos se leen por atributo (``field``) y los diccionarios por la
+    clave JSON (``alias``, o ``field`` en camelCase si no se indica). Los
+    valores ausentes se convierten en ``NaN`` para columnas numéricas y en
+    ``None`` para columnas ``object``.
+
+    Args:
+        records: Registros normalizados con ``as_records``
+        field: Nombre del atributo en el modelo pydantic
+        alias: Nombre del campo en el JSON de la API
+        dtype: Tipo del array resultante
+
+    Returns:
+        Array unidimensional con un valor por registro
+    """
+    n = len(records)
+    if n == 0:
+        return np.empty(0, dtype=dtype)
+
+    if isinstance(records[0], dict):
+        key = alias or camel_case(field)
+        if key not in records[0] and field in records[0]:
+            key = field
+        values = [record.get(key) for record in records]
+    else:
+        values = [getattr(record, field, None) for record in records]
+
+    if np.dtype(dtype).kind == "O":
+        return np.array(values, dtype=object)
+    return np.fromiter(
+        (np.nan if value is None else value for value in values),
+        dtype=dtype,
+        count=n,
+    )
@@ -0,0 +1,287 @@
+"""
+Agregación local de series de varios exchanges.
+
+``FundingRateApi.funding_rate_get`` acepta ``aggregation_type`` (Sum/Average)
+sobre varios exchanges separados por comas, pero cada vista agregada nueva es
+otra petición. Este módulo descarga una vez la serie de cada exchange y
+calcula los agregados en el cliente con NumPy: suma, promedio y promedio
+ponderado por open interest.
+
+Example:
+    funding = ExchangeSeriesCache(
+        funding_rate_api.funding_rate_get, "funding_rate", coin="BTC", timeframe="1h"
+    )
+    open_interest = ExchangeSeriesCache(
+        open_interest_api.open_interest_get, "close", coin="BTC", timeframe="1h"
+    )
+
+    average = funding.aggregate(["binance", "bybit", "okx"], how="average")
+    weighted = funding.aggregate(
+        ["binance", "bybit"], how="oi_weighted", weights=open_interest
+    )  # Sin llamadas nuevas: ambos exchanges ya están en caché
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..sync import endpoint_client, endpoint_name
+from .alignment import _prepare, align_on_open_date
+
+AGGREGATION_TYPES = ("sum", "average", "oi_weighted")
+
+
+class ExchangeAggregate:
+    """
+    Serie agregada sobre varios exchanges.
+
+    Attributes:
+        timestamps: Grilla de ``openDate`` ordenada de forma ascendente
+        values: Valor agregado en cada timestamp (``NaN`` si ningún exchange
+            tiene dato)
+        counts: Número de exchanges que aportaron a cada valor
+        exchanges: Exchanges incluidos en la agregación
+        how: Tipo de agregación
+    """
+
+    def __init__(
+        self,
+        timestamps: np.ndarray,
+        values: np.ndarray,
+        counts: np.ndarray,
+        exchanges: Sequence[str],
+        how: str,
+    ):
+        self.timestamps = timestamps
+        self.values = values
+        self.counts = counts
+        self.exchanges = list(exchanges)
+        self.how = how
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def to_records(self, field: str = "value") -> List[Dict[str, Any]]:
+        """
+        Convierte la serie al formato JSON de la API.
+
+        Args:
+            field: Clave JSON del valor agregado (ej: "fundingRate")
+
+        Returns:
+            Lista de diccionarios con ``openDate`` y ``field``
+        """
+        return [
+            {"openDate": t, field: None if v != v else v}
+            for t, v in zip(self.timestamps.tolist(), self.values.tolist())
+        ]
+
+
+def _align_weights(
+    grid: np.ndarray, weights: Mapping[str, Any], field: str, time_field: str
+) -> np.ndarray:
+    """Alinea los pesos sobre la grilla arrastrando el último valor conocido."""
+    columns = []
+    for data in weights.values():
+        times, values = _prepare(data, [field], time_field)
+        column = np.full(len(grid), np.nan)
+        if len(times):
+            pos = np.searchsorted(times, grid, side="right") - 1
+            matched = pos >= 0
+            column[matched] = values[pos[matched], 0]
+        columns.append(column)
+    return np.column_stack(columns) if columns else np.empty((len(grid), 0))
+
+
+def aggregate_exchanges(
+    series: Mapping[str, Any],
+    field: str,
+    how: str = "average",
+    weights: Optional[Mapping[str, Any]] = None,
+    weight_field: str = "close",
+    time_field: str = "open_date",
+) -> ExchangeAggregate:
+    """
+    Agrega series de varios exchanges alineadas por ``openDate``.
+
+    Los exchanges sin dato en un timestamp no participan en ese valor, igual
+    que en la agregación del servidor.
+
+    Args:
+        series: Mapeo exchange -> respuesta del endpoint
+        field: Campo a agregar (ej: "funding_rate")
+        how: "sum", "average" u "oi_weighted"
+        weights: Con ``how="oi_weighted"``, mapeo exchange -> respuesta de
+            ``open_interest_get`` (u otra serie de pesos)
+        weight_field: Campo de ``weights`` usado como peso
+        time_field: Atributo con el timestamp de cada fila
+
+    Returns:
+        Serie agregada
+
+    Raises:
+        ValueError: Si ``how`` no es válido, o si con ``how="oi_weighted"``
+            no se indican ``weights`` o faltan los de algún exchange
+    """
+    if how not in AGGREGATION_TYPES:
+        raise ValueError(f"how debe ser uno de {AGGREGATION_TYPES}: {how!r}")
+
+    exchanges = list(series)
+    weight_series: Dict[str, Any] = {}
+    if how == "oi_weighted":
+        if weights is None:
+            raise ValueError("how='oi_weighted' requiere weights")
+        missing = [exchange for exchange in exchanges if exchange not in weights]
+        if missing:
+            raise ValueError(f"Faltan los pesos de: {', '.join(missing)}")
+        weight_series = {exchange: weights[exchange] for exchange in exchanges}
+
+    aligned = align_on_open_date(series, field, how="outer", time_field=time_field)
+    values = aligned.values
+    present = ~np.isnan(values)
+    counts = present.sum(axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if how == "sum":
+            result = np.where(counts > 0, np.nansum(values, axis=1), np.nan)
+        elif how == "average":
+            result = np.nansum(values, axis=1) / counts
+        else:
+            w = _align_weights(
+                aligned.timestamps, weight_series, weight_field, time_field
+            )
+            used = present & ~np.isnan(w)
+            w = np.where(used, w, 0.0)
+            counts = used.sum(axis=1)
+            weighted = (np.where(used, values, 0.0) * w).sum(axis=1)
+            result = weighted / w.sum(axis=1)
+
+    return ExchangeAggregate(aligned.timestamps, result, counts, exchanges, how)
+
+
+class ExchangeSeriesCache:
+    """
+    Caché por exchange de una serie, para componer vistas agregadas.
+
+    Cada exchange se descarga por separado y se guarda con su propia clave,
+    de modo que agregar o quitar un exchange de una vista sólo descarga los
+    exchanges que faltan.
+
+    Attributes:
+        endpoint: Método de API que se consulta
+        field: Campo de la serie que se agrega
+        params: Parámetros comunes de todas las llamadas (coin, timeframe...)
+        ttl: Segundos de validez de cada serie en caché
+    """
+
+    def __init__(
+        self,
+        endpoint: Callable[..., Any],
+        field: str,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        **params: Any,
+    ):
+        """
+        Inicializa la caché.
+
+        Args:
+            endpoint: Método de API (ej: ``FundingRateApi.funding_rate_get``)
+            field: Campo a agregar (ej: "funding_rate")
+            ttl: Segundos de validez de cada serie
+            clock: Función que retorna el tiempo actual en segundos
+            **params: Parámetros del endpoint salvo ``exchange``
+        """
+        self.endpoint = endpoint
+        self.field = field
+        self.ttl = ttl
+        self.params = params
+        self._clock = clock
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, exchange: str) -> Tuple:
+        return (
+            endpoint_name(self.endpoint),
+            endpoint_client(self.endpoint),
+            exchange.lower(),
+            tuple(sorted(self.params.items())),
+        )
+
+    def get(self, exchange: str) -> Any:
+        """
+        Obtiene la serie de un exchange, descargándola si no está vigente.
+
+        Args:
+            exchange: Exchange (ej: "binance")
+
+        Returns:
+            Respuesta del endpoint para ese exchange
+        """
+        key = self._key(exchange)
+        now = self._clock()
+        with self._lock:
+            entry = self._cache.get(key)
+        if entry is None or now - entry[0] >= self.ttl:
+            entry = (now, self.endpoint(exchange=exchange, **self.params))
+            with self._lock:
+                self._cache[key] = entry
+        return entry[1]
+
+    def series(self, exchanges: Sequence[str]) -> Dict[str, Any]:
+        """
+        Obtiene las series de varios exchanges.
+
+        Args:
+            exchanges: Exchanges de la vista
+
+        Returns:
+            Mapeo exchange -> respuesta del endpoint
+        """
+        return {exchange: self.get(exchange) for exchange in exchanges}
+
+    def aggregate(
+        self,
+        exchanges: Sequence[str],
+        how: str = "average",
+        weights: Optional["ExchangeSeriesCache"] = None,
+    ) -> ExchangeAggregate:
+        """
+        Calcula una vista agregada sobre los exchanges indicados.
+
+        Args:
+            exchanges: Exchanges de la vista
+            how: "sum", "average" u "oi_weighted"
+            weights: Caché de la serie de pesos (ej: open interest), requerida
+                con ``how="oi_weighted"``
+
+        Returns:
+            Serie agregada
+
+        Raises:
+            ValueError: Si ``how="oi_weighted"`` y no se indican pesos
+        """
+        if how == "oi_weighted" and weights is None:
+            raise ValueError("how='oi_weighted' requiere weights")
+        return aggregate_exchanges(
+            self.series(exchanges),
+            self.field,
+            how=how,
+            weights=weights.series(exchanges) if weights is not None else None,
+            weight_field=weights.field if weights is not None else "close",
+        )
+
+    def invalidate(self, exchange: Optional[str] = None) -> None:
+        """
+        Descarta la caché de un exchange, o toda si no se indica.
+
+        Args:
+            exchange: Exchange a descartar
+        """
+        with self._lock:
+            if exchange is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(self._key(exchange), None)
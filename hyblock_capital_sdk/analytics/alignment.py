@@ -0,0 +1,182 @@
+"""
+Alineación temporal vectorizada de respuestas de varios endpoints.
+
+Permite comparar series de distintos exchanges o endpoints (por ejemplo
+``binance_global_accounts_get``, ``bybit_global_accounts_get`` y
+``okx_global_accounts_get``) uniendo sus filas por ``openDate`` mediante
+búsquedas binarias sobre arrays ordenados, en lugar de diccionarios por fila.
+
+Example:
+    aligned = align_on_open_date(
+        {
+            "binance": longs_api.binance_global_accounts_get(coin="BTC", timeframe="1h"),
+            "bybit": longs_api.bybit_global_accounts_get(coin="BTC", timeframe="1h"),
+            "okx": longs_api.okx_global_accounts_get(coin="BTC", timeframe="1h"),
+        },
+        fields="ls_ratio",
+        fill="ffill",
+    )
+    aligned.values  # matriz (n_timestamps, 3)
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..series import as_records
+from ._records import column
+
+JOIN_MODES = ("outer", "inner", "left")
+FILL_MODES = (None, "ffill")
+
+
+class AlignedSeries:
+    """
+    Matriz de series alineadas sobre una misma grilla de timestamps.
+
+    Attributes:
+        timestamps: Grilla de ``openDate`` ordenada de forma ascendente
+        values: Matriz ``(len(timestamps), len(columns))``; las celdas sin
+            dato son ``NaN``
+        columns: Nombre de cada columna de ``values``
+    """
+
+    def __init__(self, timestamps: np.ndarray, values: np.ndarray, columns: List[str]):
+        self.timestamps = timestamps
+        self.values = values
+        self.columns = list(columns)
+        self._index = {name: i for i, name in enumerate(self.columns)}
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.values[:, self._index[name]]
+
+    def complete_rows(self) -> "AlignedSeries":
+        """
+        Filtra las filas que tienen valor en todas las columnas.
+
+        Returns:
+            Nuevas series alineadas sin celdas ``NaN``
+        """
+        mask = ~np.isnan(self.values).any(axis=1)
+        return AlignedSeries(self.timestamps[mask], self.values[mask], self.columns)
+
+    def to_dict(self) -> Dict[str, list]:
+        """
+        Convierte la matriz a un diccionario de listas serializable a JSON.
+
+        Returns:
+            Diccionario con la columna ``openDate`` y una lista por serie
+        """
+        result: Dict[str, list] = {"openDate": self.timestamps.tolist()}
+        for i, name in enumerate(self.columns):
+            result[name] = self.values[:, i].tolist()
+        return result
+
+
+def _prepare(
+    data: Any, fields: Sequence[str], time_field: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Extrae timestamps ordenados y sin duplicados junto a sus valores."""
+    records = as_records(data)
+    times = column(records, time_field)
+    values = np.column_stack([column(records, f) for f in fields]).reshape(
+        len(records), len(fields)
+    )
+
+    valid = ~np.isnan(times)
+    times = times[valid].astype(np.int64)
+    values = values[valid]
+
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+    values = values[order]
+
+    # Ante timestamps repetidos se conserva la última fila recibida.
+    if len(times) > 1:
+        keep = np.append(times[1:] != times[:-1], True)
+        times = times[keep]
+        values = values[keep]
+    return times, values
+
+
+def _grid(all_times: List[np.ndarray], how: str) -> np.ndarray:
+    if not all_times:
+        return np.empty(0, dtype=np.int64)
+    if how == "outer":
+        return np.unique(np.concatenate(all_times))
+    if how == "inner":
+        grid = all_times[0]
+        for times in all_times[1:]:
+            grid = np.intersect1d(grid, times, assume_unique=True)
+        return grid
+    return all_times[0]
+
+
+def align_on_open_date(
+    series: Mapping[str, Any],
+    fields: Union[str, Sequence[str]],
+    how: str = "outer",
+    fill: Optional[str] = None,
+    tolerance: Optional[int] = None,
+    time_field: str = "open_date",
+) -> AlignedSeries:
+    """
+    Une N respuestas de endpoints por timestamp en una sola matriz.
+
+    Args:
+        series: Mapeo etiqueta -> respuesta del endpoint (lista de modelos,
+            lista de diccionarios o JSON crudo)
+        fields: Campo o campos a extraer de cada serie (nombres de atributo
+            del modelo, ej: "ls_ratio")
+        how: "outer" (unión de timestamps), "inner" (intersección) o "left"
+            (timestamps de la primera serie)
+        fill: None para dejar ``NaN`` donde una serie no tiene la fila, o
+            "ffill" para arrastrar el último valor conocido
+        tolerance: Con ``fill="ffill"``, antigüedad máxima (en las unidades
+            de ``openDate``) del valor arrastrado
+        time_field: Atributo con el timestamp de cada fila
+
+    Returns:
+        Series alineadas; las columnas se llaman ``etiqueta`` si hay un solo
+        campo o ``etiqueta.campo`` si hay varios
+
+    Raises:
+        ValueError: Si ``how`` o ``fill`` no son válidos
+    """
+    if how not in JOIN_MODES:
+        raise ValueError(f"how debe ser uno de {JOIN_MODES}: {how!r}")
+    if fill not in FILL_MODES:
+        raise ValueError(f"fill debe ser uno de {FILL_MODES}: {fill!r}")
+
+    field_list = [fields] if isinstance(fields, str) else list(fields)
+    prepared = {
+        label: _prepare(data, field_list, time_field) for label, data in series.items()
+    }
+    grid = _grid([times for times, _ in prepared.values()], how)
+
+    columns: List[str] = []
+    blocks: List[np.ndarray] = []
+    for label, (times, values) in prepared.items():
+        block = np.full((len(grid), len(field_list)), np.nan)
+        if len(times):
+            if fill == "ffill":
+                pos = np.searchsorted(times, grid, side="right") - 1
+                matched = pos >= 0
+                if tolerance is not None:
+                    matched &= grid - times[np.maximum(pos, 0)] <= tolerance
+            else:
+                pos = np.minimum(np.searchsorted(times, grid), len(times) - 1)
+                matched = times[pos] == grid
+            block[matched] = values[pos[matched]]
+        blocks.append(block)
+
+        if len(field_list) == 1:
+            columns.append(label)
+        else:
+            columns.extend(f"{label}.{field}" for field in field_list)
+
+    values = np.hstack(blocks) if blocks else np.empty((len(grid), 0), dtype=np.float64)
+    return AlignedSeries(grid, values, columns)
@@ -0,0 +1,311 @@
+"""
+Caché descompuesta por bucket de tamaño de orden.
+
+``LiquidityApi.liquidation_get`` y varios endpoints de ``OrderflowApi``
+(``buy_volume_get``, ``volume_delta_get``, ``market_order_count_get``, ...)
+aceptan ``bucket`` como lista de buckets (ej: ``"4,5,6"``) que el servidor
+suma, de modo que cada combinación distinta cuesta un hit. Este módulo
+descarga cada uno de los 7 buckets una sola vez por ventana, los guarda como
+columnas de NumPy y responde cualquier combinación sumando localmente.
+
+Sólo tiene sentido para métricas aditivas (liquidaciones, volúmenes y
+conteos), que son las que el servidor suma; no para promedios como
+``limit_order_average_size_get``.
+
+Example:
+    liquidations = BucketCache(
+        liquidity_api.liquidation_get, coin="BTC", timeframe="1h", exchange="binance"
+    )
+    whales = liquidations.get("6,7")       # 7 llamadas, una por bucket
+    retail = liquidations.get("1,2,3")     # Sin llamadas nuevas
+"""
+
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+import numpy as np
+
+from ..series import as_records
+from ..sync import endpoint_client, endpoint_name
+from .alignment import _prepare
+from .resample import _numeric_fields
+
+# Rango de tamaño (USD) de cada bucket de la API.
+SIZE_BUCKETS: Dict[int, Tuple[float, float]] = {
+    1: (0.0, 1e2),
+    2: (1e2, 1e3),
+    3: (1e3, 1e4),
+    4: (1e4, 1e5),
+    5: (1e5, 1e6),
+    6: (1e6, 1e7),
+    7: (1e7, float("inf")),
+}
+
+
+class _FromDict(Protocol):
+    """Modelo generado que se reconstruye con ``from_dict``."""
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Any:
+        ...
+
+
+def parse_buckets(bucket: Union[None, str, int, Sequence[int]]) -> Tuple[int, ...]:
+    """
+    Normaliza una selección de buckets.
+
+    Args:
+        bucket: Buckets separados por comas (ej: "4,5,6"), un bucket, una
+            secuencia, o None para todos
+
+    Returns:
+        Buckets ordenados y sin repetir
+
+    Raises:
+        ValueError: Si algún bucket no existe
+    """
+    if bucket is None:
+        return tuple(SIZE_BUCKETS)
+    parts: List[Union[int, str]]
+    if isinstance(bucket, str):
+        parts = [part.strip() for part in bucket.split(",") if part.strip()]
+    elif isinstance(bucket, int):
+        parts = [bucket]
+    else:
+        parts = list(bucket)
+    try:
+        selected = sorted({int(part) for part in parts})
+    except ValueError:
+        raise ValueError(f"Bucket inválido: {bucket!r}") from None
+    invalid = [b for b in selected if b not in SIZE_BUCKETS]
+    if invalid or not selected:
+        raise ValueError(
+            f"Bucket inválido: {bucket!r}. Valores válidos: "
+            f"{', '.join(str(b) for b in SIZE_BUCKETS)}"
+        )
+    return tuple(selected)
+
+
+class BucketColumns:
+    """
+    Series de cada bucket alineadas sobre una misma grilla de timestamps.
+
+    Attributes:
+        timestamps: Grilla de ``openDate`` ordenada de forma ascendente
+        fields: Campos numéricos de la serie
+        values: Array ``(len(timestamps), 7, len(fields))``; las celdas sin
+            dato son ``NaN``
+        keys: Clave JSON de cada campo (ej: "longLiquidation")
+        model: Modelo de los registros originales, o None si eran
+            diccionarios
+    """
+
+    def __init__(
+        self,
+        timestamps: np.ndarray,
+        fields: Sequence[str],
+        values: np.ndarray,
+        keys: Optional[Sequence[str]] = None,
+        model: Optional[Type[_FromDict]] = None,
+    ):
+        self.timestamps = timestamps
+        self.fields = list(fields)
+        self.values = values
+        self.keys = list(keys) if keys is not None else list(fields)
+        self.model = model
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def combine(self, bucket: Any = None) -> Dict[str, np.ndarray]:
+        """
+        Suma los buckets seleccionados.
+
+        Args:
+            bucket: Selección de buckets (ver ``parse_buckets``)
+
+        Returns:
+            Diccionario campo -> array sumado, más ``open_date``; un valor es
+            ``NaN`` sólo si ningún bucket seleccionado tiene dato
+        """
+        columns = np.array(parse_buckets(bucket)) - 1
+        selected = self.values[:, columns, :]
+        present = (~np.isnan(selected)).any(axis=1)
+        sums = np.where(present, np.nansum(selected, axis=1), np.nan)
+        result = {"open_date": self.timestamps}
+        for i, field in enumerate(self.fields):
+            result[field] = sums[:, i]
+        return result
+
+    def to_records(self, bucket: Any = None) -> List[Any]:
+        """
+        Construye la respuesta que daría la API para una selección de buckets.
+
+        Args:
+            bucket: Selección de buckets (ver ``parse_buckets``)
+
+        Returns:
+            Lista de modelos (o diccionarios con las claves JSON si la serie
+            original eran diccionarios), ordenada por ``openDate``
+        """
+        combined = self.combine(bucket)
+        columns = [combined[field].tolist() for field in self.fields]
+        rows = []
+        for i, open_date in enumerate(self.timestamps.tolist()):
+            row = {"openDate": open_date}
+            for key, values in zip(self.keys, columns):
+                value = values[i]
+                row[key] = None if value != value else value
+            rows.append(row)
+        if self.model is None:
+            return rows
+        return [self.model.from_dict(row) for row in rows]
+
+
+def build_bucket_columns(
+    responses: Mapping[int, Any],
+    fields: Optional[Sequence[str]] = None,
+    time_field: str = "open_date",
+) -> BucketColumns:
+    """
+    Apila las respuestas de cada bucket como columnas alineadas.
+
+    Args:
+        responses: Mapeo bucket (1-7) -> respuesta del endpoint con ese bucket
+        fields: Campos a guardar; por defecto los campos numéricos del modelo
+        time_field: Atributo con el timestamp de cada fila
+
+    Returns:
+        Columnas por bucket
+
+    Raises:
+        ValueError: Si algún bucket no existe
+    """
+    parse_buckets(list(responses))
+    records = {b: as_records(data) for b, data in responses.items()}
+    sample = next((r[0] for r in records.values() if r), None)
+
+    keys: Optional[List[str]] = None
+    model = None
+    if sample is None:
+        fields = list(fields or [])
+    else:
+        fields = list(fields) if fields else _numeric_fields([sample], time_field)
+        if isinstance(sample, dict):
+            keys = fields
+        else:
+            model = type(sample)
+            keys = [model.model_fields[f].alias or f for f in fields]
+
+    prepared = {b: _prepare(r, fields, time_field) for b, r in records.items()}
+    grid = np.unique(
+        np.concatenate(
+            [times for times, _ in prepared.values()] or [np.empty(0, np.int64)]
+        )
+    ).astype(np.int64)
+
+    values = np.full((len(grid), len(SIZE_BUCKETS), len(fields)), np.nan)
+    for bucket, (times, block) in prepared.items():
+        if len(times):
+            values[np.searchsorted(grid, times), bucket - 1, :] = block
+    return BucketColumns(grid, fields, values, keys=keys, model=model)
+
+
+class BucketCache:
+    """
+    Descarga cada bucket una vez por ventana y combina localmente.
+
+    La ventana es el conjunto de parámetros de la llamada (coin, exchange,
+    timeframe, start_time, end_time, limit...). Mientras la ventana esté en
+    caché, cualquier combinación de buckets se responde sin llamadas.
+
+    Attributes:
+        endpoint: Método de API que acepta ``bucket``
+        params: Parámetros por defecto de todas las llamadas
+        ttl: Segundos de validez de cada ventana
+    """
+
+    def __init__(
+        self,
+        endpoint: Callable[..., Any],
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        **params: Any,
+    ):
+        """
+        Inicializa la caché.
+
+        Args:
+            endpoint: Método de API (ej: ``LiquidityApi.liquidation_get``)
+            ttl: Segundos de validez de cada ventana
+            clock: Función que retorna el tiempo actual en segundos
+            **params: Parámetros por defecto del endpoint salvo ``bucket``
+        """
+        self.endpoint = endpoint
+        self.ttl = ttl
+        self.params = params
+        self._clock = clock
+        self._cache: Dict[Tuple, Tuple[float, BucketColumns]] = {}
+        self._lock = threading.Lock()
+
+    def columns(self, **params: Any) -> BucketColumns:
+        """
+        Obtiene las columnas por bucket de una ventana.
+
+        Args:
+            **params: Parámetros que se agregan a los de la caché
+
+        Returns:
+            Columnas por bucket de la ventana
+        """
+        params = {**self.params, **params}
+        params.pop("bucket", None)
+        key = (
+            endpoint_name(self.endpoint),
+            endpoint_client(self.endpoint),
+            tuple(sorted(params.items())),
+        )
+        now = self._clock()
+        with self._lock:
+            entry = self._cache.get(key)
+        if entry is None or now - entry[0] >= self.ttl:
+            responses = {
+                bucket: self.endpoint(bucket=str(bucket), **params)
+                for bucket in SIZE_BUCKETS
+            }
+            entry = (now, build_bucket_columns(responses))
+            with self._lock:
+                self._cache[key] = entry
+        return entry[1]
+
+    def get(self, bucket: Any = None, **params: Any) -> List[Any]:
+        """
+        Obtiene la serie de una combinación de buckets.
+
+        Args:
+            bucket: Selección de buckets (ej: "4,5,6"); por defecto todos
+            **params: Parámetros que se agregan a los de la caché
+
+        Returns:
+            Registros equivalentes a llamar al endpoint con ese ``bucket``
+        """
+        buckets = parse_buckets(bucket)
+        return self.columns(**params).to_records(buckets)
+
+    def clear(self) -> None:
+        """Vacía la caché."""
+        with self._lock:
+            self._cache.clear()
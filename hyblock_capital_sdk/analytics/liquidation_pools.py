@@ -0,0 +1,344 @@
+"""
+Agregación vectorizada de pools de liquidación.
+
+Convierte la salida de ``LiquidityApi.liquidation_levels_get`` en arrays de
+NumPy agrupados por bucket de precio, con el desglose long/short, el desglose
+por nivel de apalancamiento y búsquedas del pool más cercano al precio actual
+mediante un índice ordenado.
+
+Example:
+    levels = liquidity_api.liquidation_levels_get(coin="BTC", timeframe="1h")
+    pools = aggregate_liquidation_levels(levels, bucket_size=50)
+
+    for pool in pools.nearest(current_price=21400.0, k=3):
+        print(pool.price, pool.long_size, pool.short_size)
+"""
+
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..series import as_records
+from ._records import column
+
+# Límite superior (inclusive) de apalancamiento de cada nivel de riesgo.
+LEVERAGE_TIERS: Tuple[Tuple[str, float], ...] = (
+    ("low", 5.0),
+    ("medium", 15.0),
+    ("high", 30.0),
+    ("extreme", float("inf")),
+)
+
+
+class LiquidationPool(NamedTuple):
+    """Pool de liquidación de un bucket de precio."""
+
+    price: float
+    long_size: float
+    short_size: float
+    distance: float
+
+    @property
+    def total_size(self) -> float:
+        """Tamaño total (long + short) del pool."""
+        return self.long_size + self.short_size
+
+
+class LiquidationPools:
+    """
+    Pools de liquidación agregados por bucket de precio.
+
+    Todos los arrays están alineados con ``prices``, que está ordenado de
+    forma ascendente y sirve como índice para las búsquedas por precio.
+
+    Attributes:
+        prices: Precio (límite inferior del bucket) de cada pool
+        long_size: Tamaño long acumulado por bucket
+        short_size: Tamaño short acumulado por bucket
+        count: Número de niveles agregados en cada bucket
+        tier_size: Matriz ``(n_buckets, n_tiers)`` con el tamaño por nivel
+            de apalancamiento
+        tiers: Nombres de los niveles de apalancamiento (columnas de
+            ``tier_size``)
+        bucket_size: Ancho del bucket de precio usado en la agregación
+    """
+
+    def __init__(
+        self,
+        prices: np.ndarray,
+        long_size: np.ndarray,
+        short_size: np.ndarray,
+        count: np.ndarray,
+        tier_size: np.ndarray,
+        tiers: Sequence[str],
+        bucket_size: Optional[float] = None,
+    ):
+        self.prices = prices
+        self.long_size = long_size
+        self.short_size = short_size
+        self.count = count
+        self.tier_size = tier_size
+        self.tiers = tuple(tiers)
+        self.bucket_size = bucket_size
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @property
+    def total_size(self) -> np.ndarray:
+        """Tamaño total (long + short) por bucket."""
+        total: np.ndarray = self.long_size + self.short_size
+        return total
+
+    def tier(self, name: str) -> np.ndarray:
+        """
+        Obtiene el tamaño por bucket de un nivel de apalancamiento.
+
+        Args:
+            name: Nombre del nivel (ej: "low", "extreme")
+
+        Returns:
+            Array alineado con ``prices``
+        """
+        return self.tier_size[:, self.tiers.index(name)]
+
+    def tier_totals(self) -> dict:
+        """
+        Calcula el tamaño total por nivel de apalancamiento.
+
+        Returns:
+            Diccionario nivel -> tamaño total
+        """
+        totals = self.tier_size.sum(axis=0)
+        return {name: float(total) for name, total in zip(self.tiers, totals)}
+
+    def _mask(self, side: Optional[str], min_size: float) -> Optional[np.ndarray]:
+        if side == "long":
+            sizes = self.long_size
+        elif side == "short":
+            sizes = self.short_size
+        elif side is None:
+            sizes = self.total_size
+        else:
+            raise ValueError(f"side debe ser 'long', 'short' o None: {side!r}")
+
+        mask = sizes > min_size
+        return None if mask.all() else mask
+
+    def _pool(self, index: int, current_price: float) -> LiquidationPool:
+        price = float(self.prices[index])
+        return LiquidationPool(
+            price=price,
+            long_size=float(self.long_size[index]),
+            short_size=float(self.short_size[index]),
+            distance=abs(price - current_price),
+        )
+
+    def nearest(
+        self,
+        current_price: float,
+        k: int = 1,
+        side: Optional[str] = None,
+        min_size: float = 0.0,
+    ) -> List[LiquidationPool]:
+        """
+        Busca los ``k`` pools más cercanos al precio actual.
+
+        Usa ``searchsorted`` sobre el índice ordenado de precios, por lo que
+        sólo se examinan ``2k`` candidatos alrededor del precio actual.
+
+        Args:
+            current_price: Precio de referencia
+            k: Número de pools a retornar
+            side: "long", "short" o None para considerar ambos lados
+            min_size: Tamaño mínimo (exclusivo) para considerar un pool
+
+        Returns:
+            Pools ordenados por distancia al precio actual
+        """
+        indices = np.arange(len(self.prices))
+        prices = self.prices
+        mask = self._mask(side, min_size)
+        if mask is not None:
+            indices = indices[mask]
+            prices = prices[mask]
+
+        if k <= 0 or len(prices) == 0:
+            return []
+
+        pos = int(np.searchsorted(prices, current_price))
+        lo = max(pos - k, 0)
+        hi = min(pos + k, len(prices))
+        window = np.abs(prices[lo:hi] - current_price)
+        order = np.argsort(window, kind="stable")[:k]
+        return [self._pool(int(indices[lo + i]), current_price) for i in order]
+
+    def above(
+        self,
+        current_price: float,
+        k: int = 1,
+        side: Optional[str] = None,
+        min_size: float = 0.0,
+    ) -> List[LiquidationPool]:
+        """
+        Busca los ``k`` pools inmediatamente por encima del precio actual.
+
+        Args:
+            current_price: Precio de referencia
+            k: Número de pools a retornar
+            side: "long", "short" o None para considerar ambos lados
+            min_size: Tamaño mínimo (exclusivo) para considerar un pool
+
+        Returns:
+            Pools ordenados de menor a mayor precio
+        """
+        indices = np.arange(len(self.prices))
+        mask = self._mask(side, min_size)
+        if mask is not None:
+            indices = indices[mask]
+        pos = int(np.searchsorted(self.prices[indices], current_price, side="right"))
+        return [self._pool(int(i), current_price) for i in indices[pos : pos + k]]
+
+    def below(
+        self,
+        current_price: float,
+        k: int = 1,
+        side: Optional[str] = None,
+        min_size: float = 0.0,
+    ) -> List[LiquidationPool]:
+        """
+        Busca los ``k`` pools inmediatamente por debajo del precio actual.
+
+        Args:
+            current_price: Precio de referencia
+            k: Número de pools a retornar
+            side: "long", "short" o None para considerar ambos lados
+            min_size: Tamaño mínimo (exclusivo) para considerar un pool
+
+        Returns:
+            Pools ordenados de mayor a menor precio
+        """
+        indices = np.arange(len(self.prices))
+        mask = self._mask(side, min_size)
+        if mask is not None:
+            indices = indices[mask]
+        pos = int(np.searchsorted(self.prices[indices], current_price, side="left"))
+        selected = indices[max(pos - k, 0) : pos][::-1]
+        return [self._pool(int(i), current_price) for i in selected]
+
+    def to_dict(self) -> dict:
+        """
+        Convierte los pools a un diccionario de listas serializable a JSON.
+
+        Returns:
+            Diccionario con una lista por columna
+        """
+        result = {
+            "price": self.prices.tolist(),
+            "longSize": self.long_size.tolist(),
+            "shortSize": self.short_size.tolist(),
+            "count": self.count.tolist(),
+        }
+        for i, name in enumerate(self.tiers):
+            result[name] = self.tier_size[:, i].tolist()
+        return result
+
+
+def _leverage_value(text: str) -> float:
+    try:
+        return float(text.strip().lower().rstrip("x"))
+    except ValueError:
+        return np.nan
+
+
+def parse_leverage(leverage: np.ndarray) -> np.ndarray:
+    """
+    Convierte strings de apalancamiento ("10x", "25X") a números.
+
+    Sólo se interpretan los valores distintos, que en la práctica son unos
+    pocos niveles, y el resultado se expande con el índice inverso.
+
+    Args:
+        leverage: Array ``object`` con los strings de apalancamiento
+
+    Returns:
+        Array ``float64``; los valores ausentes o inválidos son ``NaN``
+    """
+    if len(leverage) == 0:
+        return np.empty(0, dtype=np.float64)
+    text = np.array([v if isinstance(v, str) else "" for v in leverage], dtype=str)
+    unique, inverse = np.unique(text, return_inverse=True)
+    values = np.array([_leverage_value(u) for u in unique], dtype=np.float64)
+    return values[inverse.reshape(-1)]
+
+
+def aggregate_liquidation_levels(
+    levels: Any,
+    bucket_size: Optional[float] = None,
+    tiers: Sequence[Tuple[str, float]] = LEVERAGE_TIERS,
+) -> LiquidationPools:
+    """
+    Agrega niveles de liquidación por bucket de precio.
+
+    Args:
+        levels: Salida de ``liquidation_levels_get`` (lista de
+            ``LiquidationLevels``, lista de diccionarios o JSON crudo)
+        bucket_size: Ancho del bucket de precio. Si es None se agrupa por
+            precio exacto.
+        tiers: Pares (nombre, apalancamiento máximo inclusive) ordenados de
+            forma ascendente
+
+    Returns:
+        Pools de liquidación indexados por precio
+    """
+    records = as_records(levels)
+    tier_names = [name for name, _ in tiers]
+    tier_bounds = np.array([bound for _, bound in tiers], dtype=np.float64)
+
+    price = column(records, "price")
+    size = np.nan_to_num(column(records, "size"))
+    # otros endpoints informan el lado como "Long" o "SHORT"
+    side = np.char.lower(column(records, "side", dtype=object).astype(str))
+    leverage = parse_leverage(column(records, "leverage", dtype=object))
+
+    valid = ~np.isnan(price)
+    if not valid.all():
+        price, size, side, leverage = (
+            price[valid],
+            size[valid],
+            side[valid],
+            leverage[valid],
+        )
+
+    if bucket_size:
+        keys = np.floor(price / bucket_size) * bucket_size
+    else:
+        keys = price
+
+    prices, inverse = np.unique(keys, return_inverse=True)
+    n_buckets = len(prices)
+    n_tiers = len(tier_names)
+
+    is_long = side == "long"
+    is_short = side == "short"
+    long_size = np.bincount(inverse, weights=size * is_long, minlength=n_buckets)
+    short_size = np.bincount(inverse, weights=size * is_short, minlength=n_buckets)
+    count = np.bincount(inverse, minlength=n_buckets)
+
+    known = ~np.isnan(leverage)
+    tier_index = np.searchsorted(tier_bounds, leverage[known], side="left")
+    in_range = tier_index < n_tiers
+    flat = inverse[known][in_range] * n_tiers + tier_index[in_range]
+    tier_size = np.bincount(
+        flat, weights=size[known][in_range], minlength=n_buckets * n_tiers
+    ).reshape(n_buckets, n_tiers)
+
+    return LiquidationPools(
+        prices=prices,
+        long_size=long_size,
+        short_size=short_size,
+        count=count,
+        tier_size=tier_size,
+        tiers=tier_names,
+        bucket_size=bucket_size,
+    )
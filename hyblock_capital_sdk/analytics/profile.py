@@ -0,0 +1,415 @@
+"""
+Motor local de perfiles de open interest y volumen.
+
+``ProfileToolApi.open_interest_profile_get`` y ``volume_profile_get`` reciben
+un ``precision`` y la interfaz típica vuelve a consultar la API en cada nivel
+de zoom. Este módulo descarga el perfil una sola vez con la precisión más
+fina, guarda los pares precio/tamaño como arrays ordenados de NumPy y
+calcula localmente el re-agrupado a cualquier ancho de bin, el punto de
+control (POC), el área de valor y la fusión de perfiles de varios exchanges.
+
+Example:
+    engine = ProfileEngine(profile_tool_api.volume_profile_get, precision="1")
+    profile = engine.get(exchange="binance", coin="BTC", profile_type="...")
+
+    zoomed = profile.rebin(100.0)
+    print(zoomed.point_of_control(), zoomed.value_area(0.7))
+
+    merged = engine.merged(["binance", "bybit"], coin="BTC", profile_type="...")
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..series import as_records
+from ..sync import endpoint_client, endpoint_name
+from ._records import column
+
+
+class Profile:
+    """
+    Perfil de tamaño por nivel de precio.
+
+    Attributes:
+        prices: Precio de cada nivel, ordenado de forma ascendente y sin
+            duplicados
+        sizes: Tamaño (open interest o volumen) de cada nivel
+        bin_size: Ancho de bin del perfil, o None si no se conoce
+        current_price: Precio actual reportado por la API
+        start_date: Inicio del período del perfil
+        end_date: Fin del período del perfil
+    """
+
+    def __init__(
+        self,
+        prices: np.ndarray,
+        sizes: np.ndarray,
+        bin_size: Optional[float] = None,
+        current_price: Optional[float] = None,
+        start_date: Optional[int] = None,
+        end_date: Optional[int] = None,
+    ):
+        self.prices = prices
+        self.sizes = sizes
+        self.bin_size = bin_size
+        self.current_price = current_price
+        self.start_date = start_date
+        self.end_date = end_date
+
+    @classmethod
+    def from_levels(
+        cls,
+        prices: Any,
+        sizes: Any,
+        bin_size: Optional[float] = None,
+        **metadata: Any,
+    ) -> "Profile":
+        """
+        Crea un perfil a partir de pares precio/tamaño sin ordenar.
+
+        Los precios repetidos se suman y los niveles con valores faltantes se
+        descartan.
+
+        Args:
+            prices: Precios de cada nivel
+            sizes: Tamaños de cada nivel
+            bin_size: Ancho de bin; se infiere de los precios si no se indica
+            **metadata: ``current_price``, ``start_date`` y ``end_date``
+
+        Returns:
+            Perfil ordenado por precio
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        sizes = np.asarray(sizes, dtype=np.float64)
+        valid = ~(np.isnan(prices) | np.isnan(sizes))
+        unique, inverse = np.unique(prices[valid], return_inverse=True)
+        totals = np.bincount(inverse, weights=sizes[valid], minlength=len(unique))
+        if bin_size is None and len(unique) > 1:
+            bin_size = float(np.min(np.diff(unique)))
+        return cls(unique, totals, bin_size=bin_size, **metadata)
+
+    @classmethod
+    def from_response(cls, data: Any) -> "Profile":
+        """
+        Crea un perfil desde la respuesta de ``open_interest_profile_get`` o
+        ``volume_profile_get``.
+
+        Args:
+            data: Modelo ``OpenInterestProfile``/``VolumeProfile``, su JSON
+                (diccionario con ``currentPrice``, ``startDate``, ``endDate``
+                y ``data``), o la lista ``data`` de pares precio/tamaño
+
+        Returns:
+            Perfil ordenado por precio
+        """
+        # Los metadatos están en el sobre: se leen antes de desenvolver "data".
+        profile = (
+            data[0] if isinstance(data, (list, tuple)) and len(data) == 1 else data
+        )
+        metadata: Dict[str, Any] = {}
+        if not isinstance(profile, (list, tuple)) and _get(profile, "data") is not None:
+            metadata = {
+                "current_price": _get(profile, "current_price", "currentPrice"),
+                "start_date": _get(profile, "start_date", "startDate"),
+                "end_date": _get(profile, "end_date", "endDate"),
+            }
+            records = as_records(_get(profile, "data"))
+        else:
+            records = as_records(data)
+        return cls.from_levels(
+            column(records, "price"), column(records, "size"), **metadata
+        )
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @property
+    def total_size(self) -> float:
+        """Tamaño total del perfil."""
+        return float(self.sizes.sum())
+
+    def _with(self, prices: np.ndarray, sizes: np.ndarray, bin_size) -> "Profile":
+        return Profile(
+            prices,
+            sizes,
+            bin_size=bin_size,
+            current_price=self.current_price,
+            start_date=self.start_date,
+            end_date=self.end_date,
+        )
+
+    def rebin(self, bin_size: float, origin: float = 0.0) -> "Profile":
+        """
+        Re-agrupa el perfil en bins de ancho ``bin_size``.
+
+        Cada nivel se asigna al bin ``origin + k * bin_size`` que lo contiene
+        y los tamaños de un mismo bin se suman.
+
+        Args:
+            bin_size: Ancho del bin de destino
+            origin: Precio de referencia de los bordes de bin
+
+        Returns:
+            Nuevo perfil con un nivel por bin no vacío
+
+        Raises:
+            ValueError: Si ``bin_size`` no es positivo
+        """
+        if bin_size <= 0:
+            raise ValueError(f"bin_size debe ser positivo: {bin_size!r}")
+        if len(self) == 0:
+            return self._with(self.prices, self.sizes, bin_size)
+
+        bins = np.floor((self.prices - origin) / bin_size)
+        # Los precios ya están ordenados: los bins forman grupos contiguos.
+        starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+        sizes = np.add.reduceat(self.sizes, starts)
+        prices = origin + bins[starts] * bin_size
+        return self._with(prices, sizes, bin_size)
+
+    def slice(self, low: float, high: float) -> "Profile":
+        """
+        Obtiene los niveles con precio en ``[low, high]``.
+
+        Args:
+            low: Precio mínimo
+            high: Precio máximo
+
+        Returns:
+            Perfil recortado
+        """
+        start = np.searchsorted(self.prices, low, side="left")
+        stop = np.searchsorted(self.prices, high, side="right")
+        return self._with(
+            self.prices[start:stop], self.sizes[start:stop], self.bin_size
+        )
+
+    def point_of_control(self) -> Optional[float]:
+        """
+        Obtiene el precio con mayor tamaño (POC).
+
+        Returns:
+            Precio del POC, o None si el perfil está vacío
+        """
+        if len(self) == 0:
+            return None
+        return float(self.prices[np.argmax(self.sizes)])
+
+    def value_area(self, fraction: float = 0.7) -> Optional[Tuple[float, float]]:
+        """
+        Calcula el área de valor: el rango de precios que concentra
+        ``fraction`` del tamaño total.
+
+        Se parte del POC y en cada paso se agrega el nivel adyacente (el
+        inferior o el superior) de mayor tamaño, hasta acumular ``fraction``
+        del total; en caso de empate se extiende hacia arriba. El resultado
+        es siempre un rango contiguo de niveles.
+
+        Args:
+            fraction: Fracción del tamaño total (ej: 0.7)
+
+        Returns:
+            Tupla (precio mínimo, precio máximo), o None si el perfil está
+            vacío
+
+        Raises:
+            ValueError: Si ``fraction`` no está en (0, 1]
+        """
+        if not 0 < fraction <= 1:
+            raise ValueError(f"fraction debe estar en (0, 1]: {fraction!r}")
+        if len(self) == 0:
+            return None
+        sizes = self.sizes.tolist()
+        last = len(sizes) - 1
+        low = high = int(np.argmax(self.sizes))
+        accumulated = sizes[low]
+        target = fraction * sum(sizes)
+        while accumulated < target and (low > 0 or high < last):
+            below = sizes[low - 1] if low > 0 else -np.inf
+            above = sizes[high + 1] if high < last else -np.inf
+            if above >= below:
+                high += 1
+                accumulated += above
+            else:
+                low -= 1
+                accumulated += below
+        return float(self.prices[low]), float(self.prices[high])
+
+    def to_dict(self) -> dict:
+        """
+        Convierte el perfil al formato JSON de la API.
+
+        Returns:
+            Diccionario con ``currentPrice``, ``startDate``, ``endDate`` y
+            ``data`` (lista de pares precio/tamaño)
+        """
+        result: Dict[str, Any] = {
+            "data": [
+                {"price": price, "size": size}
+                for price, size in zip(self.prices.tolist(), self.sizes.tolist())
+            ]
+        }
+        for key, value in (
+            ("currentPrice", self.current_price),
+            ("startDate", self.start_date),
+            ("endDate", self.end_date),
+        ):
+            if value is not None:
+                result[key] = value
+        return result
+
+
+def _get(record: Any, field: str, alias: Optional[str] = None) -> Any:
+    """Lee un campo de un modelo o diccionario."""
+    if isinstance(record, dict):
+        return record.get(alias or field, record.get(field))
+    return getattr(record, field, None)
+
+
+def merge_profiles(
+    profiles: Iterable[Profile], bin_size: Optional[float] = None
+) -> Profile:
+    """
+    Fusiona perfiles (ej: de varios exchanges) sumando el tamaño por nivel.
+
+    Args:
+        profiles: Perfiles a fusionar
+        bin_size: Ancho de bin del resultado; por defecto el mayor
+            ``bin_size`` de los perfiles, para que ningún bin quede a medias
+
+    Returns:
+        Perfil combinado
+    """
+    profiles = list(profiles)
+    if not profiles:
+        return Profile(np.empty(0), np.empty(0), bin_size=bin_size)
+
+    if bin_size is None:
+        sizes = [p.bin_size for p in profiles if p.bin_size is not None]
+        bin_size = max(sizes) if sizes else None
+
+    merged = Profile.from_levels(
+        np.concatenate([p.prices for p in profiles]),
+        np.concatenate([p.sizes for p in profiles]),
+        bin_size=bin_size,
+        current_price=profiles[0].current_price,
+        start_date=min((p.start_date for p in profiles if p.start_date), default=None),
+        end_date=max((p.end_date for p in profiles if p.end_date), default=None),
+    )
+    return merged.rebin(bin_size) if bin_size else merged
+
+
+class ProfileEngine:
+    """
+    Caché de perfiles descargados una vez con la precisión más fina.
+
+    Attributes:
+        endpoint: ``open_interest_profile_get`` o ``volume_profile_get``
+        precision: Precisión con la que se descargan los perfiles
+        ttl: Segundos de validez de cada perfil en caché
+    """
+
+    def __init__(
+        self,
+        endpoint: Callable[..., Any],
+        precision: Optional[str] = None,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa el motor.
+
+        Args:
+            endpoint: Método de ``ProfileToolApi``
+            precision: Precisión más fina que se pide a la API; por defecto
+                la de la API
+            ttl: Segundos de validez de cada perfil en caché
+            clock: Función que retorna el tiempo actual en segundos
+        """
+        self.endpoint = endpoint
+        self.precision = precision
+        self.ttl = ttl
+        self._clock = clock
+        self._cache: Dict[Tuple, Tuple[float, Profile]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        exchange: str,
+        coin: str,
+        profile_type: str,
+        bin_size: Optional[float] = None,
+        **params: Any,
+    ) -> Profile:
+        """
+        Obtiene el perfil de un exchange, descargándolo sólo si no está en
+        caché.
+
+        Args:
+            exchange: Exchange (ej: "binance")
+            coin: Moneda (ej: "BTC")
+            profile_type: Tipo de perfil de la API
+            bin_size: Ancho de bin del resultado; por defecto el de la
+                descarga
+            **params: Parámetros extra del endpoint (ej: ``lookback``)
+
+        Returns:
+            Perfil, re-agrupado si se indicó ``bin_size``
+        """
+        key = (
+            endpoint_name(self.endpoint),
+            endpoint_client(self.endpoint),
+            exchange,
+            coin,
+            profile_type,
+            tuple(sorted(params.items())),
+        )
+        now = self._clock()
+        with self._lock:
+            entry = self._cache.get(key)
+        if entry is None or now - entry[0] >= self.ttl:
+            if self.precision is not None:
+                params.setdefault("precision", self.precision)
+            response = self.endpoint(
+                exchange=exchange, coin=coin, profile_type=profile_type, **params
+            )
+            entry = (now, Profile.from_response(response))
+            with self._lock:
+                self._cache[key] = entry
+
+        profile = entry[1]
+        return profile.rebin(bin_size) if bin_size else profile
+
+    def merged(
+        self,
+        exchanges: Sequence[str],
+        coin: str,
+        profile_type: str,
+        bin_size: Optional[float] = None,
+        **params: Any,
+    ) -> Profile:
+        """
+        Obtiene el perfil combinado de varios exchanges.
+
+        Args:
+            exchanges: Exchanges a combinar
+            coin: Moneda
+            profile_type: Tipo de perfil de la API
+            bin_size: Ancho de bin del resultado
+            **params: Parámetros extra del endpoint
+
+        Returns:
+            Perfil combinado
+        """
+        profiles = [
+            self.get(exchange, coin, profile_type, **params) for exchange in exchanges
+        ]
+        return merge_profiles(profiles, bin_size=bin_size)
+
+    def clear(self) -> None:
+        """Vacía la caché."""
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,243 @@
+"""
+Remuestreo local de series a timeframes mayores.
+
+Todos los endpoints aceptan un ``timeframe`` (1m, 5m, 15m, 1h, 4h, 1d) y cada
+uno cuesta un hit de la API. Este módulo deriva localmente los timeframes
+mayores a partir de una serie ya descargada en 1m (u otro timeframe menor),
+agrupando por bucket de ``openDate`` con operaciones ``reduceat`` de NumPy.
+
+La regla de agregación de cada campo depende del modelo: OHLC para
+``Klines``/``OpenInterest``, suma para volúmenes y liquidaciones, y último
+valor para ratios y el resto de campos.
+
+Example:
+    klines_1m = orderflow_api.klines_get(coin="BTC", timeframe="1m", limit=1000)
+    klines_1h = resample(klines_1m, "1h")
+    klines_4h = resample(klines_1m, "4h", drop_partial=True)
+"""
+
+import typing
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+import numpy as np
+
+from ..series import as_records, timeframe_seconds
+from ._records import camel_case, column
+
+AGGREGATIONS = ("first", "last", "max", "min", "sum", "mean")
+
+_OHLC = {"open": "first", "high": "max", "low": "min", "close": "last"}
+
+# Reglas por nombre de modelo; los campos no listados usan "last".
+RESAMPLE_RULES: Dict[str, Dict[str, str]] = {
+    "Klines": _OHLC,
+    "OpenInterest": _OHLC,
+    "BuyVolume": {"buy_volume": "sum"},
+    "SellVolume": {"sell_volume": "sum"},
+    "VolumeDelta": {"volume_delta": "sum"},
+    "Liquidation": {"long_liquidation": "sum", "short_liquidation": "sum"},
+    "MarketOrderCount": {"__default__": "sum"},
+    "LimitOrderCount": {"__default__": "sum"},
+}
+
+
+def _reduce(values: np.ndarray, starts: np.ndarray, how: str) -> np.ndarray:
+    """Agrega ``values`` por grupos contiguos que comienzan en ``starts``."""
+    result: np.ndarray
+    if how == "first":
+        result = values[starts]
+    elif how == "last":
+        ends = np.append(starts[1:], len(values)) - 1
+        result = values[ends]
+    elif how == "max":
+        result = np.fmax.reduceat(values, starts)
+    elif how == "min":
+        result = np.fmin.reduceat(values, starts)
+    else:
+        total = np.add.reduceat(np.nan_to_num(values), starts)
+        counts = np.add.reduceat((~np.isnan(values)).astype(np.int64), starts)
+        if how == "sum":
+            # Un bucket sin ningún dato es NaN, no una suma 0
+            result = np.where(counts > 0, total, np.nan)
+        else:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result = total / counts
+    return result
+
+
+def _is_numeric(annotation: Any) -> bool:
+    """Indica si una anotación de pydantic es un escalar int/float opcional."""
+    if typing.get_origin(annotation) is typing.Annotated:
+        return _is_numeric(typing.get_args(annotation)[0])
+    if typing.get_origin(annotation) is Union:
+        options = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return bool(options) and all(_is_numeric(a) for a in options)
+    return annotation in (int, float)
+
+
+def _numeric_fields(records: List[Any], time_field: str) -> List[str]:
+    """Detecta los campos numéricos de los registros, excepto el tiempo."""
+    first = records[0]
+    if isinstance(first, dict):
+        names = [
+            key
+            for key, value in first.items()
+            if key not in (time_field, camel_case(time_field))
+            and isinstance(value, (int, float))
+            and not isinstance(value, bool)
+        ]
+        return names
+
+    names = []
+    for name, info in type(first).model_fields.items():
+        if name != time_field and _is_numeric(info.annotation):
+            names.append(name)
+    return names
+
+
+def _resolve_rules(
+    rules: Optional[Union[str, Mapping[str, str]]], records: List[Any]
+) -> Dict[str, str]:
+    """Obtiene las reglas por campo, aceptando atributo o alias JSON."""
+    if rules is None:
+        rules = type(records[0]).__name__
+    if isinstance(rules, str):
+        rules = RESAMPLE_RULES.get(rules, {})
+    resolved = dict(rules)
+    for name, how in rules.items():
+        resolved.setdefault(camel_case(name), how)
+    return resolved
+
+
+def resample_columns(
+    data: Any,
+    timeframe: str,
+    rules: Optional[Union[str, Mapping[str, str]]] = None,
+    time_field: str = "open_date",
+    time_unit: str = "s",
+    drop_partial: bool = False,
+    source_timeframe: Optional[str] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Remuestrea una serie y retorna el resultado como columnas de NumPy.
+
+    Args:
+        data: Respuesta del endpoint en un timeframe menor
+        timeframe: Timeframe de destino (ej: "1h")
+        rules: Agregación por campo ("first", "last", "max", "min", "sum" o
+            "mean"), o el nombre de un modelo de ``RESAMPLE_RULES`` (útil con
+            diccionarios). Por defecto se usan las reglas del modelo de la
+            serie.
+        time_field: Atributo con el timestamp de apertura de cada barra
+        time_unit: "s" si ``openDate`` está en segundos o "ms" si está en
+            milisegundos
+        drop_partial: Si es True, descarta los buckets incompletos
+        source_timeframe: Timeframe de origen; se infiere de la serie si no
+            se indica. Sólo se usa con ``drop_partial``.
+
+    Returns:
+        Diccionario campo -> array, más ``time_field`` con la apertura de cada
+        bucket y ``bars`` con el número de barras agregadas
+
+    Raises:
+        ValueError: Si el timeframe o alguna regla no son válidos
+    """
+    records = as_records(data)
+    step = timeframe_seconds(timeframe) * (1000 if time_unit == "ms" else 1)
+
+    if not records:
+        empty = np.empty(0, dtype=np.int64)
+        return {time_field: empty, "bars": empty.copy()}
+
+    rules = _resolve_rules(rules, records)
+    default = rules.get("__default__", "last")
+    fields = _numeric_fields(records, time_field)
+    for field in fields:
+        how = rules.get(field, default)
+        if how not in AGGREGATIONS:
+            raise ValueError(f"Agregación inválida para {field}: {how!r}")
+
+    times = column(records, time_field)
+    valid = ~np.isnan(times)
+    times = times[valid].astype(np.int64)
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+    if len(times) == 0:
+        return {time_field: times, "bars": times.copy()}
+
+    buckets = (times // step) * step
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    counts = np.diff(np.append(starts, len(times)))
+
+    result: Dict[str, np.ndarray] = {time_field: buckets[starts], "bars": counts}
+    for field in fields:
+        values = column(records, field)[valid][order]
+        result[field] = _reduce(values, starts, rules.get(field, default))
+
+    if drop_partial and len(times):
+        if source_timeframe is not None:
+            source_step = timeframe_seconds(source_timeframe) * (
+                1000 if time_unit == "ms" else 1
+            )
+        elif len(times) > 1:
+            source_step = int(np.min(np.diff(np.unique(times))))
+        else:
+            source_step = step
+        complete = counts >= step // max(source_step, 1)
+        result = {key: value[complete] for key, value in result.items()}
+
+    return result
+
+
+def resample(
+    data: Any,
+    timeframe: str,
+    rules: Optional[Union[str, Mapping[str, str]]] = None,
+    time_field: str = "open_date",
+    time_unit: str = "s",
+    drop_partial: bool = False,
+    source_timeframe: Optional[str] = None,
+) -> List[Any]:
+    """
+    Remuestrea una serie y retorna registros del mismo tipo que la entrada.
+
+    Los modelos se reconstruyen con ``from_dict``, de modo que el resultado
+    puede reemplazar directamente a la respuesta del endpoint en el
+    timeframe de destino. Los parámetros son los de ``resample_columns``.
+
+    Returns:
+        Lista de modelos (o diccionarios, si la entrada eran diccionarios)
+        ordenada por ``openDate`` ascendente
+    """
+    records = as_records(data)
+    columns = resample_columns(
+        records,
+        timeframe,
+        rules=rules,
+        time_field=time_field,
+        time_unit=time_unit,
+        drop_partial=drop_partial,
+        source_timeframe=source_timeframe,
+    )
+    if not records:
+        return []
+
+    as_dicts = isinstance(records[0], dict)
+    model = type(records[0])
+    names = [name for name in columns if name != "bars"]
+    if as_dicts:
+        keys = [name if name in records[0] else camel_case(name) for name in names]
+    else:
+        keys = [model.model_fields[name].alias or name for name in names]
+
+    lists = []
+    for name in names:
+        values = columns[name].tolist()
+        if name != time_field:
+            values = [None if v != v else v for v in values]
+        lists.append(values)
+
+    rows = [dict(zip(keys, row)) for row in zip(*lists)]
+    if as_dicts:
+        return rows
+    return [model.from_dict(row) for row in rows]
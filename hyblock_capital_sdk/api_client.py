@@ -13,6 +13,8 @@
 """  # noqa: E501
 
 
+import contextlib
+import copy
 import datetime
 from dateutil.parser import parse
 from enum import Enum
@@ -22,15 +24,29 @@ import mimetypes
 import os
 import re
 import tempfile
+import threading
 
 from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict, Union
+from typing import Any, Callable, Tuple, Optional, List, Dict, Union
 from pydantic import SecretStr
 
 from hyblock_capital_sdk.configuration import Configuration
 from hyblock_capital_sdk.api_response import ApiResponse, T as ApiResponseT
 import hyblock_capital_sdk.models
 from hyblock_capital_sdk import rest
+from hyblock_capital_sdk.catalog_index import CatalogIndex
+from hyblock_capital_sdk.connection_pool import PoolMonitor, prewarm
+from hyblock_capital_sdk.memory import MemoryTracker
+from hyblock_capital_sdk.prefetch import Prefetcher
+from hyblock_capital_sdk.query import encode_query
+from hyblock_capital_sdk.recording import RecordingArchive, RecordReplayClientObject
+from hyblock_capital_sdk.response_cache import ResponseCache
+from hyblock_capital_sdk.timings import (
+    RequestTimings,
+    count_rows,
+    instrument_pool_manager,
+    is_instrumented,
+)
 from hyblock_capital_sdk.exceptions import (
     ApiValueError,
     ApiException,
@@ -58,6 +74,15 @@ class ApiClient:
         the API.
     :param cookie: a cookie to include in the header when making calls
         to the API
+
+    Thread safety: a single ApiClient can be shared by many threads. The
+    request path takes no locks: every request builds its own header dict,
+    and default_headers is replaced (copy-on-write) instead of mutated, so
+    concurrent set_default_header calls never affect a request in progress.
+    Assign a new dict to default_headers rather than mutating it in place.
+    Likewise, change settings of a shared client with update_configuration,
+    which publishes a modified copy of the Configuration instead of mutating
+    the one in use.
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, str, int)
@@ -73,6 +98,29 @@ class ApiClient:
         "object": object,
     }
     _pool = None
+    _default_lock = threading.Lock()
+    # Configuration attributes read only when rest_client is built; changing
+    # one through update_configuration rebuilds the transport.
+    TRANSPORT_SETTINGS = frozenset(
+        {
+            "transport",
+            "verify_ssl",
+            "ssl_ca_cert",
+            "ca_cert_data",
+            "cert_file",
+            "key_file",
+            "assert_hostname",
+            "tls_server_name",
+            "retries",
+            "socket_options",
+            "connection_pool_maxsize",
+            "proxy",
+            "proxy_headers",
+            "recording_path",
+            "recording_mode",
+            "recording_strict",
+        }
+    )
 
     def __init__(
         self, configuration=None, header_name=None, header_value=None, cookie=None
@@ -82,7 +130,10 @@ class ApiClient:
             configuration = Configuration.get_default()
         self.configuration = configuration
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client: rest.Transport = self._build_rest_client(configuration)
+        # serializes writers of default_headers and configuration; readers
+        # never lock
+        self._write_lock = threading.Lock()
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -90,6 +141,53 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = "OpenAPI-Generator/0.1.0/python"
         self.client_side_validation = configuration.client_side_validation
+        # Optional CatalogIndex used to reject unsupported coin/exchange
+        # combinations before sending the request.
+        self.catalog_index: Optional[CatalogIndex] = None
+        # Optional ResponseCache for GET responses and Prefetcher that
+        # speculatively fills it.
+        self.response_cache: Optional[ResponseCache] = None
+        self.prefetcher: Optional[Prefetcher] = None
+        # Optional PoolMonitor that bounds concurrency and resizes the
+        # connection pool.
+        self.pool_monitor: Optional[PoolMonitor] = None
+        # Optional callback that receives a RequestTimings per request.
+        self.request_observer: Optional[Callable[[RequestTimings], Any]] = None
+        # Optional MemoryTracker that accounts for live responses and caches
+        # and enforces a memory budget.
+        self.memory_tracker: Optional[MemoryTracker] = None
+        self._prewarm()
+
+    @staticmethod
+    def _build_rest_client(configuration) -> rest.Transport:
+        """Creates the transport described by a configuration."""
+        rest_client: rest.Transport
+        if configuration.transport == "http2":
+            from hyblock_capital_sdk.http2 import HTTP2ClientObject
+
+            rest_client = HTTP2ClientObject(configuration)
+        elif configuration.transport == "urllib3":
+            rest_client = rest.RESTClientObject(configuration)
+        else:
+            raise ApiValueError(f"Unsupported transport: {configuration.transport!r}")
+        pool_manager = getattr(rest_client, "pool_manager", None)
+        if pool_manager is not None:
+            # new connections time their connect for request_observer;
+            # close() restores the original connection classes
+            instrument_pool_manager(pool_manager)
+        if configuration.recording_path is not None:
+            rest_client = RecordReplayClientObject(
+                rest_client,
+                RecordingArchive(configuration.recording_path),
+                mode=configuration.recording_mode,
+                strict=configuration.recording_strict,
+            )
+        return rest_client
+
+    def _prewarm(self):
+        """Opens the keep-alive connections the configuration asks for."""
+        if self.configuration.prewarm_connections:
+            prewarm(self, self.configuration.prewarm_connections)
 
     def __enter__(self):
         return self
@@ -104,10 +202,45 @@ class ApiClient:
 
     @user_agent.setter
     def user_agent(self, value):
-        self.default_headers["User-Agent"] = value
+        self.set_default_header("User-Agent", value)
 
     def set_default_header(self, header_name, header_value):
-        self.default_headers[header_name] = header_value
+        # copy-on-write: requests in flight keep reading the previous dict
+        with self._write_lock:
+            self.default_headers = {**self.default_headers, header_name: header_value}
+
+    def update_configuration(self, **changes):
+        """Publishes a modified copy of the configuration (copy-on-write).
+
+        The current Configuration is never mutated: a deep copy with the
+        changes applied replaces it in a single assignment, so a request in
+        progress keeps the settings it started with. Changing a setting in
+        TRANSPORT_SETTINGS (retries, proxy, TLS, pool size...) also builds a
+        new rest_client, swapped in the same way and prewarmed like the one
+        built by __init__. The replaced rest_client is closed: requests still
+        using it finish normally and their connections are discarded.
+
+        :param changes: Configuration attribute names and their new values,
+            e.g. api_key={"Api Key": new_key}.
+        :raises ApiValueError: if a name is not a Configuration attribute.
+        :return: The new Configuration object.
+        """
+        replaced = None
+        with self._write_lock:
+            configuration = copy.deepcopy(self.configuration)
+            for name, value in changes.items():
+                if not hasattr(configuration, name):
+                    raise ApiValueError(f"Unknown configuration setting: {name!r}")
+                setattr(configuration, name, value)
+            if self.TRANSPORT_SETTINGS.intersection(changes):
+                replaced = self.rest_client
+                self.rest_client = self._build_rest_client(configuration)
+            self.client_side_validation = configuration.client_side_validation
+            self.configuration = configuration
+        if replaced is not None:
+            replaced.close()
+            self._prewarm()
+        return configuration
 
     _default = None
 
@@ -122,7 +255,9 @@ class ApiClient:
         :return: The ApiClient object.
         """
         if cls._default is None:
-            cls._default = ApiClient()
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = ApiClient()
         return cls._default
 
     @classmethod
@@ -174,9 +309,11 @@ class ApiClient:
 
         config = self.configuration
 
-        # header parameters
-        header_params = header_params or {}
-        header_params.update(self.default_headers)
+        if self.catalog_index is not None:
+            self.catalog_index.validate_request(resource_path, query_params)
+
+        # header parameters (a new dict per request, never shared)
+        header_params = {**(header_params or {}), **self.default_headers}
         if self.cookie:
             header_params["Cookie"] = self.cookie
         if header_params:
@@ -212,6 +349,7 @@ class ApiClient:
             method,
             body,
             request_auth=_request_auth,
+            configuration=config,
         )
 
         # body
@@ -219,16 +357,21 @@ class ApiClient:
             body = self.sanitize_for_serialization(body)
 
         # request url
-        if _host is None or self.configuration.ignore_operation_servers:
-            url = self.configuration.host + resource_path
+        if _host is None or config.ignore_operation_servers:
+            url = config.host + resource_path
         else:
             # use server/host defined in path or operation instead
             url = _host + resource_path
 
         # query parameters
         if query_params:
-            query_params = self.sanitize_for_serialization(query_params)
-            url_query = self.parameters_to_url_query(query_params, collection_formats)
+            # single pass for scalar params; generic path for anything else
+            url_query = encode_query(query_params, collection_formats)
+            if url_query is None:
+                query_params = self.sanitize_for_serialization(query_params)
+                url_query = self.parameters_to_url_query(
+                    query_params, collection_formats
+                )
             url += "?" + url_query
 
         return method, url, header_params, body, post_params
@@ -254,21 +397,78 @@ class ApiClient:
         :return: RESTResponse
         """
 
-        try:
-            # perform request and return response
-            response_data = self.rest_client.request(
-                method,
-                url,
-                headers=header_params,
-                body=body,
-                post_params=post_params,
-                _request_timeout=_request_timeout,
-            )
-
-        except ApiException as e:
-            raise e
-
-        return response_data
+        cache = self.response_cache if method == "GET" else None
+        prefetcher = self.prefetcher
+        observer = self.request_observer
+        timings = None
+        if observer is not None:
+            timings = RequestTimings(method, url, observer, body)
+        # a Tracer observer keeps this span open until response_deserialize
+        span = (
+            timings.open_span("hyblock.call_api")
+            if timings is not None
+            else contextlib.nullcontext()
+        )
+        with span:
+            response_data = cache.get(method, url) if cache is not None else None
+
+            if response_data is None:
+                monitor = self.pool_monitor
+                if prefetcher is not None:
+                    prefetcher.begin()
+                if monitor is not None:
+                    queue_wait = monitor.acquire()
+                    if timings is not None:
+                        timings.queue_wait = queue_wait
+                rest_client = self.rest_client
+                try:
+                    if timings is not None:
+                        timings.send()
+                    # perform request and return response
+                    response_data = rest_client.request(
+                        method,
+                        url,
+                        headers=header_params,
+                        body=body,
+                        post_params=post_params,
+                        _request_timeout=_request_timeout,
+                    )
+                    if timings is not None:
+                        timings.headers_received(
+                            response_data,
+                            is_instrumented(getattr(rest_client, "pool_manager", None)),
+                        )
+                    if monitor is not None or timings is not None:
+                        # the connection returns to the pool once the body is read
+                        response_data.read()
+                        if timings is not None:
+                            timings.stop("download")
+
+                except Exception as e:
+                    if timings is not None:
+                        # the observer also sees requests that got no response
+                        timings.finish(None, None, error=e)
+                    raise
+                finally:
+                    if monitor is not None:
+                        monitor.release()
+                    if prefetcher is not None:
+                        prefetcher.end()
+
+                if cache is not None:
+                    cache.put(method, url, response_data)
+            elif timings is not None:
+                timings.cached = True
+
+            if prefetcher is not None:
+                prefetcher.observe(method, url, header_params)
+            if timings is not None:
+                # delivered to the observer by response_deserialize
+                response_data.timings = timings
+            if self.memory_tracker is not None:
+                # per-endpoint accounting in response_deserialize
+                response_data.request_url = url
+            return response_data
 
     def response_deserialize(
         self,
@@ -298,22 +498,33 @@ class ApiClient:
         # deserialize response data
         response_text = None
         return_data = None
+        timings = getattr(response_data, "timings", None)
+        span = contextlib.nullcontext()
+        if timings is not None:
+            timings.start()
+            # child of the hyblock.call_api span opened by call_api
+            span = timings.open_span("hyblock.response_deserialize")
         try:
-            if response_type == "bytearray":
-                return_data = response_data.data
-            elif response_type == "file":
-                return_data = self.__deserialize_file(response_data)
-            elif response_type is not None:
-                match = None
-                content_type = response_data.getheader("content-type")
-                if content_type is not None:
-                    match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
-                encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(
-                    response_text, response_type, content_type
-                )
+            with span:
+                if response_type == "bytearray":
+                    return_data = response_data.data
+                elif response_type == "file":
+                    return_data = self.__deserialize_file(response_data)
+                elif response_type is not None:
+                    match = None
+                    content_type = response_data.getheader("content-type")
+                    if content_type is not None:
+                        match = re.search(
+                            r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type
+                        )
+                    encoding = match.group(1) if match else "utf-8"
+                    response_text = response_data.data.decode(encoding)
+                    return_data = self.deserialize(
+                        response_text, response_type, content_type, _timings=timings
+                    )
         finally:
+            if timings is not None:
+                timings.finish(response_data.status, response_data.data)
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
                     http_resp=response_data,
@@ -321,12 +532,23 @@ class ApiClient:
                     data=return_data,
                 )
 
-        return ApiResponse(
+        api_response = ApiResponse(
             status_code=response_data.status,
             data=return_data,
             headers=response_data.getheaders(),
             raw_data=response_data.data,
         )
+        tracker = self.memory_tracker
+        if tracker is not None:
+            if self.response_cache is not None:
+                tracker.add_cache(self.response_cache)
+            # may replace api_response.data with a compact representation
+            tracker.track(
+                api_response,
+                getattr(response_data, "request_url", None),
+                self.configuration.host,
+            )
+        return api_response
 
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
@@ -383,7 +605,11 @@ class ApiClient:
         }
 
     def deserialize(
-        self, response_text: str, response_type: str, content_type: Optional[str]
+        self,
+        response_text: str,
+        response_type: str,
+        content_type: Optional[str],
+        _timings: Optional[RequestTimings] = None,
     ):
         """Deserializes response into an object.
 
@@ -391,6 +617,8 @@ class ApiClient:
         :param response_type: class literal for
             deserialized object, or string of class name.
         :param content_type: content type of response.
+        :param _timings: RequestTimings that records the decode and model
+            construction phases.
 
         :return: deserialized object.
         """
@@ -417,7 +645,14 @@ class ApiClient:
                 status=0, reason="Unsupported content type: {0}".format(content_type)
             )
 
-        return self.__deserialize(data, response_type)
+        if _timings is None:
+            return self.__deserialize(data, response_type)
+
+        _timings.stop("decode")
+        _timings.rows = count_rows(data)
+        result = self.__deserialize(data, response_type)
+        _timings.stop("model")
+        return result
 
     def __deserialize(self, data, klass):
         """Deserializes dict, list, str into an object.
@@ -500,6 +735,10 @@ class ApiClient:
         :param dict collection_formats: Parameter collection formats
         :return: URL query string (e.g. a=Hello%20World&b=123)
         """
+        url_query = encode_query(params, collection_formats)
+        if url_query is not None:
+            return url_query
+
         new_params: List[Tuple[str, str]] = []
         if collection_formats is None:
             collection_formats = {}
@@ -601,6 +840,7 @@ class ApiClient:
         method,
         body,
         request_auth=None,
+        configuration=None,
     ) -> None:
         """Updates header and query params based on authentication setting.
 
@@ -613,6 +853,9 @@ class ApiClient:
         The object type is the return value of sanitize_for_serialization().
         :param request_auth: if set, the provided settings will
                              override the token in the configuration.
+        :param configuration: Configuration to read the auth settings from;
+            defaults to the current one. param_serialize passes the snapshot
+            it read, so a request never mixes two configurations.
         """
         if not auth_settings:
             return
@@ -622,8 +865,12 @@ class ApiClient:
                 headers, queries, resource_path, method, body, request_auth
             )
         else:
+            # one read: a concurrent update_configuration swaps the whole object
+            if configuration is None:
+                configuration = self.configuration
+            settings = configuration.auth_settings()
             for auth in auth_settings:
-                auth_setting = self.configuration.auth_settings().get(auth)
+                auth_setting = settings.get(auth)
                 if auth_setting:
                     self._apply_auth_params(
                         headers, queries, resource_path, method, body, auth_setting
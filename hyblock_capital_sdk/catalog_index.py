@@ -0,0 +1,419 @@
+"""
+Índice en memoria del catálogo de la API de Hyblock Capital.
+
+Todos los endpoints indican que las combinaciones válidas de coin y exchange
+se obtienen con ``/catalog``. ``CatalogIndex`` descarga ese catálogo, lo
+indexa en diccionarios ``endpoint -> exchange -> símbolos`` y lo refresca en
+segundo plano cuando vence su TTL. Con el índice se puede:
+
+- rechazar localmente (sin gastar un hit) las peticiones con combinaciones
+  inválidas, asignándolo a ``ApiClient.catalog_index``;
+- enumerar los pares (exchange, coin) válidos para trabajos masivos.
+
+Example:
+    catalog = CatalogIndex(hc.CatalogApi(api_client), ttl=3600)
+    api_client.catalog_index = catalog
+
+    for exchange, coin in catalog.targets("klines", coins=["BTC", "ETH"]):
+        orderflow_api.klines_get(coin=coin, exchange=exchange, timeframe="1h")
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .exceptions import ApiValueError
+
+logger = logging.getLogger(__name__)
+
+WILDCARD = "*"
+
+# Rutas que no dependen del catálogo.
+UNINDEXED_PATHS = frozenset({"catalog", "remaininghitbalance"})
+
+Index = Dict[str, Dict[str, FrozenSet[str]]]
+
+
+def _key(value: str) -> str:
+    """Normaliza un nombre; los parámetros de la API no distinguen mayúsculas."""
+    return value.strip().strip("/").casefold()
+
+
+def _split(value: Any) -> List[str]:
+    """Separa un parámetro que admite varios valores separados por comas."""
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_key(str(v)) for v in value if str(v).strip()]
+    return [_key(part) for part in str(value).split(",") if part.strip()]
+
+
+def _symbols(value: Any) -> FrozenSet[str]:
+    """Extrae los símbolos de una entrada del catálogo."""
+    if isinstance(value, Mapping):
+        value = value.get("symbols", value.get("coins", list(value)))
+    if isinstance(value, (list, tuple, set)):
+        names = []
+        for item in value:
+            if isinstance(item, Mapping):
+                item = item.get("symbol", item.get("coin"))
+            if item is not None:
+                names.append(str(item))
+        return frozenset(_key(name) for name in names if name.strip())
+    return frozenset(_split(value))
+
+
+def parse_catalog(data: Any) -> Index:
+    """
+    Convierte la respuesta de ``/catalog`` en un índice de búsqueda.
+
+    Se aceptan las dos formas que retorna la API: ``endpoint -> exchange ->
+    símbolos`` y, al filtrar por ``endpointName``, ``exchange -> símbolos``
+    (que se guarda bajo el endpoint comodín ``"*"``).
+
+    Args:
+        data: Respuesta de ``catalog_get``, un modelo ``Catalog`` o JSON
+            decodificado
+
+    Returns:
+        Diccionario endpoint -> exchange -> conjunto de símbolos, con todas
+        las claves normalizadas
+    """
+    if hasattr(data, "to_dict"):
+        data = data.to_dict()
+    if isinstance(data, Mapping) and isinstance(data.get("data"), Mapping):
+        data = data["data"]
+    if not isinstance(data, Mapping):
+        return {}
+
+    index: Index = {}
+    for name, value in data.items():
+        if value is None:
+            continue
+        if isinstance(value, Mapping) and not ("symbols" in value or "coins" in value):
+            index[_key(name)] = {
+                _key(exchange): _symbols(symbols)
+                for exchange, symbols in value.items()
+                if symbols is not None
+            }
+        else:
+            index.setdefault(WILDCARD, {})[_key(name)] = _symbols(value)
+    return index
+
+
+class CatalogIndex:
+    """
+    Catálogo indexado con refresco en segundo plano.
+
+    Las consultas son búsquedas en diccionarios y conjuntos (O(1)). Mientras
+    el índice no se haya cargado, ``validate`` no rechaza ninguna petición.
+
+    Attributes:
+        ttl: Segundos de validez del índice antes de refrescarlo
+        retry_interval: Segundos de espera tras un refresco fallido
+        loaded_at: Momento de la última carga, o None
+        failed_at: Momento del último refresco fallido, o None
+    """
+
+    def __init__(
+        self,
+        catalog_api: Any = None,
+        ttl: float = 3600.0,
+        retry_interval: float = 60.0,
+        fetch: Optional[Callable[[], Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        background: bool = True,
+    ):
+        """
+        Inicializa el índice.
+
+        Args:
+            catalog_api: Instancia de ``CatalogApi`` usada para descargar el
+                catálogo
+            ttl: Segundos de validez del índice
+            retry_interval: Segundos sin reintentar la descarga después de
+                un fallo, para no repetirla en cada petición
+            fetch: Función alternativa que retorna el catálogo; tiene
+                prioridad sobre ``catalog_api``
+            clock: Función que retorna el tiempo actual en segundos
+            background: Si es True, los refrescos posteriores a la primera
+                carga se hacen en un hilo sin bloquear las consultas
+        """
+        self.catalog_api = catalog_api
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+        self.loaded_at: Optional[float] = None
+        self.failed_at: Optional[float] = None
+
+        self._fetch = fetch
+        self._clock = clock
+        self._background = background
+        self._index: Index = {}
+        self._refreshing = threading.Lock()
+
+    @classmethod
+    def from_catalog(cls, data: Any, **kwargs: Any) -> "CatalogIndex":
+        """
+        Crea un índice a partir de un catálogo ya descargado.
+
+        Args:
+            data: Respuesta de ``/catalog``
+            **kwargs: Argumentos de ``CatalogIndex``
+
+        Returns:
+            Índice cargado
+        """
+        catalog = cls(**kwargs)
+        catalog.load(data)
+        return catalog
+
+    # Carga y refresco
+
+    def load(self, data: Any) -> None:
+        """
+        Reemplaza el índice con el contenido de un catálogo.
+
+        Args:
+            data: Respuesta de ``/catalog``
+        """
+        index = parse_catalog(data)
+        # Reemplazo atómico: los lectores ven el índice viejo o el nuevo.
+        self._index = index
+        self.loaded_at = self._clock()
+        self.failed_at = None
+
+    def _download(self) -> Any:
+        """Descarga el catálogo crudo, sin validar contra el modelo."""
+        if self._fetch is not None:
+            return self._fetch()
+        if self.catalog_api is None:
+            return None
+        response = self.catalog_api.catalog_get_without_preload_content()
+        return json.loads(response.read())
+
+    def refresh(self) -> bool:
+        """
+        Descarga y carga el catálogo si no hay otro refresco en curso.
+
+        Returns:
+            True si se cargó un catálogo nuevo
+        """
+        if not self._refreshing.acquire(blocking=False):
+            return False
+        try:
+            data = self._download()
+            if data is None:
+                return False
+            self.load(data)
+            return True
+        except Exception:
+            self.failed_at = self._clock()
+            logger.exception(
+                "No se pudo refrescar el catálogo; reintento en %.0f s",
+                self.retry_interval,
+            )
+            return False
+        finally:
+            self._refreshing.release()
+
+    @property
+    def stale(self) -> bool:
+        """True si el índice no se cargó o venció su TTL."""
+        return self.loaded_at is None or self._clock() - self.loaded_at >= self.ttl
+
+    def ensure_fresh(self) -> None:
+        """
+        Refresca el índice si venció.
+
+        La primera carga es sincrónica; las siguientes (y los reintentos tras
+        un fallo) se hacen en segundo plano mientras se sigue respondiendo con
+        el índice anterior. Después de un fallo no se reintenta hasta que pase
+        ``retry_interval``.
+        """
+        if not self.stale:
+            return
+        if (
+            self.failed_at is not None
+            and self._clock() - self.failed_at < self.retry_interval
+        ):
+            return
+        first_load = self.loaded_at is None and self.failed_at is None
+        if first_load or not self._background:
+            self.refresh()
+            return
+        if self._refreshing.locked():
+            return
+        threading.Thread(
+            target=self.refresh, name="hyblock-catalog", daemon=True
+        ).start()
+
+    # Consultas
+
+    def _exchanges_for(self, endpoint: str) -> Optional[Dict[str, FrozenSet[str]]]:
+        """Obtiene el mapa exchange -> símbolos de un endpoint."""
+        self.ensure_fresh()
+        index = self._index
+        return index.get(_key(endpoint), index.get(WILDCARD))
+
+    def endpoints(self) -> List[str]:
+        """Lista los endpoints del catálogo (normalizados)."""
+        self.ensure_fresh()
+        return sorted(name for name in self._index if name != WILDCARD)
+
+    def exchanges(self, endpoint: str, coin: Optional[str] = None) -> List[str]:
+        """
+        Lista los exchanges que soportan un endpoint (y opcionalmente un coin).
+
+        Args:
+            endpoint: Nombre del endpoint (ej: "klines" o "/klines")
+            coin: Moneda que debe estar soportada
+
+        Returns:
+            Exchanges ordenados alfabéticamente
+        """
+        exchanges = self._exchanges_for(endpoint) or {}
+        if coin is None:
+            return sorted(exchanges)
+        coin = _key(coin)
+        return sorted(name for name, symbols in exchanges.items() if coin in symbols)
+
+    def symbols(self, endpoint: str, exchange: Optional[str] = None) -> List[str]:
+        """
+        Lista los símbolos soportados por un endpoint.
+
+        Args:
+            endpoint: Nombre del endpoint
+            exchange: Exchange; por defecto la unión de todos
+
+        Returns:
+            Símbolos ordenados alfabéticamente (en minúsculas)
+        """
+        exchanges = self._exchanges_for(endpoint) or {}
+        if exchange is not None:
+            return sorted(exchanges.get(_key(exchange), ()))
+        return sorted(set().union(*exchanges.values()))
+
+    def is_supported(
+        self, endpoint: str, coin: str, exchange: Optional[str] = None
+    ) -> bool:
+        """
+        Indica si una combinación endpoint/coin/exchange es válida.
+
+        Los endpoints que no figuran en el catálogo se consideran válidos.
+
+        Args:
+            endpoint: Nombre del endpoint
+            coin: Moneda (o varias separadas por comas)
+            exchange: Exchange (o varios separados por comas); por defecto
+                basta con que algún exchange soporte la moneda
+
+        Returns:
+            True si la combinación está soportada
+        """
+        return not self._problems(endpoint, coin, exchange)
+
+    def _problems(self, endpoint: str, coin: Any, exchange: Any) -> List[str]:
+        """Lista los motivos por los que una combinación no es válida."""
+        exchanges = self._exchanges_for(endpoint)
+        if not exchanges:
+            return []
+
+        problems = []
+        requested = _split(exchange)
+        for name in requested:
+            if name not in exchanges:
+                problems.append(f"exchange {name!r} no soportado")
+        pools = [exchanges[name] for name in requested if name in exchanges]
+        if not requested:
+            pools = list(exchanges.values())
+        for symbol in _split(coin):
+            if pools and not any(symbol in symbols for symbols in pools):
+                problems.append(f"coin {symbol!r} no soportado")
+        return problems
+
+    def validate(self, endpoint: str, coin: Any = None, exchange: Any = None) -> None:
+        """
+        Verifica una combinación endpoint/coin/exchange.
+
+        Args:
+            endpoint: Nombre del endpoint
+            coin: Moneda (o varias separadas por comas)
+            exchange: Exchange (o varios separados por comas)
+
+        Raises:
+            ApiValueError: Si la combinación no está en el catálogo
+        """
+        problems = self._problems(endpoint, coin, exchange)
+        if problems:
+            raise ApiValueError(
+                f"Petición inválida para /{_key(endpoint)}: {', '.join(problems)} "
+                "según /catalog"
+            )
+
+    def validate_request(
+        self, resource_path: str, query_params: Optional[Sequence[Tuple[str, Any]]]
+    ) -> None:
+        """
+        Verifica los parámetros de una petición antes de enviarla.
+
+        Lo llama ``ApiClient.param_serialize`` cuando el índice está asignado
+        a ``ApiClient.catalog_index``.
+
+        Args:
+            resource_path: Ruta del endpoint (ej: "/klines")
+            query_params: Parámetros de query como lista de tuplas
+
+        Raises:
+            ApiValueError: Si la combinación no está en el catálogo
+        """
+        endpoint = _key(resource_path)
+        if endpoint in UNINDEXED_PATHS or not query_params:
+            return
+        params = {_key(name): value for name, value in query_params}
+        if "coin" not in params and "exchange" not in params:
+            return
+        self.validate(endpoint, params.get("coin"), params.get("exchange"))
+
+    def targets(
+        self,
+        endpoint: str,
+        coins: Optional[Iterable[str]] = None,
+        exchanges: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[str, str]]:
+        """
+        Enumera los pares (exchange, coin) válidos para un trabajo masivo.
+
+        Args:
+            endpoint: Nombre del endpoint
+            coins: Monedas de interés; por defecto todas
+            exchanges: Exchanges de interés; por defecto todos
+
+        Returns:
+            Pares (exchange, coin) ordenados, con los nombres normalizados
+        """
+        catalog = self._exchanges_for(endpoint) or {}
+        wanted_coins = None if coins is None else {_key(c) for c in coins}
+        wanted_exchanges = None if exchanges is None else {_key(e) for e in exchanges}
+
+        pairs: List[Tuple[str, str]] = []
+        for exchange in sorted(catalog):
+            if wanted_exchanges is not None and exchange not in wanted_exchanges:
+                continue
+            symbols = catalog[exchange]
+            if wanted_coins is not None:
+                symbols = symbols & wanted_coins
+            pairs.extend((exchange, symbol) for symbol in sorted(symbols))
+        return pairs
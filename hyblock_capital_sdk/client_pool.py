@@ -0,0 +1,331 @@
+"""
+Pool de clientes con varias API keys.
+
+El límite de hits es por key, así que un solo ``ApiClient`` limita el
+throughput aunque se tengan varias keys. ``ApiClientPool`` crea un
+``ApiClient`` por cada ``Configuration`` (cada una con su
+``api_key['Api Key']`` o ``access_token``) y envía cada petición por la key
+con más hits disponibles, según ``remaining_hit_balance_get`` y las
+respuestas 429 recibidas.
+
+El pool tiene la misma interfaz que ``ApiClient`` para las APIs generadas,
+por lo que el código que las usa no cambia.
+
+Example:
+    pool = ApiClientPool(
+        [
+            hc.Configuration(api_key={"Api Key": "key-1"}),
+            hc.Configuration(api_key={"Api Key": "key-2"}),
+        ]
+    )
+    orderflow_api = hc.OrderflowApi(pool)
+    klines = orderflow_api.klines_get(coin="BTC", timeframe="1h", exchange="binance")
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+from .api.api_usage_api import ApiUsageApi
+from .api_client import ApiClient
+from .configuration import Configuration
+from .rest import RESTResponse
+
+logger = logging.getLogger(__name__)
+
+# Espera por defecto tras un 429 sin header Retry-After.
+DEFAULT_COOLDOWN = 60.0
+
+
+def _discard(response: RESTResponse) -> None:
+    """Lee una respuesta descartada y devuelve su conexión al pool."""
+    try:
+        response.read()
+    finally:
+        release_conn = getattr(response.response, "release_conn", None)
+        if release_conn is not None:
+            release_conn()
+
+
+class KeyState:
+    """
+    Estado de una key del pool.
+
+    Attributes:
+        client: ``ApiClient`` configurado con la key
+        remaining: Hits disponibles según la última consulta, descontando las
+            peticiones enviadas desde entonces; None si no se conoce
+        cooldown_until: Instante hasta el que la key no recibe peticiones
+            (tras un 429)
+        in_flight: Peticiones en curso por la key
+        requests: Peticiones enviadas por la key
+        throttled: Respuestas 429 recibidas por la key
+        checked_at: Instante de la última consulta de saldo
+    """
+
+    def __init__(self, client: ApiClient):
+        self.client = client
+        self.remaining: Optional[float] = None
+        self.cooldown_until = 0.0
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.checked_at: Optional[float] = None
+
+    def available(self, now: float) -> bool:
+        """Indica si la key puede recibir peticiones."""
+        return now >= self.cooldown_until and (
+            self.remaining is None or self.remaining > 0
+        )
+
+
+class ApiClientPool:
+    """
+    Conjunto de ``ApiClient`` con keys distintas y ruteo por saldo de hits.
+
+    Attributes:
+        keys: Estado de cada key, en el orden de las configuraciones
+        balance_ttl: Segundos entre consultas de ``remaining_hit_balance_get``
+    """
+
+    def __init__(
+        self,
+        configurations: Sequence[Configuration],
+        balance_ttl: Optional[float] = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa el pool.
+
+        Args:
+            configurations: Una configuración por API key
+            balance_ttl: Segundos entre consultas de saldo de cada key; None
+                para no consultarlo (sólo se usan las respuestas 429)
+            clock: Función que retorna el tiempo actual en segundos
+
+        Raises:
+            ValueError: Si no se indica ninguna configuración
+        """
+        if not configurations:
+            raise ValueError("ApiClientPool requiere al menos una Configuration")
+        self.keys = [KeyState(ApiClient(config)) for config in configurations]
+        self.balance_ttl = balance_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._refreshing = threading.Lock()
+        self._auth_headers = {
+            setting["key"]
+            for state in self.keys
+            for setting in state.client.configuration.auth_settings().values()
+            if setting["in"] == "header"
+        }
+
+    def __enter__(self) -> "ApiClientPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        # Resto de la interfaz de ApiClient (configuration, deserialize...).
+        return getattr(self.keys[0].client, name)
+
+    # Interfaz usada por las APIs generadas
+
+    def param_serialize(self, *args: Any, **kwargs: Any):
+        """Serializa la petición; la autenticación se asigna en ``call_api``."""
+        return self.keys[0].client.param_serialize(*args, **kwargs)
+
+    def select_header_accept(self, accepts: List[str]) -> Optional[str]:
+        return self.keys[0].client.select_header_accept(accepts)
+
+    def select_header_content_type(self, content_types: List[str]) -> Optional[str]:
+        content_type: Optional[str] = self.keys[0].client.select_header_content_type(
+            content_types
+        )
+        return content_type
+
+    def response_deserialize(self, *args: Any, **kwargs: Any):
+        return self.keys[0].client.response_deserialize(*args, **kwargs)
+
+    def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> RESTResponse:
+        """
+        Envía la petición por la key con más saldo.
+
+        Ante un 429 la key entra en espera (``Retry-After`` o
+        ``DEFAULT_COOLDOWN``) y la petición se reintenta con otra key
+        disponible.
+
+        Returns:
+            Respuesta de la última key usada
+        """
+        tried: Set[int] = set()
+        while True:
+            state = self.select(exclude=tried)
+            tried.add(id(state))
+            headers = self._authenticate(state, header_params or {}, method, body)
+            with self._lock:
+                state.in_flight += 1
+                state.requests += 1
+                if state.remaining is not None:
+                    state.remaining -= 1
+            try:
+                response = state.client.call_api(
+                    method,
+                    url,
+                    header_params=headers,
+                    body=body,
+                    post_params=post_params,
+                    _request_timeout=_request_timeout,
+                )
+            finally:
+                with self._lock:
+                    state.in_flight -= 1
+
+            if response.status != 429:
+                return response
+            self._throttle(state, response)
+            if len(tried) >= len(self.keys) or not self._any_available(tried):
+                return response
+            _discard(response)
+
+    # Ruteo
+
+    def select(self, exclude: Optional[set] = None) -> KeyState:
+        """
+        Elige la key para la próxima petición.
+
+        Se prefieren las keys disponibles con más saldo (las de saldo
+        desconocido primero, para conocerlo) y, a igual saldo, las que tienen
+        menos peticiones en curso. Si ninguna está disponible se usa la que
+        sale antes de su espera.
+
+        Args:
+            exclude: ``id`` de los estados que no deben elegirse
+
+        Returns:
+            Estado de la key elegida
+        """
+        self._maybe_refresh()
+        now = self._clock()
+        exclude = exclude or set()
+        with self._lock:
+            candidates = [s for s in self.keys if id(s) not in exclude] or self.keys
+            available = [s for s in candidates if s.available(now)]
+            if not available:
+                return min(candidates, key=lambda s: s.cooldown_until)
+            return max(
+                available,
+                key=lambda s: (
+                    float("inf") if s.remaining is None else s.remaining,
+                    -s.in_flight,
+                    -s.requests,
+                ),
+            )
+
+    def _any_available(self, exclude: set) -> bool:
+        now = self._clock()
+        with self._lock:
+            return any(s.available(now) for s in self.keys if id(s) not in exclude)
+
+    def _authenticate(
+        self, state: KeyState, header_params: Dict[str, Any], method: str, body: Any
+    ) -> Dict[str, Any]:
+        """Reemplaza los headers de autenticación por los de la key elegida."""
+        headers = {
+            k: v for k, v in header_params.items() if k not in self._auth_headers
+        }
+        config = state.client.configuration
+        state.client.update_params_for_auth(
+            headers, [], list(config.auth_settings()), None, method, body
+        )
+        return headers
+
+    def _throttle(self, state: KeyState, response: RESTResponse) -> None:
+        """Pone una key en espera tras recibir un 429."""
+        retry_after = response.getheader("Retry-After")
+        try:
+            delay = float(retry_after) if retry_after is not None else None
+        except ValueError:
+            delay = None
+        with self._lock:
+            state.throttled += 1
+            state.remaining = 0
+            state.cooldown_until = self._clock() + (
+                delay if delay is not None else DEFAULT_COOLDOWN
+            )
+        logger.info("Key %d limitada (429)", self.keys.index(state))
+
+    # Saldo de hits
+
+    def refresh_balances(self) -> Dict[int, Optional[float]]:
+        """
+        Consulta ``remaining_hit_balance_get`` para cada key.
+
+        Returns:
+            Diccionario índice de key -> hits restantes (None si falló)
+        """
+        balances: Dict[int, Optional[float]] = {}
+        for i, state in enumerate(self.keys):
+            try:
+                balance = ApiUsageApi(state.client).remaining_hit_balance_get()
+                remaining = getattr(balance, "remaining_hits", None)
+            except Exception:
+                logger.debug("No se pudo consultar el saldo de la key %d", i)
+                remaining = None
+            with self._lock:
+                state.checked_at = self._clock()
+                if remaining is not None:
+                    state.remaining = float(remaining)
+                    if remaining > 0:
+                        state.cooldown_until = 0.0
+            balances[i] = remaining
+        return balances
+
+    def _maybe_refresh(self) -> None:
+        """Refresca el saldo en segundo plano cuando vence ``balance_ttl``."""
+        if self.balance_ttl is None:
+            return
+        now = self._clock()
+        stale = any(
+            s.checked_at is None or now - s.checked_at >= self.balance_ttl
+            for s in self.keys
+        )
+        if not stale or not self._refreshing.acquire(blocking=False):
+            return
+
+        def refresh() -> None:
+            try:
+                self.refresh_balances()
+            finally:
+                self._refreshing.release()
+
+        threading.Thread(target=refresh, name="hyblock-balance", daemon=True).start()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Obtiene el estado de cada key.
+
+        Returns:
+            Lista con ``remaining``, ``requests``, ``throttled`` e
+            ``in_flight`` por key
+        """
+        with self._lock:
+            return [
+                {
+                    "remaining": s.remaining,
+                    "requests": s.requests,
+                    "throttled": s.throttled,
+                    "in_flight": s.in_flight,
+                }
+                for s in self.keys
+            ]
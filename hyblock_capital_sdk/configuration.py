@@ -19,11 +19,15 @@ import logging
 from logging import FileHandler
 import multiprocessing
 import sys
+import threading
 from typing import Any, ClassVar, Dict, List, Literal, Optional, TypedDict, Union
 from typing_extensions import NotRequired, Self
 
 import urllib3
 
+# guards lazy creation of the shared default Configuration
+_default_lock = threading.Lock()
+
 
 JSON_SCHEMA_VALIDATION_KEYWORDS = {
     "multipleOf",
@@ -317,6 +321,32 @@ class Configuration:
            cpu_count * 5 is used as default value to increase performance.
         """
 
+        self.transport = "urllib3"
+        """HTTP transport used by ApiClient: "urllib3" (HTTP/1.1 connection
+           pool) or "http2" (requests multiplexed over a few HTTP/2
+           connections; requires the http2 extra).
+        """
+
+        self.recording_path = None
+        """Path of a RecordingArchive (gzip-compressed JSON lines). When set,
+           the transport records responses to it or replays them from it
+           according to recording_mode. None disables record/replay.
+        """
+        self.recording_mode = "replay"
+        """"record" sends every request and stores the response; "replay"
+           serves responses from the archive without touching the network.
+        """
+        self.recording_strict = True
+        """In "replay" mode, raise UnrecordedRequestError for requests missing
+           from the archive instead of sending and recording them.
+        """
+
+        self.prewarm_connections = 0
+        """Number of keep-alive connections opened to the host when an
+           ApiClient is created, so the first burst of requests does not pay
+           the TCP/TLS handshakes serially. 0 disables pre-warming.
+        """
+
         self.proxy: Optional[str] = None
         """Proxy URL
         """
@@ -393,7 +423,9 @@ class Configuration:
         :return: The configuration object.
         """
         if cls._default is None:
-            cls._default = cls()
+            with _default_lock:
+                if cls._default is None:
+                    cls._default = cls()
         return cls._default
 
     @property
@@ -0,0 +1,300 @@
+"""
+Pre-calentamiento y tamaño adaptativo del pool de conexiones.
+
+``Configuration.connection_pool_maxsize`` se fija en ``cpu_count() * 5`` sin
+relación con la concurrencia real, y la primera ráfaga tras arrancar paga los
+handshakes TLS en serie. Este módulo ofrece:
+
+- ``prewarm``: abre N conexiones keep-alive en paralelo y las deja en el pool
+  de urllib3. ``ApiClient`` lo llama al construirse si
+  ``Configuration.prewarm_connections`` es mayor que cero.
+- ``PoolMonitor``: limita las peticiones simultáneas al tamaño del pool,
+  lo agranda cuando la demanda lo satura, lo reduce cuando la demanda
+  máxima de una ventana queda por debajo, y reporta la saturación y el
+  tiempo de espera.
+
+Example:
+    config = hc.Configuration(host="https://api1.hyblockcapital.com/v1")
+    config.prewarm_connections = 8
+    api_client = hc.ApiClient(config)
+    api_client.pool_monitor = PoolMonitor(api_client, min_size=8, max_size=64)
+    ...
+    print(api_client.pool_monitor.stats())
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import urllib3
+from urllib3.connectionpool import HTTPConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+def _pool_internals_supported() -> bool:
+    """
+    Indica si urllib3 expone los internos del pool que usa este módulo.
+
+    ``prewarm`` y ``PoolMonitor`` usan API privada de ``HTTPConnectionPool``
+    (``_get_conn``/``_put_conn`` y la cola ``pool``), verificada con urllib3
+    2.x. Con otra versión mayor se desactivan en lugar de fallar.
+    """
+    major = urllib3.__version__.split(".")[0]
+    return major == "2" and all(
+        hasattr(HTTPConnectionPool, name) for name in ("_get_conn", "_put_conn")
+    )
+
+
+POOL_INTERNALS = _pool_internals_supported()
+
+
+def _checkout(pool: Any, count: int) -> List[Any]:
+    """Saca ``count`` conexiones (abiertas o no) de la cola del pool."""
+    return [pool._get_conn() for _ in range(count)]
+
+
+def _checkin(pool: Any, conns: List[Any]) -> None:
+    """Devuelve conexiones a la cola del pool."""
+    for conn in conns:
+        pool._put_conn(conn)
+
+
+def _set_maxsize(pool: Any, size: int) -> None:
+    """Cambia el tamaño de la cola de un pool y cierra las conexiones que
+    ya no caben.
+
+    La cola es LIFO: ``_get_conn`` entrega la conexión usada más
+    recientemente. Al reducir se descartan primero los huecos sin conexión y
+    después las conexiones del fondo de la cola (las más frías), de modo que
+    las calientes siguen disponibles.
+    """
+    if pool.pool is None:
+        return
+    with pool.pool.mutex:
+        pool.pool.maxsize = size
+        idle = pool.pool.queue
+        excess = len(idle) - size
+        while excess > 0 and None in idle:
+            idle.remove(None)
+            excess -= 1
+        dropped = idle[: max(excess, 0)]
+        del idle[: max(excess, 0)]
+    for conn in dropped:
+        conn.close()
+
+
+def host_pool(api_client: Any, url: Optional[str] = None) -> Any:
+    """
+    Obtiene el pool de urllib3 asociado a un host.
+
+    Args:
+        api_client: ``ApiClient`` cuyo transporte se usa
+        url: URL del host; por defecto ``configuration.host``
+
+    Returns:
+        ``HTTPConnectionPool`` (o ``HTTPSConnectionPool``) del host
+    """
+    pool_manager = api_client.rest_client.pool_manager
+    return pool_manager.connection_from_url(url or api_client.configuration.host)
+
+
+def prewarm(api_client: Any, connections: int, url: Optional[str] = None) -> int:
+    """
+    Abre conexiones keep-alive en paralelo y las deja en el pool.
+
+    Los errores de conexión se registran en el log y no se propagan: el
+    pre-calentamiento es una optimización y la petición real volverá a
+    intentar conectar.
+
+    Args:
+        api_client: ``ApiClient`` cuyo pool se calienta
+        connections: Número de conexiones a abrir (se limita al tamaño del
+            pool)
+        url: URL del host; por defecto ``configuration.host``
+
+    Returns:
+        Número de conexiones abiertas (0 si el transporte no usa urllib3, si
+        se reproduce una grabación o si la versión de urllib3 no es
+        compatible)
+    """
+    configuration = api_client.configuration
+    if configuration.recording_path is not None and (
+        configuration.recording_mode == "replay"
+    ):
+        # RecordReplayClientObject delega pool_manager en el transporte real;
+        # en reproducción no se debe abrir ninguna conexión.
+        return 0
+    if not hasattr(api_client.rest_client, "pool_manager"):
+        return 0
+    if not POOL_INTERNALS:
+        logger.debug("prewarm desactivado con urllib3 %s", urllib3.__version__)
+        return 0
+    pool = host_pool(api_client, url)
+    connections = min(connections, pool.pool.maxsize)
+    if connections <= 0:
+        return 0
+
+    conns = _checkout(pool, connections)
+
+    def connect(conn: Any) -> bool:
+        try:
+            conn.connect()
+            return True
+        except Exception as exc:
+            logger.debug("No se pudo pre-abrir una conexión a %s: %s", pool.host, exc)
+            return False
+
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        opened = list(executor.map(connect, conns))
+    _checkin(pool, conns)
+    return sum(opened)
+
+
+class PoolMonitor:
+    """
+    Control de concurrencia y tamaño adaptativo del pool de un ``ApiClient``.
+
+    ``ApiClient.call_api`` llama a ``acquire`` antes de cada petición de red y
+    a ``release`` cuando el cuerpo ya se leyó (la conexión volvió al pool).
+
+    Attributes:
+        min_size: Tamaño mínimo del pool
+        max_size: Tamaño máximo del pool
+        window: Segundos de la ventana usada para reducir el pool
+        size: Tamaño actual del pool
+    """
+
+    def __init__(
+        self,
+        api_client: Any,
+        min_size: int = 4,
+        max_size: int = 64,
+        window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa el monitor y ajusta el pool al tamaño inicial.
+
+        Args:
+            api_client: ``ApiClient`` cuyo pool se controla
+            min_size: Tamaño mínimo del pool
+            max_size: Tamaño máximo del pool
+            window: Segundos tras los que se reduce el pool si la demanda
+                máxima fue menor que su tamaño
+            clock: Función que retorna el tiempo actual en segundos
+
+        Raises:
+            ValueError: Si ``min_size`` no está entre 1 y ``max_size``
+        """
+        if not 1 <= min_size <= max_size:
+            raise ValueError(
+                f"Se requiere 1 <= min_size <= max_size: {min_size}, {max_size}"
+            )
+        self.api_client = api_client
+        self.min_size = min_size
+        self.max_size = max_size
+        self.window = window
+        self._clock = clock
+        self._cond = threading.Condition()
+
+        configured = api_client.configuration.connection_pool_maxsize or min_size
+        self.size = max(min_size, min(max_size, configured))
+        self._in_flight = 0
+        self._demand = 0
+        self._peak = 0
+        self._window_start = clock()
+
+        self.requests = 0
+        self.waited = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self.resizes: List[int] = []
+        self._resize(self.size)
+
+    def acquire(self) -> float:
+        """
+        Reserva una conexión para una petición.
+
+        Si todas las conexiones están en uso y el pool no llegó a
+        ``max_size`` se agranda en una conexión; si ya llegó, espera a que
+        otra petición termine.
+
+        Returns:
+            Segundos de espera
+        """
+        with self._cond:
+            self._demand += 1
+            self._peak = max(self._peak, self._demand)
+            self.requests += 1
+            if self._in_flight >= self.size and self.size < self.max_size:
+                self._resize(self.size + 1)
+
+            waited = 0.0
+            if self._in_flight >= self.size:
+                self.waited += 1
+                started = self._clock()
+                while self._in_flight >= self.size:
+                    self._cond.wait()
+                waited = self._clock() - started
+                self.wait_time += waited
+                self.max_wait = max(self.max_wait, waited)
+            self._in_flight += 1
+            return waited
+
+    def release(self) -> None:
+        """Libera la conexión de una petición y reduce el pool si sobra."""
+        with self._cond:
+            self._in_flight -= 1
+            self._demand -= 1
+            self._cond.notify()
+
+            now = self._clock()
+            if now - self._window_start >= self.window:
+                target = max(self.min_size, self._peak)
+                if target < self.size:
+                    self._resize(target)
+                self._peak = self._demand
+                self._window_start = now
+
+    def _resize(self, size: int) -> None:
+        """Cambia el tamaño del pool de urllib3 (actual y de los hosts nuevos)."""
+        self.size = size
+        self.resizes.append(size)
+        pool_manager = getattr(self.api_client.rest_client, "pool_manager", None)
+        if pool_manager is None:
+            # transporte sin pool de urllib3 (ej: HTTP/2): sólo se limita
+            # la concurrencia
+            return
+        pool_manager.connection_pool_kw["maxsize"] = size
+        if not POOL_INTERNALS:
+            # sólo los pools nuevos usan el tamaño actualizado
+            return
+        for key in pool_manager.pools.keys():
+            pool = pool_manager.pools.get(key)
+            if pool is not None:
+                _set_maxsize(pool, size)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtiene las métricas del pool.
+
+        Returns:
+            Diccionario con ``size``, ``in_flight``, ``peak``, ``requests``,
+            ``waited``, ``saturation`` (fracción de peticiones que esperaron),
+            ``wait_time`` (segundos totales), ``mean_wait`` y ``max_wait``
+        """
+        with self._cond:
+            return {
+                "size": self.size,
+                "in_flight": self._in_flight,
+                "peak": self._peak,
+                "requests": self.requests,
+                "waited": self.waited,
+                "saturation": self.waited / self.requests if self.requests else 0.0,
+                "wait_time": self.wait_time,
+                "mean_wait": self.wait_time / self.waited if self.waited else 0.0,
+                "max_wait": self.max_wait,
+            }
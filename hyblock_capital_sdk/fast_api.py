@@ -0,0 +1,126 @@
+"""
+Variantes de las APIs generadas sin validación de argumentos.
+
+Cada método público de las APIs generadas está decorado con
+``@validate_call`` de pydantic, que valida los argumentos
+(``Annotated[StrictStr, Field(...)]``...) en cada llamada. En bucles de
+polling con argumentos ya conocidos ese coste es innecesario. Este módulo
+ofrece dos formas de evitarlo, manteniendo las mismas firmas:
+
+- ``fast_api(OrderflowApi)`` retorna una subclase (``FastOrderflowApi``)
+  cuyos métodos llaman directamente a la función original, sin validar;
+- ``set_argument_validation(False)`` desactiva la validación en todas las
+  clases de ``hyblock_capital_sdk.api`` para todo el proceso, y
+  ``set_argument_validation(True)`` la restaura.
+
+Sin validación un argumento de tipo incorrecto no lanza
+``ValidationError``: se envía tal cual (ej: ``limit="10"``) y el error, si lo
+hay, llega desde la API.
+
+Example:
+    orderflow_api = fast_api(hc.OrderflowApi)(api_client)
+    while True:
+        klines = orderflow_api.klines_get(
+            coin="BTC", timeframe="1m", exchange="binance"
+        )
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Protocol, Tuple, Type
+
+from . import api
+
+
+class _ValidatedMethod(Protocol):
+    """Método envuelto por ``@validate_call``."""
+
+    raw_function: Callable[..., Any]
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        ...
+
+
+_lock = threading.Lock()
+_fast_classes: Dict[type, type] = {}
+# métodos originales (con validación) de las clases desactivadas
+_validated: Dict[Tuple[type, str], _ValidatedMethod] = {}
+
+
+def _validated_methods(api_cls: type) -> Dict[str, _ValidatedMethod]:
+    """Métodos de una clase decorados con ``@validate_call``."""
+    methods = {}
+    for name, method in vars(api_cls).items():
+        method = _validated.get((api_cls, name), method)
+        if not name.startswith("_") and hasattr(method, "raw_function"):
+            methods[name] = method
+    return methods
+
+
+def fast_api(api_cls: Type[Any]) -> Type[Any]:
+    """
+    Obtiene la variante sin validación de argumentos de una API generada.
+
+    Args:
+        api_cls: Clase de ``hyblock_capital_sdk.api`` (ej: ``OrderflowApi``)
+
+    Returns:
+        Subclase ``Fast<Nombre>`` con los mismos métodos y firmas
+
+    Raises:
+        TypeError: Si la clase no tiene métodos con ``@validate_call``
+    """
+    with _lock:
+        fast_cls = _fast_classes.get(api_cls)
+        if fast_cls is None:
+            methods = _validated_methods(api_cls)
+            if not methods:
+                raise TypeError(
+                    f"{api_cls.__name__} no tiene métodos con validate_call"
+                )
+            fast_cls = type(
+                f"Fast{api_cls.__name__}",
+                (api_cls,),
+                {
+                    "__module__": __name__,
+                    "__doc__": api_cls.__doc__,
+                    **{name: m.raw_function for name, m in methods.items()},
+                },
+            )
+            _fast_classes[api_cls] = fast_cls
+        return fast_cls
+
+
+def set_argument_validation(enabled: bool) -> None:
+    """
+    Activa o desactiva la validación de argumentos en todas las APIs.
+
+    Reemplaza los métodos de las clases de ``hyblock_capital_sdk.api`` (y por
+    tanto afecta a todas sus instancias, en todos los hilos).
+
+    Args:
+        enabled: False para desactivar la validación, True para restaurarla
+    """
+    with _lock:
+        for api_cls in _api_classes():
+            if enabled:
+                for name in list(vars(api_cls)):
+                    original = _validated.pop((api_cls, name), None)
+                    if original is not None:
+                        setattr(api_cls, name, original)
+            else:
+                for name, method in _validated_methods(api_cls).items():
+                    _validated[(api_cls, name)] = method
+                    setattr(api_cls, name, method.raw_function)
+
+
+def argument_validation_enabled() -> bool:
+    """Indica si las APIs generadas validan sus argumentos."""
+    return not _validated
+
+
+def _api_classes() -> List[type]:
+    return [
+        value
+        for name, value in vars(api).items()
+        if name.endswith("Api") and isinstance(value, type)
+    ]
@@ -0,0 +1,191 @@
+"""
+Transporte HTTP/2 alternativo a ``rest.RESTClientObject``.
+
+Con cientos de GETs pequeños y concurrentes al único host de Hyblock, un pool
+HTTP/1.1 necesita una conexión por petición en curso y sufre bloqueo de
+cabeza de línea. ``HTTP2ClientObject`` tiene la misma interfaz que
+``RESTClientObject`` pero multiplexa las peticiones sobre unas pocas
+conexiones HTTP/2 usando httpx.
+
+httpx es una dependencia opcional: instálala con
+``pip install hyblock-capital-sdk[http2]``. El transporte se elige en la
+configuración:
+
+Example:
+    config = hc.Configuration(host="https://api1.hyblockcapital.com/v1")
+    config.transport = "http2"
+    api_client = hc.ApiClient(config)  # api_client.rest_client es HTTP2ClientObject
+"""
+
+import json
+import re
+import ssl
+from typing import Any, Optional
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover - depende del entorno
+    raise ImportError(
+        "El transporte HTTP/2 requiere httpx. "
+        "Instálalo con: pip install hyblock-capital-sdk[http2]"
+    ) from e
+
+from .exceptions import ApiException, ApiValueError
+from .rest import RESTResponse
+
+
+class HTTP2Response:
+    """Adapta ``httpx.Response`` a la interfaz que usa ``RESTResponse``."""
+
+    def __init__(self, response: "httpx.Response"):
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.data = response.content
+        self.headers = response.headers
+        self.http_version = response.http_version
+
+
+class HTTP2ClientObject:
+    """
+    Cliente HTTP/2 con la interfaz de ``rest.RESTClientObject``.
+
+    Todas las peticiones comparten un ``httpx.Client``, que abre como máximo
+    ``connection_pool_maxsize`` conexiones y multiplexa las peticiones
+    concurrentes sobre ellas. Para hosts ``http://`` se usa HTTP/2 sin TLS
+    (prior knowledge), útil para servidores de prueba locales.
+
+    Attributes:
+        client: ``httpx.Client`` subyacente
+    """
+
+    def __init__(self, configuration: Any) -> None:
+        """
+        Inicializa el cliente a partir de la configuración del SDK.
+
+        Args:
+            configuration: ``Configuration`` del SDK (TLS, proxy, pool y
+                reintentos)
+        """
+        verify: Any = configuration.verify_ssl
+        ca_cert = configuration.ssl_ca_cert or configuration.ca_cert_data
+        if configuration.cert_file or (verify and ca_cert):
+            # el certificado de cliente (mTLS) sólo se puede cargar en un
+            # SSLContext, también con la verificación por defecto
+            verify = ssl.create_default_context(
+                cafile=configuration.ssl_ca_cert, cadata=configuration.ca_cert_data
+            )
+            if not configuration.verify_ssl:
+                verify.check_hostname = False
+                verify.verify_mode = ssl.CERT_NONE
+            if configuration.cert_file:
+                verify.load_cert_chain(configuration.cert_file, configuration.key_file)
+
+        maxsize = configuration.connection_pool_maxsize
+        limits = httpx.Limits(
+            max_connections=maxsize, max_keepalive_connections=maxsize
+        )
+        retries = getattr(configuration.retries, "total", configuration.retries)
+        retries = retries if isinstance(retries, int) else 0
+
+        # hosts http:// (servidores locales) usan HTTP/2 sin TLS
+        http1 = not configuration.host.startswith("http://")
+        transport = httpx.HTTPTransport(
+            http1=http1,
+            http2=True,
+            verify=verify,
+            limits=limits,
+            proxy=configuration.proxy or None,
+            retries=retries,
+        )
+        self.client = httpx.Client(transport=transport)
+
+    def close(self) -> None:
+        """Cierra las conexiones abiertas."""
+        self.client.close()
+
+    def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ):
+        """
+        Realiza una petición, con los mismos parámetros que
+        ``RESTClientObject.request``.
+
+        Returns:
+            ``RESTResponse`` con el cuerpo ya descargado
+
+        Raises:
+            ApiValueError: Si se indican ``body`` y ``post_params`` a la vez
+            ApiException: Si falla la negociación TLS, o si los argumentos no
+                coinciden con el content type declarado
+        """
+        method = method.upper()
+        assert method in ["GET", "HEAD", "DELETE", "POST", "PUT", "PATCH", "OPTIONS"]
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = dict(headers or {})
+        kwargs: dict = {"headers": headers, "timeout": self._timeout(_request_timeout)}
+
+        if method in ["POST", "PUT", "PATCH", "OPTIONS", "DELETE"]:
+            content_type = headers.get("Content-Type")
+            if not content_type or re.search("json", content_type, re.IGNORECASE):
+                if body is not None:
+                    kwargs["content"] = json.dumps(body)
+            elif content_type == "application/x-www-form-urlencoded":
+                kwargs["data"] = dict(post_params)
+            elif content_type == "multipart/form-data":
+                # httpx genera el Content-Type con el boundary
+                del headers["Content-Type"]
+                kwargs["data"] = {
+                    k: json.dumps(v) if isinstance(v, dict) else v
+                    for k, v in post_params
+                    if not isinstance(v, tuple)
+                }
+                kwargs["files"] = [
+                    (k, v) for k, v in post_params if isinstance(v, tuple)
+                ]
+            elif isinstance(body, (str, bytes)):
+                kwargs["content"] = body
+            elif content_type.startswith("text/") and isinstance(body, bool):
+                kwargs["content"] = "true" if body else "false"
+            else:
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        try:
+            response = self.client.request(method, url, **kwargs)
+        except httpx.ConnectError as e:
+            if not isinstance(e.__context__, ssl.SSLError):
+                raise
+            msg = "\n".join([type(e.__context__).__name__, str(e.__context__)])
+            raise ApiException(status=0, reason=msg)
+
+        return RESTResponse(HTTP2Response(response))
+
+    @staticmethod
+    def _timeout(request_timeout: Optional[Any]) -> Any:
+        """
+        Convierte ``_request_timeout`` al formato de httpx.
+
+        Sin timeout se usa el por defecto del ``httpx.Client`` (5 segundos);
+        pasar None a httpx desactivaría todos los timeouts.
+        """
+        if isinstance(request_timeout, (int, float)) and request_timeout:
+            return httpx.Timeout(request_timeout)
+        if isinstance(request_timeout, tuple) and len(request_timeout) == 2:
+            return httpx.Timeout(
+                None, connect=request_timeout[0], read=request_timeout[1]
+            )
+        return httpx.USE_CLIENT_DEFAULT
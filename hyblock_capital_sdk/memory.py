@@ -0,0 +1,486 @@
+"""
+Contabilidad de memoria de respuestas y cachés.
+
+Un ``MemoryTracker`` asignado a ``ApiClient.memory_tracker`` registra cada
+respuesta deserializada (el modelo o lista retornado y el ``ApiResponse``
+con el cuerpo crudo) mientras siga viva, agrupada por endpoint, junto con
+las ``ResponseCache`` de los clientes que lo usan. Con un presupuesto
+(``budget``), cuando la memoria estimada lo supera:
+
+1. se desalojan las entradas más antiguas de las cachés;
+2. sólo con ``compact=True``, las respuestas nuevas grandes
+   (``compact_min_rows`` filas o más) pasan a ``CompactRows``, una secuencia
+   columnar de sólo lectura que guarda cada campo en un ``array`` y
+   reconstruye las filas al accederlas.
+
+Compactar cambia el tipo retornado por los endpoints de lista: se recibe un
+``CompactRows`` (sin ``append`` ni asignación de elementos) en lugar de una
+``list``, y las listas de ``additional_properties`` (ej: ``data``) de un
+modelo nuevo también pasan a ``CompactRows``. Por eso es opcional. Las
+respuestas ya entregadas nunca se modifican: el tracker sólo compacta la
+respuesta que está registrando, antes de retornarla.
+
+Un mismo tracker puede compartirse entre varios ``ApiClient`` para tener un
+presupuesto global. Los tamaños son estimaciones (``estimate_size``
+muestrea las listas grandes).
+
+Example:
+    tracker = MemoryTracker(budget=512 * 1024**2, compact=True)
+    api_client.memory_tracker = tracker
+    ...
+    print(tracker.report()["endpoints"]["/liquidationHeatmap"])
+"""
+
+import logging
+import sys
+import threading
+import weakref
+from array import array
+from collections.abc import Sequence
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple, Type
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPACT_MIN_ROWS = 1000
+# Elementos de un contenedor que se recorren al estimar su tamaño.
+SAMPLE_SIZE = 64
+
+_ATOMIC = (str, bytes, bytearray, int, float, bool, type(None), array)
+_MISSING = object()
+
+
+def estimate_size(obj: Any, sample: int = SAMPLE_SIZE) -> int:
+    """
+    Estima la memoria retenida por un objeto y todo lo que referencia.
+
+    Los contenedores con más de ``sample`` elementos se estiman recorriendo
+    sólo los primeros ``sample`` y extrapolando. Los objetos compartidos se
+    cuentan una vez.
+
+    Args:
+        obj: Objeto a medir (modelo, lista, diccionario...)
+        sample: Elementos a recorrer por contenedor
+
+    Returns:
+        Bytes aproximados
+    """
+    seen = set()
+    total = 0.0
+    stack: List[Tuple[Any, float]] = [(obj, 1.0)]
+    while stack:
+        item, weight = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item) * weight
+        if isinstance(item, _ATOMIC):
+            continue
+
+        scale = 1.0
+        if isinstance(item, dict):
+            children: List[Any] = [*item.keys(), *item.values()]
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            children = list(islice(item, sample))
+            if len(item) > sample:
+                scale = len(item) / sample
+        elif isinstance(item, CompactRows):
+            children = [item._columns]
+        elif isinstance(item, BaseModel):
+            children = [item.__dict__, item.__pydantic_fields_set__]
+        elif hasattr(item, "__dict__") and not isinstance(item, type):
+            children = [item.__dict__]
+        else:
+            continue
+        stack.extend((child, weight * scale) for child in children)
+    return int(total)
+
+
+def _compact_column(values: List[Any]) -> Any:
+    """Convierte los valores de un campo en la representación más compacta."""
+    kinds = {type(value) for value in values}
+    if kinds == {float}:
+        return array("d", values)
+    if kinds == {int}:
+        try:
+            return array("q", values)
+        except OverflowError:
+            pass
+    # Strings repetidos (side, exchange...) comparten un único objeto.
+    unique: Dict[Any, Any] = {}
+    column = []
+    for value in values:
+        if isinstance(value, str):
+            value = unique.setdefault(value, value)
+        column.append(value)
+    return column
+
+
+class CompactRows(Sequence):
+    """
+    Lista de filas guardada por columnas.
+
+    Ocupa una fracción de la memoria de una lista de modelos o diccionarios:
+    los campos numéricos se guardan en ``array`` de 8 bytes por valor y los
+    strings repetidos se comparten. Es de sólo lectura; cada acceso
+    reconstruye la fila (diccionario o modelo, según la lista original).
+    ``to_list()`` materializa todas las filas.
+
+    Attributes:
+        fields: Nombres de las columnas
+        model: Clase de modelo de las filas, o None si son diccionarios
+    """
+
+    __slots__ = ("fields", "model", "_columns", "_length", "__weakref__")
+
+    def __init__(self, rows: List[Any]):
+        """
+        Compacta una lista de filas.
+
+        Args:
+            rows: Lista de modelos pydantic de una misma clase o de
+                diccionarios
+        """
+        self._length = len(rows)
+        self.model: Optional[Type[BaseModel]] = None
+        first = rows[0] if rows else None
+        if isinstance(first, BaseModel):
+            self.model = type(first)
+            records = [row.__dict__ for row in rows]
+            # campos vacíos en todas las filas (additional_properties) se
+            # omiten: el valor por defecto del modelo los reconstruye
+            self.fields = tuple(
+                field
+                for field in self.model.model_fields
+                if any(record.get(field) != {} for record in records)
+            )
+        else:
+            fields: Dict[str, None] = {}
+            for row in rows:
+                fields.update(dict.fromkeys(row))
+            self.fields = tuple(fields)
+            records = rows
+        self._columns = {
+            field: _compact_column([record.get(field, _MISSING) for record in records])
+            for field in self.fields
+        }
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("CompactRows index out of range")
+        return self._row(index)
+
+    def __iter__(self):
+        for i in range(self._length):
+            yield self._row(i)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (CompactRows, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        model = self.model.__name__ if self.model else "dict"
+        return f"CompactRows({model}, rows={self._length}, fields={self.fields})"
+
+    def column(self, field: str) -> Any:
+        """
+        Obtiene una columna sin reconstruir las filas.
+
+        Args:
+            field: Nombre del campo
+
+        Returns:
+            ``array`` para columnas numéricas, lista para el resto
+        """
+        return self._columns[field]
+
+    def to_list(self) -> List[Any]:
+        """Reconstruye todas las filas como una lista."""
+        return list(self)
+
+    def _row(self, i: int) -> Any:
+        values = {}
+        for field, column in self._columns.items():
+            value = column[i]
+            if value is not _MISSING:
+                values[field] = value
+        if self.model is None:
+            return values
+        return self.model.model_construct(**values)
+
+
+class ResponseList(list):
+    """Lista retornada por una respuesta registrada (admite ``weakref``)."""
+
+    __slots__ = ("__weakref__",)
+
+
+def endpoint_of(url: Optional[str], host: str = "") -> str:
+    """
+    Obtiene el endpoint (ruta relativa al host) de una URL.
+
+    Args:
+        url: URL completa de la petición
+        host: Host configurado, incluida su ruta base (ej: ".../v1")
+
+    Returns:
+        Ruta del recurso (ej: "/klines"), o "-" si no se conoce la URL
+    """
+    if not url:
+        return "-"
+    if host and url.startswith(host):
+        url = url[len(host) :]
+    return urlsplit(url).path or "/"
+
+
+def _rows_of(data: Any) -> int:
+    """Filas de una respuesta deserializada (listas y listas en modelos)."""
+    if isinstance(data, (list, CompactRows)):
+        return len(data)
+    if isinstance(data, BaseModel):
+        extra = getattr(data, "additional_properties", None) or {}
+        lists = [v for v in extra.values() if isinstance(v, (list, CompactRows))]
+        return max((len(v) for v in lists), default=1)
+    return 0 if data is None else 1
+
+
+class _Entry:
+    __slots__ = ("endpoint", "nbytes", "rows", "compacted", "ref")
+
+    def __init__(self, endpoint: str, nbytes: int, rows: int, ref: Any):
+        self.endpoint = endpoint
+        self.nbytes = nbytes
+        self.rows = rows
+        self.compacted = False
+        self.ref = ref
+
+
+class MemoryTracker:
+    """
+    Registro de la memoria retenida por respuestas y cachés.
+
+    Attributes:
+        budget: Bytes máximos estimados (None = sin límite)
+        compact_min_rows: Filas a partir de las cuales una respuesta puede
+            compactarse
+        compact: Si se compactan las respuestas nuevas al superar el
+            presupuesto (cambia el tipo retornado, ver el módulo)
+        evicted: Entradas de caché desalojadas por el presupuesto
+        compacted: Respuestas compactadas por el presupuesto
+    """
+
+    def __init__(
+        self,
+        budget: Optional[int] = None,
+        compact_min_rows: int = DEFAULT_COMPACT_MIN_ROWS,
+        compact: bool = False,
+    ):
+        """
+        Inicializa el tracker.
+
+        Args:
+            budget: Bytes máximos estimados entre respuestas vivas y cachés
+            compact_min_rows: Filas mínimas para compactar una respuesta
+            compact: Retornar como ``CompactRows`` las respuestas grandes que
+                excedan el presupuesto; por defecto sólo se desalojan cachés
+        """
+        self.budget = budget
+        self.compact = compact
+        self.compact_min_rows = compact_min_rows
+        self.evicted = 0
+        self.compacted = 0
+        self._data: Dict[int, _Entry] = {}
+        self._raw: Dict[int, _Entry] = {}
+        # suma de nbytes de _data y _raw, actualizada al registrar, olvidar
+        # y compactar cada entrada
+        self._responses_bytes = 0
+        self._caches: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        # reentrante: los callbacks de weakref pueden ejecutarse en
+        # cualquier punto, incluso con el lock tomado por el mismo hilo
+        self._lock = threading.RLock()
+
+    @property
+    def total(self) -> int:
+        """Bytes estimados de respuestas vivas y cachés."""
+        return self.responses_bytes() + self.caches_bytes()
+
+    def responses_bytes(self) -> int:
+        """Bytes estimados de las respuestas vivas (datos y cuerpos crudos)."""
+        return self._responses_bytes
+
+    def caches_bytes(self) -> int:
+        """Bytes de los cuerpos guardados en las cachés registradas."""
+        return sum(cache.nbytes for cache in list(self._caches))
+
+    def add_cache(self, cache: Any) -> None:
+        """
+        Registra una caché (``ResponseCache``) para contarla y desalojarla.
+
+        Args:
+            cache: Caché con ``nbytes`` y ``shrink(max_bytes)``
+        """
+        self._caches.add(cache)
+
+    def track(
+        self, api_response: Any, url: Optional[str] = None, host: str = ""
+    ) -> None:
+        """
+        Registra una respuesta deserializada y aplica el presupuesto.
+
+        Con ``compact=True`` puede reemplazar ``api_response.data`` por su
+        versión compacta; las respuestas registradas antes no se modifican.
+
+        Args:
+            api_response: ``ApiResponse`` retornado por ``response_deserialize``
+            url: URL de la petición
+            host: Host configurado, para obtener el endpoint
+        """
+        endpoint = endpoint_of(url, host)
+        data = api_response.data
+        if type(data) is list:
+            data = api_response.data = ResponseList(data)
+        nbytes = estimate_size(data)
+        compacted = False
+
+        budget = self.budget
+        if budget is not None and self.total + nbytes > budget:
+            self._evict_caches(self.total + nbytes - budget)
+            if self.compact and self.total + nbytes > budget:
+                # sólo se compacta la respuesta aún no entregada
+                compact = self._compact(data)
+                if compact is not None:
+                    data = api_response.data = compact
+                    nbytes = estimate_size(data)
+                    compacted = True
+
+        with self._lock:
+            if compacted:
+                self.compacted += 1
+            entry = self._register(self._data, endpoint, data, nbytes)
+            if entry is not None:
+                entry.compacted = compacted
+            raw = len(api_response.raw_data or b"")
+            self._register(self._raw, endpoint, api_response, raw)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Obtiene el uso de memoria estimado.
+
+        Returns:
+            Diccionario con ``total``, ``budget``, ``responses``, ``caches``
+            (bytes), ``evicted``, ``compacted`` y ``endpoints``: por endpoint,
+            ``responses`` vivas, ``bytes`` de los datos, ``raw_bytes`` de los
+            cuerpos, ``rows`` y ``compacted``
+        """
+        endpoints: Dict[str, Dict[str, int]] = {}
+
+        def stats(endpoint: str) -> Dict[str, int]:
+            return endpoints.setdefault(
+                endpoint,
+                {"responses": 0, "bytes": 0, "raw_bytes": 0, "rows": 0, "compacted": 0},
+            )
+
+        with self._lock:
+            for entry in self._data.values():
+                item = stats(entry.endpoint)
+                item["responses"] += 1
+                item["bytes"] += entry.nbytes
+                item["rows"] += entry.rows
+                item["compacted"] += entry.compacted
+            for entry in self._raw.values():
+                stats(entry.endpoint)["raw_bytes"] += entry.nbytes
+        responses = self.responses_bytes()
+        caches = self.caches_bytes()
+        return {
+            "total": responses + caches,
+            "budget": self.budget,
+            "responses": responses,
+            "caches": caches,
+            "evicted": self.evicted,
+            "compacted": self.compacted,
+            "endpoints": endpoints,
+        }
+
+    def _register(
+        self, table: Dict[int, _Entry], endpoint: str, obj: Any, nbytes: int
+    ) -> Optional[_Entry]:
+        key = id(obj)
+
+        def forget(_: Any) -> None:
+            self._forget(table, key)
+
+        try:
+            ref = weakref.ref(obj, forget)
+        except TypeError:
+            # valores que no admiten weakref (None, str...): no se retienen
+            return None
+        self._forget(table, key)
+        entry = table[key] = _Entry(endpoint, nbytes, _rows_of(obj), ref)
+        self._responses_bytes += nbytes
+        return entry
+
+    def _forget(self, table: Dict[int, _Entry], key: int) -> None:
+        with self._lock:
+            entry = table.pop(key, None)
+            if entry is not None:
+                self._responses_bytes -= entry.nbytes
+
+    def _evict_caches(self, excess: int) -> None:
+        evicted = 0
+        for cache in list(self._caches):
+            if excess <= 0:
+                break
+            before = cache.nbytes
+            evicted += cache.shrink(max(0, before - excess))
+            excess -= before - cache.nbytes
+        with self._lock:
+            self.evicted += evicted
+        if evicted:
+            logger.info(
+                "Presupuesto de memoria superado: %d entradas desalojadas", evicted
+            )
+
+    def _compact(self, data: Any) -> Any:
+        """
+        Compacta una respuesta si es lo bastante grande.
+
+        Returns:
+            ``CompactRows`` que reemplaza a una lista, el mismo modelo si se
+            compactaron sus listas internas, o None si no hubo cambios
+        """
+        if isinstance(data, list):
+            if len(data) >= self.compact_min_rows and _compactable(data):
+                return CompactRows(data)
+            return None
+        extra = getattr(data, "additional_properties", None)
+        if not isinstance(data, BaseModel) or not isinstance(extra, dict):
+            return None
+        changed = False
+        for key, value in list(extra.items()):
+            if (
+                isinstance(value, list)
+                and len(value) >= self.compact_min_rows
+                and _compactable(value)
+            ):
+                extra[key] = CompactRows(value)
+                changed = True
+        return data if changed else None
+
+
+def _compactable(rows: List[Any]) -> bool:
+    first = rows[0]
+    if isinstance(first, BaseModel):
+        cls = type(first)
+        return all(type(row) is cls for row in rows)
+    return all(isinstance(row, dict) for row in rows)
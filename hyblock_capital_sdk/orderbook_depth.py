@@ -0,0 +1,356 @@
+"""
+Planificador de consultas de orderbook por profundidad.
+
+Los endpoints de ``OrderbookApi`` (``asks_increase_decrease_get``,
+``bid_ask_ratio_get``, ``combined_book_get``, ...) aceptan ``depth`` como un
+rango ``"desde,hasta"``: ``"0,full"`` retorna todos los buckets de
+profundidad en una sola llamada. ``DepthPlanner`` agrupa las consultas por
+profundidad que sólo difieren en ``depth``, las convierte en la mínima
+cantidad de consultas por rango, separa la respuesta combinada en una serie
+por profundidad y guarda cada serie en caché.
+
+Example:
+    orderbook_api = hc.OrderbookApi(api_client)
+    planner = DepthPlanner(ttl=60)
+
+    params = {"coin": "BTC", "exchange": "binance", "timeframe": "5m"}
+    ratio_1, ratio_5, ratio_20 = planner.fetch(
+        [
+            DepthRequest(orderbook_api.bid_ask_ratio_get, "1", params),
+            DepthRequest(orderbook_api.bid_ask_ratio_get, "5", params),
+            DepthRequest(orderbook_api.bid_ask_ratio_get, "20", params),
+        ]
+    )  # Una sola llamada con depth="1,20"
+"""
+
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from .series import as_records, open_date_of
+from .sync import endpoint_client, endpoint_name
+
+# Niveles válidos del parámetro depth, de menor a mayor profundidad. "0" sólo
+# sirve como límite inferior: no tiene bucket propio.
+DEPTH_LEVELS: Tuple[str, ...] = ("0", "quote", "1", "2", "5", "10", "20", "full")
+
+_RANK = {level: rank for rank, level in enumerate(DEPTH_LEVELS)}
+
+# Buckets de la respuesta documentada de depth="0,full": los rangos con
+# límite inferior "0" no incluyen el bucket "2" (sí "quote,20").
+FULL_RANGE_LEVELS: Tuple[str, ...] = ("quote", "1", "5", "10", "20", "full")
+
+# Claves con las que la API etiqueta el bucket de cada registro.
+DEPTH_KEYS = ("depth", "depthRange", "bucket")
+
+ParamsKey = Tuple[Tuple[str, Any], ...]
+# (endpoint, nivel, parámetros, ApiClient del endpoint)
+SeriesKey = Tuple[str, str, ParamsKey, Any]
+
+
+def normalize_level(level: Any) -> str:
+    """
+    Normaliza un nivel de profundidad (ej: ``5``, ``"5%"``, ``"FULL"``).
+
+    Args:
+        level: Nivel de profundidad
+
+    Returns:
+        Nivel como aparece en ``DEPTH_LEVELS``
+
+    Raises:
+        ValueError: Si el nivel no es válido
+    """
+    text = str(level).strip().rstrip("%").lower()
+    if text.endswith(".0"):
+        text = text[:-2]
+    if text not in _RANK:
+        raise ValueError(
+            f"Profundidad inválida: {level!r}. "
+            f"Valores válidos: {', '.join(DEPTH_LEVELS)}"
+        )
+    return text
+
+
+def depth_levels(depth: str) -> Tuple[str, ...]:
+    """
+    Obtiene los buckets que retorna un rango de profundidad.
+
+    Sigue la documentación de la API: un rango desde ``"0"`` retorna los
+    buckets de ``FULL_RANGE_LEVELS`` (sin ``"2"``) y uno desde ``"quote"`` o
+    mayor, todos los niveles intermedios.
+
+    Args:
+        depth: Rango ``"desde,hasta"`` (ej: ``"quote,20"``) o un nivel suelto
+
+    Returns:
+        Niveles incluidos en el rango, sin el límite inferior ``"0"``
+
+    Raises:
+        ValueError: Si el rango no es válido
+    """
+    parts = [part for part in str(depth).split(",") if part.strip()]
+    if len(parts) == 1:
+        parts = parts * 2
+    if len(parts) != 2:
+        raise ValueError(f"El rango de profundidad debe tener dos valores: {depth!r}")
+    low, high = (_RANK[normalize_level(part)] for part in parts)
+    if low > high:
+        raise ValueError(f"Rango de profundidad invertido: {depth!r}")
+    levels = DEPTH_LEVELS[low : high + 1]
+    if low == _RANK["0"]:
+        return tuple(level for level in levels if level in FULL_RANGE_LEVELS)
+    return levels
+
+
+def depth_range(levels: Iterable[str]) -> str:
+    """
+    Construye el rango mínimo que cubre un conjunto de niveles.
+
+    Args:
+        levels: Niveles de profundidad
+
+    Returns:
+        Rango ``"desde,hasta"`` para el parámetro ``depth``
+    """
+    ranks = sorted(_RANK[normalize_level(level)] for level in levels)
+    return f"{DEPTH_LEVELS[ranks[0]]},{DEPTH_LEVELS[ranks[-1]]}"
+
+
+class DepthRequest(NamedTuple):
+    """Consulta de una serie de orderbook en un único nivel de profundidad."""
+
+    endpoint: Callable[..., Any]
+    depth: str
+    params: Mapping[str, Any]
+
+    @property
+    def key(self) -> SeriesKey:
+        """Clave (endpoint, nivel, parámetros, cliente) de la serie."""
+        return _series_key(self.endpoint, self.depth, self.params)
+
+
+class PlannedRequest(NamedTuple):
+    """Consulta por rango que cubre varias ``DepthRequest``."""
+
+    endpoint: Callable[..., Any]
+    depth: str
+    params: Mapping[str, Any]
+    levels: Tuple[str, ...]
+
+    def __call__(self) -> Any:
+        return self.endpoint(depth=self.depth, **self.params)
+
+
+def _params_key(params: Mapping[str, Any]) -> ParamsKey:
+    """Clave hashable con los parámetros de una consulta, sin ``depth``."""
+    return tuple(sorted((k, v) for k, v in params.items() if k != "depth"))
+
+
+def _series_key(
+    endpoint: Callable[..., Any], level: str, params: Mapping[str, Any]
+) -> SeriesKey:
+    """Clave de una serie; incluye el cliente para no compartir resultados
+    entre ``ApiClient`` con distinto host o API key."""
+    return (
+        endpoint_name(endpoint),
+        normalize_level(level),
+        _params_key(params),
+        endpoint_client(endpoint),
+    )
+
+
+def _record_depth(record: Any) -> Optional[str]:
+    """Obtiene la etiqueta de profundidad de un registro, si la tiene."""
+    if isinstance(record, Mapping):
+        source = record
+    else:
+        source = getattr(record, "additional_properties", None) or {}
+        value = getattr(record, "depth", None)
+        if value is not None:
+            return normalize_level(value)
+    for key in DEPTH_KEYS:
+        if source.get(key) is not None:
+            return normalize_level(source[key])
+    return None
+
+
+def split_by_depth(data: Any, levels: Iterable[str]) -> Dict[str, List[Any]]:
+    """
+    Separa una respuesta por rango en una serie por nivel de profundidad.
+
+    Si los registros traen su bucket (``depth``) se usa esa etiqueta; si no,
+    cada ``openDate`` debe tener un registro por nivel, en orden de
+    profundidad creciente. Como la API puede omitir el bucket ``"2"`` (ver
+    ``FULL_RANGE_LEVELS``), un ``openDate`` con un registro menos se asigna
+    a los niveles sin ``"2"``.
+
+    Args:
+        data: Respuesta del endpoint consultado con un rango
+        levels: Niveles incluidos en el rango consultado
+
+    Returns:
+        Diccionario nivel -> registros ordenados por ``openDate``
+
+    Raises:
+        ValueError: Si la respuesta no puede asignarse a los niveles
+    """
+    levels = tuple(normalize_level(level) for level in levels)
+    records = as_records(data)
+    series: Dict[str, List[Any]] = {level: [] for level in levels}
+
+    labelled = [_record_depth(record) for record in records]
+    if records and all(label is not None for label in labelled):
+        for record, label in zip(records, labelled):
+            if label in series:
+                series[label].append(record)
+    else:
+        groups: Dict[Any, List[Any]] = {}
+        for record in records:
+            groups.setdefault(open_date_of(record), []).append(record)
+        without_two = tuple(level for level in levels if level != "2")
+        for open_date, group in groups.items():
+            if len(group) == len(levels):
+                group_levels = levels
+            elif len(group) == len(without_two) < len(levels):
+                group_levels = without_two
+            else:
+                raise ValueError(
+                    f"No se puede separar por profundidad: openDate {open_date} "
+                    f"tiene {len(group)} registros para {len(levels)} niveles"
+                )
+            for level, record in zip(group_levels, group):
+                series[level].append(record)
+
+    for values in series.values():
+        values.sort(key=lambda record: open_date_of(record) or 0)
+    return series
+
+
+class DepthPlanner:
+    """
+    Agrupa consultas por profundidad en consultas por rango, con caché.
+
+    Attributes:
+        ttl: Segundos de validez de cada serie en caché
+    """
+
+    def __init__(self, ttl: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Inicializa el planificador.
+
+        Args:
+            ttl: Segundos de validez de cada serie en caché
+            clock: Función que retorna el tiempo actual en segundos
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self._cache: Dict[SeriesKey, Tuple[float, List[Any]]] = {}
+        self._lock = threading.Lock()
+
+    def plan(self, requests: Iterable[DepthRequest]) -> List[PlannedRequest]:
+        """
+        Calcula las consultas por rango que cubren las consultas dadas.
+
+        Las consultas al mismo endpoint (del mismo ``ApiClient``) con los
+        mismos parámetros (salvo ``depth``) se cubren con un único rango desde
+        el nivel menor al mayor.
+
+        Args:
+            requests: Consultas por nivel de profundidad
+
+        Returns:
+            Consultas por rango, en el orden de la primera consulta de cada
+            grupo
+
+        Raises:
+            ValueError: Si alguna profundidad no es válida
+        """
+        groups: Dict[Tuple[str, ParamsKey, Any], List[DepthRequest]] = {}
+        for request in requests:
+            endpoint, level, params, client = request.key
+            if level == "0":
+                raise ValueError("La profundidad '0' sólo es válida como límite")
+            groups.setdefault((endpoint, params, client), []).append(request)
+
+        planned = []
+        for group in groups.values():
+            depth = depth_range(request.depth for request in group)
+            first = group[0]
+            planned.append(
+                PlannedRequest(
+                    first.endpoint,
+                    depth,
+                    {k: v for k, v in first.params.items() if k != "depth"},
+                    depth_levels(depth),
+                )
+            )
+        return planned
+
+    def _cached(self, key: SeriesKey, now: float) -> Optional[List[Any]]:
+        """Obtiene una serie de la caché si sigue vigente."""
+        entry = self._cache.get(key)
+        if entry is None or now - entry[0] >= self.ttl:
+            return None
+        return entry[1]
+
+    def fetch(self, requests: Iterable[DepthRequest]) -> List[List[Any]]:
+        """
+        Obtiene las series pedidas con el mínimo de llamadas a la API.
+
+        Las series vigentes en caché no generan llamadas; el resto se agrupa
+        con ``plan`` y cada respuesta se separa por profundidad. Los niveles
+        extra que trae un rango también quedan en caché.
+
+        Args:
+            requests: Consultas por nivel de profundidad
+
+        Returns:
+            Registros de cada consulta, en el mismo orden que ``requests``
+        """
+        requests = list(requests)
+        now = self._clock()
+        missing = []
+        with self._lock:
+            for request in requests:
+                if self._cached(request.key, now) is None:
+                    missing.append(request)
+
+        for planned in self.plan(missing):
+            series = split_by_depth(planned(), planned.levels)
+            with self._lock:
+                for level, records in series.items():
+                    key = _series_key(planned.endpoint, level, planned.params)
+                    self._cache[key] = (now, records)
+
+        with self._lock:
+            return [self._cache.get(r.key, (now, []))[1] for r in requests]
+
+    def get(self, endpoint: Callable[..., Any], depth: str, **params: Any) -> List[Any]:
+        """
+        Obtiene la serie de un único nivel de profundidad.
+
+        Args:
+            endpoint: Método de ``OrderbookApi``
+            depth: Nivel de profundidad (ej: "5")
+            **params: Parámetros del endpoint (coin, exchange, timeframe...)
+
+        Returns:
+            Registros de esa profundidad
+        """
+        return self.fetch([DepthRequest(endpoint, depth, params)])[0]
+
+    def clear(self) -> None:
+        """Vacía la caché."""
+        with self._lock:
+            self._cache.clear()
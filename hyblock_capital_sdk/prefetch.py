@@ -0,0 +1,299 @@
+"""
+Prefetch en segundo plano guiado por los patrones de acceso observados.
+
+Los notebooks de investigación suelen pedir la siguiente ventana de tiempo o
+la siguiente moneda en un orden predecible. ``Prefetcher`` observa las
+peticiones GET de un ``ApiClient``, aprende dos patrones y descarga de forma
+especulativa la petición siguiente en la ``ResponseCache`` del cliente:
+
+- ventanas: peticiones de la misma serie cuyo ``startTime``/``endTime``
+  avanza (o retrocede) siempre el mismo intervalo;
+- secuencias de monedas: el orden en que se piden las monedas para un mismo
+  endpoint y parámetros (ej: BTC -> ETH -> SOL).
+
+El prefetch sólo usa conexiones libres del pool y nunca supera
+``budget_share`` de las peticiones reales, para no competir con ellas por el
+límite de hits.
+
+Example:
+    api_client.response_cache = ResponseCache(ttl=120)
+    api_client.prefetcher = Prefetcher(api_client, budget_share=0.2)
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+from urllib.parse import quote, unquote
+
+logger = logging.getLogger(__name__)
+
+WINDOW_PARAMS = ("startTime", "endTime")
+SEQUENCE_PARAM = "coin"
+
+Pairs = Tuple[Tuple[str, str], ...]
+
+
+def split_url(url: str) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Separa una URL en base y pares de query (sin decodificar).
+
+    Args:
+        url: URL completa
+
+    Returns:
+        Tupla (base, lista de pares clave/valor)
+    """
+    base, _, query = url.partition("?")
+    pairs = []
+    for item in query.split("&") if query else []:
+        key, _, value = item.partition("=")
+        pairs.append((key, value))
+    return base, pairs
+
+
+def join_url(base: str, pairs: List[Tuple[str, str]]) -> str:
+    """
+    Reconstruye una URL conservando el orden de los parámetros.
+
+    Args:
+        base: URL sin query
+        pairs: Pares clave/valor ya codificados
+
+    Returns:
+        URL completa, idéntica a la que generaría ``ApiClient``
+    """
+    if not pairs:
+        return base
+    return base + "?" + "&".join(f"{key}={value}" for key, value in pairs)
+
+
+def _replace(
+    pairs: List[Tuple[str, str]], values: Dict[str, Any]
+) -> List[Tuple[str, str]]:
+    """Reemplaza valores de la query codificándolos como ``ApiClient``."""
+    return [
+        (key, quote(str(values[key])) if key in values else value)
+        for key, value in pairs
+    ]
+
+
+def _without(pairs: List[Tuple[str, str]], names: Tuple[str, ...]) -> Pairs:
+    return tuple((key, value) for key, value in pairs if key not in names)
+
+
+def _remember(
+    entries: "OrderedDict[Any, Any]", key: Hashable, value: Any, maxsize: int
+) -> None:
+    """Guarda un valor como el más reciente y descarta los más antiguos."""
+    entries[key] = value
+    entries.move_to_end(key)
+    while len(entries) > maxsize:
+        entries.popitem(last=False)
+
+
+def _as_int(value: str) -> Optional[int]:
+    """Decodifica un límite de ventana; None si no es un entero."""
+    try:
+        return int(unquote(value))
+    except ValueError:
+        return None
+
+
+class Prefetcher:
+    """
+    Aprende secuencias de peticiones y precarga la siguiente.
+
+    Attributes:
+        api_client: Cliente cuyas peticiones se observan
+        budget_share: Fracción máxima de prefetches respecto a las
+            peticiones reales (ej: 0.1 = uno cada diez)
+        maxsize: Número máximo de series recordadas por cada patrón
+        real_requests: Peticiones reales enviadas a la API
+        prefetched: Peticiones enviadas por el prefetcher
+    """
+
+    def __init__(
+        self,
+        api_client: Any,
+        budget_share: float = 0.1,
+        max_workers: int = 2,
+        maxsize: int = 1024,
+    ):
+        """
+        Inicializa el prefetcher.
+
+        Args:
+            api_client: ``ApiClient`` con una ``response_cache`` asignada
+            budget_share: Fracción máxima de prefetches respecto a las
+                peticiones reales
+            max_workers: Número máximo de prefetches simultáneos
+            maxsize: Número máximo de series recordadas por cada patrón; al
+                superarlo se olvidan las usadas hace más tiempo
+        """
+        if not 0 <= budget_share <= 1:
+            raise ValueError(f"budget_share debe estar en [0, 1]: {budget_share!r}")
+        self.api_client = api_client
+        self.budget_share = budget_share
+        self.max_workers = max_workers
+        self.maxsize = maxsize
+        self.real_requests = 0
+        self.prefetched = 0
+
+        self._active = 0
+        self._pending: Set[str] = set()
+        self._windows: "OrderedDict[Tuple[str, Pairs], Tuple[int, Optional[int]]]" = (
+            OrderedDict()
+        )
+        self._last_coin: "OrderedDict[Tuple[str, Pairs], str]" = OrderedDict()
+        self._successors: "OrderedDict[str, OrderedDict[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # Seguimiento de peticiones reales
+
+    def begin(self) -> None:
+        """Registra el inicio de una petición real (la llama ``call_api``)."""
+        with self._lock:
+            self._active += 1
+            self.real_requests += 1
+
+    def end(self) -> None:
+        """Registra el fin de una petición real (la llama ``call_api``)."""
+        with self._lock:
+            self._active -= 1
+
+    # Predicción
+
+    def predict(self, url: str) -> List[str]:
+        """
+        Aprende de una petición y predice las siguientes.
+
+        Args:
+            url: URL completa de la petición observada
+
+        Returns:
+            URLs que probablemente se pidan a continuación
+        """
+        base, pairs = split_url(url)
+        params = dict(pairs)
+        predictions = []
+
+        with self._lock:
+            start = _as_int(params.get(WINDOW_PARAMS[0], ""))
+            raw_end = params.get(WINDOW_PARAMS[1])
+            end = _as_int(raw_end) if raw_end is not None else None
+            # Ventanas no numéricas (startTime es un StrictStr libre) no se
+            # predicen
+            if start is not None and (raw_end is None or end is not None):
+                key = (base, _without(pairs, WINDOW_PARAMS))
+                previous = self._windows.get(key)
+                _remember(self._windows, key, (start, end), self.maxsize)
+                if previous is not None:
+                    delta = start - previous[0]
+                    same_step = end is None or (
+                        previous[1] is not None and end - previous[1] == delta
+                    )
+                    if delta and same_step:
+                        values: Dict[str, Any] = {WINDOW_PARAMS[0]: start + delta}
+                        if end is not None:
+                            values[WINDOW_PARAMS[1]] = end + delta
+                        predictions.append(join_url(base, _replace(pairs, values)))
+
+            coin = params.get(SEQUENCE_PARAM)
+            if coin is not None:
+                key = (base, _without(pairs, (SEQUENCE_PARAM,)))
+                successors = self._successors.get(base, OrderedDict())
+                _remember(self._successors, base, successors, self.maxsize)
+                previous_coin = self._last_coin.get(key)
+                if previous_coin is not None and previous_coin != coin:
+                    _remember(successors, previous_coin, coin, self.maxsize)
+                _remember(self._last_coin, key, coin, self.maxsize)
+                following = successors.get(coin)
+                if following is not None and following != coin:
+                    predictions.append(
+                        join_url(
+                            base, _replace(pairs, {SEQUENCE_PARAM: unquote(following)})
+                        )
+                    )
+        return predictions
+
+    # Prefetch
+
+    def observe(self, method: str, url: str, header_params: Optional[dict]) -> None:
+        """
+        Observa una petición y lanza los prefetches que permita el budget.
+
+        La llama ``ApiClient.call_api`` tras cada GET, tanto si se respondió
+        desde la caché como desde la red.
+
+        Args:
+            method: Método HTTP
+            url: URL completa
+            header_params: Headers de la petición (se reutilizan en el
+                prefetch para conservar la autenticación)
+        """
+        if method != "GET" or self.api_client.response_cache is None:
+            return
+        # Es una optimización: un error aquí no debe afectar a la petición
+        # real, que ya tiene su respuesta.
+        try:
+            for predicted in self.predict(url):
+                self._schedule(predicted, header_params)
+        except Exception:
+            logger.exception("Falló el prefetcher tras %s", url)
+
+    def _has_budget(self) -> bool:
+        """Indica si hay budget y conexiones libres para otro prefetch."""
+        pool_size = getattr(
+            self.api_client.configuration, "connection_pool_maxsize", None
+        )
+        if pool_size is not None and self._active >= pool_size:
+            return False
+        if len(self._pending) >= self.max_workers:
+            return False
+        return self.prefetched + 1 <= self.budget_share * self.real_requests
+
+    def _schedule(self, url: str, header_params: Optional[dict]) -> None:
+        cache = self.api_client.response_cache
+        if cache.peek("GET", url) is not None:
+            return
+        with self._lock:
+            if url in self._pending or not self._has_budget():
+                return
+            self._pending.add(url)
+            self.prefetched += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="hyblock-prefetch"
+                )
+            executor = self._executor
+        executor.submit(self._fetch, url, dict(header_params or {}))
+
+    def _fetch(self, url: str, header_params: dict) -> None:
+        """Descarga una URL y la guarda en la caché como prefetch."""
+        try:
+            response = self.api_client.rest_client.request(
+                "GET", url, headers=header_params
+            )
+            self.api_client.response_cache.put("GET", url, response, prefetched=True)
+        except Exception:
+            logger.debug("Falló el prefetch de %s", url, exc_info=True)
+        finally:
+            with self._lock:
+                self._pending.discard(url)
+
+    def wait(self) -> None:
+        """Espera a que terminen los prefetches en curso."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def close(self) -> None:
+        """Cancela los prefetches pendientes y libera el pool de hilos."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
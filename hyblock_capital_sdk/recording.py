@@ -0,0 +1,279 @@
+"""
+Transporte de grabación y reproducción de respuestas.
+
+Para que un backtest repita exactamente lo que devolvió la API, sin red ni
+consumo de hits, ``RecordReplayClientObject`` envuelve el transporte real
+(``RESTClientObject`` o ``HTTP2ClientObject``):
+
+- en modo ``"record"`` envía cada petición y guarda la respuesta en un
+  ``RecordingArchive`` (salvo los 429 y 5xx, que son transitorios);
+- en modo ``"replay"`` responde desde el archivo, que se carga completo en
+  memoria. En modo estricto una petición no grabada lanza
+  ``UnrecordedRequestError``; si no, se envía por red y se graba.
+
+El archivo es un JSON por línea comprimido con gzip; cada respuesta se indexa
+por método y URL normalizada (``normalize_url``), así que el orden de los
+parámetros de la query no importa. Se activa desde la configuración:
+
+Example:
+    config = hc.Configuration(host="https://api1.hyblockcapital.com/v1")
+    config.recording_path = "backtests/btc-2024.jsonl.gz"
+    config.recording_mode = "replay"
+    api_client = hc.ApiClient(config)
+"""
+
+import base64
+import gzip
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .exceptions import ApiException, ApiValueError
+from .response_cache import StoredResponse
+from .rest import RESTResponse
+
+logger = logging.getLogger(__name__)
+
+RECORDING_MODES = ("record", "replay")
+# Respuestas que no se graban (además de las 5xx): no son datos de la API.
+TRANSIENT_STATUSES = frozenset({429})
+
+RecordingKey = Tuple[str, str]
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normaliza una URL para indexar las grabaciones.
+
+    Pasa a minúsculas el esquema y el host, quita el puerto por defecto y
+    ordena los parámetros de la query.
+
+    Args:
+        url: URL completa
+
+    Returns:
+        URL normalizada
+
+    Example:
+        >>> normalize_url("HTTPS://Api.example.com:443/klines?b=2&a=1")
+        'https://api.example.com/klines?a=1&b=2'
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    default_port = {"http": ":80", "https": ":443"}.get(scheme)
+    if default_port and netloc.endswith(default_port):
+        netloc = netloc[: -len(default_port)]
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+class UnrecordedRequestError(ApiException):
+    """Petición sin respuesta grabada en modo de reproducción estricto."""
+
+    def __init__(self, method: str, url: str):
+        super().__init__(
+            status=0, reason=f"Petición no grabada: {method} {normalize_url(url)}"
+        )
+        self.method = method
+        self.url = url
+
+
+class RecordingArchive:
+    """
+    Archivo de respuestas grabadas, indexado por método y URL normalizada.
+
+    Al abrirse carga todas las respuestas en memoria; las nuevas se añaden al
+    final del archivo como un miembro gzip más, de modo que una grabación
+    interrumpida conserva lo grabado hasta entonces. Si una URL se graba más
+    de una vez prevalece la última respuesta.
+
+    Attributes:
+        path: Ruta del archivo
+    """
+
+    def __init__(self, path: str):
+        """
+        Abre (o prepara para crear) un archivo de grabaciones.
+
+        Args:
+            path: Ruta del archivo (ej: "recordings/klines.jsonl.gz")
+        """
+        self.path = path
+        self._entries: Dict[RecordingKey, StoredResponse] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: RecordingKey) -> bool:
+        method, url = key
+        return (method, normalize_url(url)) in self._entries
+
+    def get(self, method: str, url: str) -> Optional[StoredResponse]:
+        """
+        Obtiene la respuesta grabada de una petición.
+
+        Args:
+            method: Método HTTP
+            url: URL completa
+
+        Returns:
+            Respuesta grabada, o None
+        """
+        return self._entries.get((method, normalize_url(url)))
+
+    def put(self, method: str, url: str, stored: StoredResponse) -> None:
+        """
+        Graba una respuesta en memoria y en el archivo.
+
+        Args:
+            method: Método HTTP
+            url: URL completa
+            stored: Respuesta a grabar
+        """
+        key = (method, normalize_url(url))
+        record: Dict[str, Any] = {
+            "method": key[0],
+            "url": key[1],
+            "status": stored.status,
+            "reason": stored.reason,
+            "headers": stored.headers,
+        }
+        try:
+            record["body"] = stored.data.decode("utf-8")
+        except UnicodeDecodeError:
+            record["body_base64"] = base64.b64encode(stored.data).decode("ascii")
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "ab") as f:
+                f.write(gzip.compress(line))
+            self._entries[key] = stored
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if "body_base64" in record:
+                    data = base64.b64decode(record["body_base64"])
+                else:
+                    data = record["body"].encode("utf-8")
+                self._entries[(record["method"], record["url"])] = StoredResponse(
+                    status=record["status"],
+                    reason=record["reason"],
+                    data=data,
+                    headers=record["headers"],
+                )
+        logger.debug("Cargadas %d respuestas de %s", len(self._entries), self.path)
+
+
+class RecordReplayClientObject:
+    """
+    Transporte que graba o reproduce las respuestas de otro transporte.
+
+    Tiene la interfaz de ``rest.RESTClientObject``; el resto de atributos
+    (``pool_manager``...) se delegan al transporte envuelto.
+
+    Attributes:
+        transport: Transporte real usado para grabar
+        archive: Archivo de grabaciones
+        mode: "record" o "replay"
+        strict: En modo "replay", True para fallar ante peticiones no grabadas
+        replayed: Respuestas servidas desde el archivo
+        recorded: Respuestas grabadas
+    """
+
+    def __init__(
+        self,
+        transport: Any,
+        archive: RecordingArchive,
+        mode: str = "replay",
+        strict: bool = True,
+    ):
+        """
+        Inicializa el transporte.
+
+        Args:
+            transport: Transporte real (``RESTClientObject``...)
+            archive: Archivo de grabaciones
+            mode: "record" para grabar o "replay" para reproducir
+            strict: En modo "replay", True para lanzar
+                ``UnrecordedRequestError`` ante peticiones no grabadas y
+                False para enviarlas por red y grabarlas
+
+        Raises:
+            ApiValueError: Si el modo no es válido
+        """
+        if mode not in RECORDING_MODES:
+            raise ApiValueError(f"Modo de grabación no soportado: {mode!r}")
+        self.transport = transport
+        self.archive = archive
+        self.mode = mode
+        self.strict = strict
+        self.replayed = 0
+        self.recorded = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.transport, name)
+
+    def close(self) -> None:
+        """Cierra el transporte envuelto."""
+        self.transport.close()
+
+    def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> RESTResponse:
+        """
+        Realiza una petición, con los mismos parámetros que
+        ``RESTClientObject.request``.
+
+        Returns:
+            ``RESTResponse`` grabado o recibido
+
+        Raises:
+            UnrecordedRequestError: Si la petición no está grabada en modo
+                "replay" estricto
+        """
+        if self.mode == "replay":
+            stored = self.archive.get(method, url)
+            if stored is not None:
+                self.replayed += 1
+                return RESTResponse(stored)
+            if self.strict:
+                raise UnrecordedRequestError(method, url)
+
+        response = self.transport.request(
+            method,
+            url,
+            headers=headers,
+            body=body,
+            post_params=post_params,
+            _request_timeout=_request_timeout,
+        )
+        stored = StoredResponse(
+            status=response.status,
+            reason=response.reason,
+            data=response.read(),
+            headers=dict(response.getheaders() or {}),
+        )
+        if stored.status not in TRANSIENT_STATUSES and stored.status < 500:
+            self.archive.put(method, url, stored)
+            self.recorded += 1
+        return RESTResponse(stored)
@@ -0,0 +1,226 @@
+"""
+Log estructurado y muestreado de las peticiones del SDK.
+
+``Configuration.debug`` activa la salida de depuración de ``http.client``,
+que escribe cada línea del protocolo con ``print`` y es inviable en
+producción. ``RequestLogger`` se asigna como ``ApiClient.request_observer`` y
+registra, para una muestra de las peticiones, una línea con sus metadatos
+(método, recurso, parámetros, status, fases y tamaños):
+
+- el formato es perezoso: el mensaje sólo se construye si algún handler lo
+  emite, y el ``LogRecord`` lleva los datos en ``record.hyblock`` para
+  formatters JSON;
+- las peticiones con error (status >= 400, o sin respuesta por un fallo de
+  conexión) se registran siempre;
+- las últimas ``buffer_size`` peticiones (muestreadas o no) quedan en un
+  buffer circular que se vuelca con ``dump()`` o automáticamente al recibir
+  un error de servidor o de conexión.
+
+Example:
+    api_client.request_observer = RequestLogger(sample_rate=0.01)
+
+    try:
+        ...
+    except hc.ApiException:
+        for entry in api_client.request_observer.dump():
+            print(entry)
+"""
+
+import logging
+import random
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from .timings import PHASES, RequestTimings
+
+logger = logging.getLogger(__name__)
+
+
+def _is_server_error(timings: RequestTimings) -> bool:
+    return timings.status is None or timings.status >= 500
+
+
+class RequestEntry:
+    """
+    Metadatos de una petición con formato perezoso.
+
+    ``str()`` produce una línea ``clave=valor``; ``to_dict()`` un diccionario
+    con el recurso y los parámetros ya separados. Nada se calcula hasta que
+    se pide.
+    """
+
+    __slots__ = ("timings",)
+
+    def __init__(self, timings: RequestTimings):
+        self.timings = timings
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convierte la petición a diccionario.
+
+        Returns:
+            Diccionario con ``path`` y ``params`` además de los campos de
+            ``RequestTimings.to_dict``
+        """
+        result = self.timings.to_dict()
+        parts = urlsplit(result.pop("url"))
+        result["path"] = parts.path
+        result["params"] = dict(parse_qsl(parts.query))
+        return result
+
+    def __str__(self) -> str:
+        t = self.timings
+        parts = urlsplit(t.url)
+        fields = [
+            f"{t.method} {parts.path}",
+            f"params={parts.query or '-'}",
+            f"status={t.status}",
+            f"total_ms={t.total * 1000:.1f}",
+        ]
+        for phase in PHASES:
+            value = getattr(t, phase)
+            if value:
+                fields.append(f"{phase}_ms={value * 1000:.1f}")
+        fields.append(f"bytes={t.response_bytes}")
+        fields.append(f"rows={t.rows}")
+        if t.cached:
+            fields.append("cached=1")
+        if t.retries:
+            fields.append(f"retries={t.retries}")
+        if t.error is not None:
+            fields.append(f"error={type(t.error).__name__}")
+        return " ".join(fields)
+
+
+class RequestLogger:
+    """
+    Observer de peticiones que escribe un log muestreado.
+
+    Attributes:
+        sample_rate: Fracción de peticiones exitosas que se registran
+        buffer_size: Peticiones guardadas en el buffer circular
+        logged: Peticiones registradas en el log
+        observed: Peticiones recibidas
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.01,
+        buffer_size: int = 100,
+        level: int = logging.DEBUG,
+        log: Optional[logging.Logger] = None,
+        dump_on_error: bool = True,
+        observer: Optional[Callable[[RequestTimings], Any]] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Inicializa el logger.
+
+        Args:
+            sample_rate: Fracción (0-1) de peticiones exitosas a registrar
+            buffer_size: Peticiones a conservar para ``dump()`` (0 = ninguna)
+            level: Nivel de las líneas de las peticiones exitosas; los
+                errores se registran con ``WARNING``
+            log: Logger destino; por defecto el de este módulo
+            dump_on_error: True para volcar el buffer al log ante un error
+                de servidor (status >= 500) o una petición sin respuesta
+            observer: Observer adicional que también recibe los tiempos
+            rng: Generador aleatorio para el muestreo
+
+        Raises:
+            ValueError: Si ``sample_rate`` no está en [0, 1]
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate debe estar en [0, 1]: {sample_rate!r}")
+        self.sample_rate = sample_rate
+        self.buffer_size = buffer_size
+        self.level = level
+        self.dump_on_error = dump_on_error
+        self.observer = observer
+        self.logged = 0
+        self.observed = 0
+        self._log = log or logger
+        self._random = (rng or random.Random()).random
+        self._buffer: Deque[RequestTimings] = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+
+    def __call__(self, timings: RequestTimings) -> None:
+        try:
+            self.record(timings)
+        finally:
+            if self.observer is not None:
+                self.observer(timings)
+
+    def record(self, timings: RequestTimings) -> None:
+        """
+        Guarda una petición en el buffer y la registra si sale en la muestra.
+
+        Args:
+            timings: Tiempos entregados por ``ApiClient``
+        """
+        status = timings.status
+        if status is not None and status < 400:
+            level = self.level
+            sampled = self._random() < self.sample_rate
+        else:
+            level = logging.WARNING
+            sampled = True
+        emit = sampled and self._log.isEnabledFor(level)
+
+        with self._lock:
+            self.observed += 1
+            if self.buffer_size:
+                self._buffer.append(timings)
+            if emit:
+                self.logged += 1
+        if not emit:
+            return
+
+        entry = RequestEntry(timings)
+        self._log.log(level, "%s", entry, extra={"hyblock": entry})
+        if self.dump_on_error and _is_server_error(timings):
+            self._log.log(
+                logging.WARNING,
+                "Últimas %d peticiones:\n%s",
+                len(self._buffer),
+                _LazyDump(self),
+            )
+
+    def entries(self) -> List[RequestEntry]:
+        """
+        Obtiene las peticiones del buffer, de la más antigua a la última.
+
+        Returns:
+            Lista de ``RequestEntry``
+        """
+        with self._lock:
+            return [RequestEntry(timings) for timings in list(self._buffer)]
+
+    def dump(self) -> List[Dict[str, Any]]:
+        """
+        Vuelca el buffer circular.
+
+        Returns:
+            Lista de diccionarios (``RequestEntry.to_dict``) de la más
+            antigua a la última
+        """
+        return [entry.to_dict() for entry in self.entries()]
+
+    def clear(self) -> None:
+        """Vacía el buffer circular."""
+        with self._lock:
+            self._buffer.clear()
+
+
+class _LazyDump:
+    """Formatea el buffer de un ``RequestLogger`` sólo si se emite el log."""
+
+    __slots__ = ("request_logger",)
+
+    def __init__(self, request_logger: RequestLogger):
+        self.request_logger = request_logger
+
+    def __str__(self) -> str:
+        return "\n".join(str(entry) for entry in self.request_logger.entries())
@@ -0,0 +1,219 @@
+"""
+Caché de respuestas HTTP para ``ApiClient``.
+
+Guarda el cuerpo de las respuestas GET exitosas indexado por URL completa
+(incluida la query), con expiración por TTL y desalojo LRU. Se activa
+asignándola a ``ApiClient.response_cache``; las APIs generadas no cambian:
+``call_api`` retorna un ``RESTResponse`` reconstruido desde la caché cuando
+la URL ya fue descargada.
+
+Example:
+    api_client = hc.ApiClient(configuration)
+    api_client.response_cache = ResponseCache(maxsize=2048, ttl=30)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from .rest import RESTResponse
+
+CacheKey = Tuple[str, str]
+
+
+class StoredResponse(NamedTuple):
+    """Respuesta HTTP guardada, con la interfaz que usa ``RESTResponse``."""
+
+    status: int
+    reason: Optional[str]
+    data: bytes
+    headers: Dict[str, str]
+
+
+class ResponseCache:
+    """
+    Caché LRU con TTL de respuestas GET.
+
+    Attributes:
+        maxsize: Número máximo de respuestas guardadas
+        ttl: Segundos de validez de cada respuesta
+        hits: Consultas respondidas desde la caché
+        misses: Consultas que no estaban en la caché
+        prefetch_hits: Aciertos sobre respuestas cargadas por prefetch
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa la caché.
+
+        Args:
+            maxsize: Número máximo de respuestas guardadas
+            ttl: Segundos de validez de cada respuesta
+            clock: Función que retorna el tiempo actual en segundos
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.prefetch_hits = 0
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[float, StoredResponse, bool]]" = (
+            OrderedDict()
+        )
+        # bytes de los cuerpos guardados, actualizado en cada alta y baja
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return self.peek(*key) is not None
+
+    def peek(self, method: str, url: str) -> Optional[StoredResponse]:
+        """
+        Consulta la caché sin actualizar estadísticas ni el orden LRU.
+
+        Args:
+            method: Método HTTP
+            url: URL completa
+
+        Returns:
+            Respuesta guardada vigente, o None
+        """
+        with self._lock:
+            entry = self._entries.get((method, url))
+        if entry is None or self._clock() - entry[0] >= self.ttl:
+            return None
+        return entry[1]
+
+    def get(self, method: str, url: str) -> Optional[RESTResponse]:
+        """
+        Obtiene una respuesta guardada.
+
+        Args:
+            method: Método HTTP
+            url: URL completa
+
+        Returns:
+            ``RESTResponse`` con el cuerpo ya leído, o None si no está en la
+            caché o venció
+        """
+        key = (method, url)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] >= self.ttl:
+                self._pop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            if entry[2]:
+                self.prefetch_hits += 1
+                self._entries[key] = (entry[0], entry[1], False)
+
+        response = RESTResponse(entry[1])
+        response.read()
+        return response
+
+    def put(
+        self, method: str, url: str, response: RESTResponse, prefetched: bool = False
+    ) -> bool:
+        """
+        Guarda una respuesta si es cacheable (GET con estado 2xx).
+
+        Lee el cuerpo de la respuesta; ``response.read()`` sigue retornando
+        los mismos bytes después.
+
+        Args:
+            method: Método HTTP
+            url: URL completa
+            response: Respuesta recibida
+            prefetched: True si la respuesta se descargó por prefetch
+
+        Returns:
+            True si la respuesta se guardó
+        """
+        if method != "GET" or not 200 <= response.status <= 299:
+            return False
+        stored = StoredResponse(
+            status=response.status,
+            reason=response.reason,
+            data=response.read(),
+            headers=dict(response.getheaders() or {}),
+        )
+        with self._lock:
+            self._pop((method, url))
+            self._entries[(method, url)] = (self._clock(), stored, prefetched)
+            self._nbytes += len(stored.data)
+            while len(self._entries) > self.maxsize:
+                self._pop_oldest()
+        return True
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """
+        Descarta una URL de la caché, o toda la caché si no se indica.
+
+        Args:
+            url: URL completa a descartar
+        """
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+                self._nbytes = 0
+            else:
+                self._pop(("GET", url))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes de los cuerpos guardados."""
+        return self._nbytes
+
+    def shrink(self, max_bytes: int) -> int:
+        """
+        Desaloja las respuestas menos usadas hasta ocupar ``max_bytes``.
+
+        Args:
+            max_bytes: Bytes máximos de cuerpos a conservar
+
+        Returns:
+            Número de respuestas desalojadas
+        """
+        evicted = 0
+        with self._lock:
+            while self._entries and self._nbytes > max_bytes:
+                self._pop_oldest()
+                evicted += 1
+        return evicted
+
+    def _pop(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= len(entry[1].data)
+
+    def _pop_oldest(self) -> None:
+        _, (_, stored, _) = self._entries.popitem(last=False)
+        self._nbytes -= len(stored.data)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtiene las estadísticas de uso.
+
+        Returns:
+            Diccionario con ``size``, ``hits``, ``misses`` y ``prefetch_hits``
+        """
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "prefetch_hits": self.prefetch_hits,
+        }
@@ -17,10 +17,12 @@ import io
 import json
 import re
 import ssl
+from typing import Optional, Protocol
 
 import urllib3
 
 from hyblock_capital_sdk.exceptions import ApiException, ApiValueError
+from hyblock_capital_sdk.timings import RequestTimings, restore_pool_manager
 
 SUPPORTED_SOCKS_PROXIES = {"socks5", "socks5h", "socks4", "socks4a"}
 RESTResponseType = urllib3.HTTPResponse
@@ -37,6 +39,11 @@ def is_socks_proxy_url(url):
 
 
 class RESTResponse(io.IOBase):
+    # set by ApiClient.call_api only when a request_observer or memory_tracker
+    # is active; read them with getattr
+    timings: Optional[RequestTimings]
+    request_url: str
+
     def __init__(self, resp) -> None:
         self.response = resp
         self.status = resp.status
@@ -57,6 +64,29 @@ class RESTResponse(io.IOBase):
         return self.response.headers.get(name, default)
 
 
+class Transport(Protocol):
+    """Interface of the objects ApiClient uses as rest_client.
+
+    Implemented by RESTClientObject, http2.HTTP2ClientObject and
+    recording.RecordReplayClientObject. The urllib3 transports also expose
+    pool_manager; callers read it with getattr because HTTP/2 has none.
+    """
+
+    def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> RESTResponse:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
 class RESTClientObject:
     def __init__(self, configuration) -> None:
         # urllib3.PoolManager will pass all kw parameters to connectionpool
@@ -109,6 +139,11 @@ class RESTClientObject:
         else:
             self.pool_manager = urllib3.PoolManager(**pool_args)
 
+    def close(self) -> None:
+        """Closes the idle connections of every pool."""
+        restore_pool_manager(self.pool_manager)
+        self.pool_manager.clear()
+
     def request(
         self,
         method,
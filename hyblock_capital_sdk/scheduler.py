@@ -0,0 +1,348 @@
+"""
+Scheduler de polling alineado al cierre de las barras.
+
+Un loop con ``time.sleep`` fijo consulta la API antes de que cierren las
+barras y gasta hits sin obtener datos nuevos. ``PollingScheduler`` despierta
+justo después de cada frontera de barra (más un retardo de asentamiento
+configurable), agrupa todas las suscripciones que vencen en el mismo instante
+en un único fan-out concurrente y entrega los puntos nuevos a callbacks o a un
+iterador asíncrono.
+
+Cada suscripción usa un ``IncrementalSync``, por lo que sólo se piden las
+barras posteriores a la última barra cerrada.
+
+Example:
+    scheduler = PollingScheduler(settle_delay=2.0)
+    scheduler.subscribe(
+        orderflow_api.volume_delta_get, "BTC", "5m", exchange="binance",
+        callback=lambda sync, bars: print(sync.key, bars),
+    )
+    scheduler.start()
+    ...
+    scheduler.stop()
+
+    # O bien, desde código asíncrono:
+    async for sync, bars in scheduler.stream():
+        print(sync.key, bars)
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .sync import IncrementalSync, SyncKey, SyncManager
+
+logger = logging.getLogger(__name__)
+
+Callback = Callable[[IncrementalSync, List[Any]], None]
+ErrorCallback = Callable[[IncrementalSync, BaseException], None]
+
+
+def next_boundary(now: float, step: int, settle_delay: float = 0.0) -> float:
+    """
+    Calcula el próximo instante de consulta después de ``now``.
+
+    Args:
+        now: Tiempo actual en segundos
+        step: Duración de la barra en segundos
+        settle_delay: Segundos de espera tras el cierre de la barra
+
+    Returns:
+        Frontera de barra siguiente más ``settle_delay``
+    """
+    return (math.floor((now - settle_delay) / step) + 1) * step + settle_delay
+
+
+class PollingScheduler:
+    """
+    Consulta suscripciones en las fronteras de sus timeframes.
+
+    Attributes:
+        settle_delay: Segundos de espera tras cada cierre de barra
+        manager: Registro de sincronizaciones incrementales
+    """
+
+    def __init__(
+        self,
+        settle_delay: float = 2.0,
+        max_workers: int = 8,
+        maxlen: int = 1000,
+        clock: Callable[[], float] = time.time,
+        on_error: Optional[ErrorCallback] = None,
+    ):
+        """
+        Inicializa el scheduler.
+
+        Args:
+            settle_delay: Segundos de espera tras el cierre de cada barra
+            max_workers: Número máximo de llamadas concurrentes por ciclo
+            maxlen: Capacidad del buffer de cada serie
+            clock: Función que retorna el tiempo actual en segundos
+            on_error: Función llamada con ``(sync, excepción)`` cuando una
+                consulta falla; por defecto se registra en el log
+        """
+        if settle_delay < 0:
+            raise ValueError("settle_delay no puede ser negativo")
+        self.settle_delay = settle_delay
+        self.max_workers = max_workers
+        self.manager = SyncManager(maxlen=maxlen, clock=clock)
+        self.on_error = on_error
+
+        self._clock = clock
+        self._callbacks: Dict[SyncKey, List[Callback]] = {}
+        self._listeners: List[Callback] = []
+        self._due: Dict[SyncKey, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        # despierta a run() y stream() antes de la próxima frontera: al
+        # suscribir una serie nueva o al detener el scheduler
+        self._wake = threading.Event()
+        self._async_wakers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def subscribe(
+        self,
+        endpoint: Callable[..., Any],
+        coin: str,
+        timeframe: str,
+        exchange: Optional[str] = None,
+        callback: Optional[Callback] = None,
+        **params: Any,
+    ) -> IncrementalSync:
+        """
+        Registra una serie para consultarla en cada cierre de barra.
+
+        La primera consulta (descarga completa) vence inmediatamente.
+
+        Args:
+            endpoint: Método de API (ej: ``OrderflowApi.volume_delta_get``)
+            coin: Moneda (ej: "BTC")
+            timeframe: Timeframe de las barras (ej: "5m")
+            exchange: Exchange (ej: "binance")
+            callback: Función llamada con ``(sync, barras)`` cuando llegan
+                barras nuevas o actualizadas de esta serie
+            **params: Parámetros extra del endpoint
+
+        Returns:
+            Sincronización asociada a la suscripción
+        """
+        sync = self.manager.get(endpoint, coin, timeframe, exchange=exchange, **params)
+        with self._lock:
+            self._due.setdefault(sync.key, self._clock())
+            if callback is not None:
+                self._callbacks.setdefault(sync.key, []).append(callback)
+        self._notify()
+        return sync
+
+    def unsubscribe(self, sync: IncrementalSync) -> None:
+        """
+        Deja de consultar una serie.
+
+        Args:
+            sync: Sincronización retornada por ``subscribe``
+        """
+        with self._lock:
+            self._due.pop(sync.key, None)
+            self._callbacks.pop(sync.key, None)
+
+    def add_listener(self, callback: Callback) -> None:
+        """
+        Registra una función llamada con ``(sync, barras)`` para toda serie.
+
+        Args:
+            callback: Función a llamar con las barras nuevas
+        """
+        with self._lock:
+            self._listeners.append(callback)
+
+    def next_wakeup(self) -> Optional[float]:
+        """
+        Obtiene el instante de la próxima consulta.
+
+        Returns:
+            Timestamp en segundos, o None si no hay suscripciones
+        """
+        with self._lock:
+            return min(self._due.values()) if self._due else None
+
+    def due(self, now: Optional[float] = None) -> List[IncrementalSync]:
+        """
+        Lista las suscripciones que deben consultarse en ``now``.
+
+        Args:
+            now: Tiempo de referencia; por defecto el reloj del scheduler
+
+        Returns:
+            Sincronizaciones vencidas
+        """
+        now = self._clock() if now is None else now
+        with self._lock:
+            keys = {key for key, at in self._due.items() if at <= now}
+        return [sync for sync in self.manager.syncs() if sync.key in keys]
+
+    def run_pending(self) -> List[Tuple[IncrementalSync, List[Any]]]:
+        """
+        Consulta de forma concurrente todas las suscripciones vencidas.
+
+        Returns:
+            Pares ``(sync, barras)`` con las series que recibieron barras
+            nuevas o actualizadas
+        """
+        now = self._clock()
+        due = self.due(now)
+        if not due:
+            return []
+
+        if len(due) == 1:
+            outcomes = [self._poll(due[0])]
+        else:
+            outcomes = list(self._get_executor().map(self._poll, due))
+
+        updates = []
+        with self._lock:
+            for sync in due:
+                if sync.key in self._due:
+                    step = sync.step
+                    self._due[sync.key] = next_boundary(now, step, self.settle_delay)
+        for sync, bars in zip(due, outcomes):
+            if bars:
+                updates.append((sync, bars))
+                self._dispatch(sync, bars)
+        return updates
+
+    def _poll(self, sync: IncrementalSync) -> List[Any]:
+        """Consulta una serie, reportando el error sin interrumpir el ciclo."""
+        try:
+            return sync.poll()
+        except Exception as e:
+            if self.on_error is not None:
+                self.on_error(sync, e)
+            else:
+                logger.exception("Error consultando %s", sync.key)
+            return []
+
+    def _dispatch(self, sync: IncrementalSync, bars: List[Any]) -> None:
+        """Entrega las barras nuevas a los callbacks registrados."""
+        with self._lock:
+            callbacks = self._callbacks.get(sync.key, []) + self._listeners
+        for callback in callbacks:
+            callback(sync, bars)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Crea el pool de hilos del fan-out la primera vez que se necesita."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="hyblock-poll",
+                )
+            return self._executor
+
+    def _notify(self) -> None:
+        """Despierta los loops que esperan la próxima consulta."""
+        self._wake.set()
+        with self._lock:
+            wakers = list(self._async_wakers)
+        for loop, event in wakers:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # event loop ya cerrado
+                pass
+
+    def _seconds_until_next(self) -> Optional[float]:
+        """Segundos que faltan para la próxima consulta."""
+        wakeup = self.next_wakeup()
+        if wakeup is None:
+            return None
+        return max(0.0, wakeup - self._clock())
+
+    def run(self) -> None:
+        """
+        Ejecuta el loop de polling en el hilo actual hasta llamar ``stop``.
+        """
+        self._stop.clear()
+        while not self._stop.is_set():
+            self._wake.clear()
+            self._wake.wait(self._seconds_until_next())
+            if self._stop.is_set():
+                break
+            self.run_pending()
+
+    def start(self) -> None:
+        """Ejecuta el loop de polling en un hilo de fondo."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run, name="hyblock-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Detiene el loop de polling y libera el pool de hilos.
+
+        Args:
+            timeout: Segundos máximos de espera por el hilo de fondo
+        """
+        self._stop.set()
+        self._notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    async def stream(self) -> AsyncIterator[Tuple[IncrementalSync, List[Any]]]:
+        """
+        Itera de forma asíncrona sobre las barras nuevas de cada serie.
+
+        Las consultas se ejecutan en el executor por defecto del event loop,
+        por lo que no bloquean otras tareas. El iterador termina al llamar
+        ``stop``.
+
+        Yields:
+            Pares ``(sync, barras)`` con barras nuevas o actualizadas
+        """
+        loop = asyncio.get_running_loop()
+        waker = (loop, asyncio.Event())
+        with self._lock:
+            self._async_wakers.append(waker)
+        self._stop.clear()
+        try:
+            while not self._stop.is_set():
+                waker[1].clear()
+                try:
+                    await asyncio.wait_for(waker[1].wait(), self._seconds_until_next())
+                except asyncio.TimeoutError:
+                    pass
+                if self._stop.is_set():
+                    break
+                for update in await loop.run_in_executor(None, self.run_pending):
+                    yield update
+        finally:
+            with self._lock:
+                self._async_wakers.remove(waker)
+
+    def __enter__(self) -> "PollingScheduler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
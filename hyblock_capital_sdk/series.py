@@ -0,0 +1,91 @@
+"""
+Utilidades para series temporales retornadas por la API de Hyblock Capital.
+
+Define los timeframes soportados por los endpoints y funciones para trabajar
+con registros indexados por ``openDate`` sin depender de NumPy.
+"""
+
+from typing import Any, Dict, List, Optional
+
+TIMEFRAME_SECONDS: Dict[str, int] = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+}
+
+
+def timeframe_seconds(timeframe: str) -> int:
+    """
+    Obtiene la duración en segundos de un timeframe de la API.
+
+    Args:
+        timeframe: Timeframe (ej: "5m", "1h")
+
+    Returns:
+        Duración en segundos
+
+    Raises:
+        ValueError: Si el timeframe no es soportado
+    """
+    try:
+        return TIMEFRAME_SECONDS[timeframe]
+    except KeyError:
+        raise ValueError(
+            f"Timeframe no soportado: {timeframe!r}. "
+            f"Valores válidos: {', '.join(TIMEFRAME_SECONDS)}"
+        ) from None
+
+
+def as_records(data: Any) -> List[Any]:
+    """
+    Normaliza una respuesta de la API a una lista de registros.
+
+    Acepta listas de modelos, listas de diccionarios, un modelo suelto o un
+    diccionario con la clave ``data`` (formato crudo de la API).
+
+    Args:
+        data: Respuesta retornada por un endpoint o JSON decodificado
+
+    Returns:
+        Lista de registros (modelos o diccionarios)
+    """
+    if data is None:
+        return []
+    if isinstance(data, dict):
+        inner = data.get("data")
+        return list(inner) if isinstance(inner, list) else [data]
+    if isinstance(data, (list, tuple)):
+        return list(data)
+    return [data]
+
+
+def open_date_of(record: Any) -> Optional[int]:
+    """
+    Obtiene el ``openDate`` de un registro (modelo o diccionario).
+
+    Args:
+        record: Registro de una serie temporal
+
+    Returns:
+        Timestamp de apertura, o None si el registro no lo tiene
+    """
+    if isinstance(record, dict):
+        return record.get("openDate", record.get("open_date"))
+    return getattr(record, "open_date", None)
+
+
+def bar_close_time(open_date: int, timeframe: str) -> int:
+    """
+    Calcula el instante de cierre de una barra.
+
+    Args:
+        open_date: Timestamp de apertura de la barra (segundos)
+        timeframe: Timeframe de la barra
+
+    Returns:
+        Timestamp de cierre (segundos)
+    """
+    return open_date + timeframe_seconds(timeframe)
@@ -0,0 +1,326 @@
+"""
+Sincronización incremental de series temporales.
+
+En lugar de volver a pedir la ventana completa (``limit``) de un endpoint en
+cada ciclo de polling, ``IncrementalSync`` recuerda el ``openDate`` de la
+última barra cerrada, pide sólo las barras posteriores con
+``start_time=ultima + 1``, reemplaza la barra que seguía abierta y agrega las
+nuevas a un buffer circular de tamaño acotado.
+
+Example:
+    orderflow_api = hc.OrderflowApi(api_client)
+    klines = IncrementalSync(
+        orderflow_api.klines_get, coin="BTC", timeframe="1m", exchange="binance"
+    )
+
+    while True:
+        for bar in klines.poll():
+            print(bar.open_date, bar.close)
+        time.sleep(60)
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from .series import as_records, open_date_of, timeframe_seconds
+
+SyncKey = Tuple[str, str, Optional[str], str, Any]
+
+
+def endpoint_name(endpoint: Callable[..., Any]) -> str:
+    """
+    Obtiene un nombre estable para un método de API (ej: "OrderflowApi.klines_get").
+
+    Args:
+        endpoint: Método de una clase de API generada
+
+    Returns:
+        Nombre calificado del método
+    """
+    return getattr(endpoint, "__qualname__", None) or repr(endpoint)
+
+
+def endpoint_client(endpoint: Callable[..., Any]) -> Any:
+    """
+    Obtiene el ``ApiClient`` de un método de API ligado a una instancia.
+
+    Args:
+        endpoint: Método de una instancia de API generada
+
+    Returns:
+        El ``ApiClient`` de la instancia, o None si el endpoint no es un
+        método ligado (ej: una función o un mock)
+    """
+    return getattr(getattr(endpoint, "__self__", None), "api_client", None)
+
+
+def sync_key(
+    endpoint: Callable[..., Any], coin: str, exchange: Optional[str], timeframe: str
+) -> SyncKey:
+    """Clave de una serie; incluye el cliente para no compartir estado entre
+    distintos ``ApiClient`` con la misma clase de API."""
+    return (
+        endpoint_name(endpoint),
+        coin,
+        exchange,
+        timeframe,
+        endpoint_client(endpoint),
+    )
+
+
+class IncrementalSync:
+    """
+    Estado de sincronización de una serie (endpoint, coin, exchange, timeframe).
+
+    Attributes:
+        endpoint: Método de API que se consulta (ej: ``OrderflowApi.klines_get``)
+        coin: Moneda consultada
+        exchange: Exchange consultado, o None para el valor por defecto
+        timeframe: Timeframe de las barras
+        params: Parámetros adicionales que se pasan en cada llamada
+        last_closed: ``openDate`` de la última barra cerrada recibida
+    """
+
+    def __init__(
+        self,
+        endpoint: Callable[..., Any],
+        coin: str,
+        timeframe: str,
+        exchange: Optional[str] = None,
+        maxlen: int = 1000,
+        initial_limit: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+        **params: Any,
+    ):
+        """
+        Inicializa la sincronización de una serie.
+
+        Args:
+            endpoint: Método de API a consultar
+            coin: Moneda (ej: "BTC")
+            timeframe: Timeframe de las barras (ej: "1m")
+            exchange: Exchange (ej: "binance")
+            maxlen: Número máximo de barras guardadas en el buffer
+            initial_limit: ``limit`` de la primera llamada; por defecto
+                ``maxlen``
+            clock: Función que retorna el tiempo actual en segundos
+            **params: Parámetros extra del endpoint (ej: ``depth``)
+        """
+        self.endpoint = endpoint
+        self.coin = coin
+        self.timeframe = timeframe
+        self.exchange = exchange
+        self.params = params
+        self.initial_limit = initial_limit if initial_limit is not None else maxlen
+        self.last_closed: Optional[int] = None
+
+        self._step = timeframe_seconds(timeframe)
+        self._clock = clock
+        self._buffer: Deque[Any] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    @property
+    def key(self) -> SyncKey:
+        """Clave (endpoint, coin, exchange, timeframe, cliente) de la serie."""
+        return sync_key(self.endpoint, self.coin, self.exchange, self.timeframe)
+
+    @property
+    def step(self) -> int:
+        """Duración de cada barra en segundos."""
+        return self._step
+
+    @property
+    def maxlen(self) -> int:
+        """Capacidad del buffer circular."""
+        return self._buffer.maxlen or 0
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.snapshot())
+
+    def snapshot(self) -> List[Any]:
+        """
+        Copia el contenido del buffer ordenado por ``openDate``.
+
+        Returns:
+            Lista de barras, de la más antigua a la más reciente
+        """
+        with self._lock:
+            return list(self._buffer)
+
+    @property
+    def last_open_date(self) -> Optional[int]:
+        """``openDate`` de la barra más reciente del buffer."""
+        with self._lock:
+            return open_date_of(self._buffer[-1]) if self._buffer else None
+
+    def request_params(self) -> Dict[str, Any]:
+        """
+        Construye los parámetros de la próxima llamada al endpoint.
+
+        Returns:
+            Argumentos por nombre para el método de API
+        """
+        params: Dict[str, Any] = {"coin": self.coin, "timeframe": self.timeframe}
+        if self.exchange is not None:
+            params["exchange"] = self.exchange
+        params.update(self.params)
+        if self.last_closed is None:
+            params["limit"] = self.initial_limit
+        else:
+            # Los endpoints generados declaran start_time como StrictStr.
+            params["start_time"] = str(self.last_closed + 1)
+        return params
+
+    def poll(self) -> List[Any]:
+        """
+        Consulta el endpoint y actualiza el buffer.
+
+        Returns:
+            Barras nuevas o actualizadas en esta llamada, ordenadas por
+            ``openDate``
+        """
+        response = self.endpoint(**self.request_params())
+        return self.apply(response)
+
+    def apply(self, response: Any) -> List[Any]:
+        """
+        Incorpora al buffer la respuesta de una llamada al endpoint.
+
+        Las barras cuyo ``openDate`` ya está en el buffer (la barra que seguía
+        abierta) se reemplazan; las posteriores se agregan al final.
+
+        Args:
+            response: Respuesta del endpoint
+
+        Returns:
+            Barras nuevas o actualizadas, ordenadas por ``openDate``
+        """
+        records: List[Tuple[int, Any]] = []
+        for record in as_records(response):
+            open_date = open_date_of(record)
+            if open_date is not None:
+                records.append((open_date, record))
+        records.sort(key=lambda item: item[0])
+        now = self._clock()
+
+        changed: List[Any] = []
+        with self._lock:
+            for open_date, record in records:
+                if self.last_closed is not None and open_date <= self.last_closed:
+                    continue
+                if self._replace(open_date, record):
+                    changed.append(record)
+                    continue
+                newest = open_date_of(self._buffer[-1]) if self._buffer else None
+                if newest is None or open_date > newest:
+                    self._buffer.append(record)
+                    changed.append(record)
+
+            for record in reversed(self._buffer):
+                closed = open_date_of(record)
+                if closed is not None and closed + self._step <= now:
+                    self.last_closed = closed
+                    break
+        return changed
+
+    def _replace(self, open_date: int, record: Any) -> bool:
+        """Reemplaza la barra con el mismo ``openDate`` al final del buffer."""
+        for i in range(len(self._buffer) - 1, -1, -1):
+            current = open_date_of(self._buffer[i])
+            if current == open_date:
+                self._buffer[i] = record
+                return True
+            if current is not None and current < open_date:
+                return False
+        return False
+
+    def reset(self) -> None:
+        """Vacía el buffer y fuerza una descarga completa en la próxima llamada."""
+        with self._lock:
+            self._buffer.clear()
+            self.last_closed = None
+
+
+class SyncManager:
+    """
+    Registro de sincronizaciones incrementales, una por serie.
+
+    Example:
+        manager = SyncManager(maxlen=500)
+        manager.get(orderflow_api.klines_get, "BTC", "1m", exchange="binance")
+        manager.get(funding_api.funding_rate_get, "BTC", "1h")
+        updates = manager.poll_all()
+    """
+
+    def __init__(self, maxlen: int = 1000, clock: Callable[[], float] = time.time):
+        """
+        Inicializa el registro.
+
+        Args:
+            maxlen: Capacidad del buffer de cada serie
+            clock: Función que retorna el tiempo actual en segundos
+        """
+        self.maxlen = maxlen
+        self._clock = clock
+        self._syncs: Dict[SyncKey, IncrementalSync] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._syncs)
+
+    def get(
+        self,
+        endpoint: Callable[..., Any],
+        coin: str,
+        timeframe: str,
+        exchange: Optional[str] = None,
+        **params: Any,
+    ) -> IncrementalSync:
+        """
+        Obtiene (o crea) la sincronización de una serie.
+
+        Args:
+            endpoint: Método de API a consultar
+            coin: Moneda
+            timeframe: Timeframe de las barras
+            exchange: Exchange
+            **params: Parámetros extra del endpoint
+
+        Returns:
+            Sincronización asociada a (endpoint, coin, exchange, timeframe,
+            cliente)
+        """
+        key = sync_key(endpoint, coin, exchange, timeframe)
+        with self._lock:
+            sync = self._syncs.get(key)
+            if sync is None:
+                sync = IncrementalSync(
+                    endpoint,
+                    coin,
+                    timeframe,
+                    exchange=exchange,
+                    maxlen=self.maxlen,
+                    clock=self._clock,
+                    **params,
+                )
+                self._syncs[key] = sync
+            return sync
+
+    def syncs(self) -> List[IncrementalSync]:
+        """Lista las sincronizaciones registradas."""
+        with self._lock:
+            return list(self._syncs.values())
+
+    def poll_all(self) -> Dict[SyncKey, List[Any]]:
+        """
+        Consulta todas las series registradas de forma secuencial.
+
+        Returns:
+            Diccionario clave -> barras nuevas o actualizadas
+        """
+        return {sync.key: sync.poll() for sync in self.syncs()}
@@ -0,0 +1,22 @@
+"""
+Utilidades para probar y medir el SDK sin acceder a la API real.
+"""
+
+from .payloads import (
+    model_classes,
+    resolve_model,
+    synthetic_payload,
+    synthetic_record,
+    synthetic_rows,
+)
+from .server import StandInServer, api_routes
+
+__all__ = [
+    "StandInServer",
+    "api_routes",
+    "model_classes",
+    "resolve_model",
+    "synthetic_payload",
+    "synthetic_record",
+    "synthetic_rows",
+]
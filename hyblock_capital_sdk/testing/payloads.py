@@ -0,0 +1,175 @@
+"""
+Payloads sintéticos para los modelos generados.
+
+Genera registros JSON válidos para cualquier modelo de
+``hyblock_capital_sdk.models`` recorriendo sus campos de pydantic, de modo que
+los benchmarks y servidores de prueba no dependan de respuestas reales ni
+haya que mantenerlos al regenerar el SDK. Los valores son deterministas: el
+mismo modelo, índice y semilla producen siempre el mismo registro.
+
+Example:
+    rows = synthetic_rows(Klines, 1000)
+    payload = synthetic_payload("Klines", 1000)  # bytes JSON
+"""
+
+import json
+import random
+import typing
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from .. import models
+
+# Marca temporal base (2024-01-01 00:00 UTC) y paso de las fechas sintéticas
+BASE_TIMESTAMP = 1704067200
+TIMESTAMP_STEP = 60
+
+STRING_VALUES = {
+    "coin": "BTC",
+    "exchange": "binance",
+    "timeframe": "1m",
+    "side": "long",
+}
+
+
+@lru_cache(maxsize=None)
+def model_classes() -> Dict[str, Type[BaseModel]]:
+    """
+    Lista los modelos generados.
+
+    Returns:
+        Diccionario nombre -> clase de cada modelo de pydantic
+    """
+    return {
+        name: value
+        for name, value in vars(models).items()
+        if isinstance(value, type)
+        and issubclass(value, BaseModel)
+        and value is not BaseModel
+    }
+
+
+def resolve_model(model: Union[str, Type[BaseModel]]) -> Type[BaseModel]:
+    """
+    Obtiene la clase de un modelo a partir de su nombre.
+
+    Args:
+        model: Nombre (ej: "Klines") o clase del modelo
+
+    Returns:
+        Clase del modelo
+
+    Raises:
+        KeyError: Si no existe un modelo con ese nombre
+    """
+    if isinstance(model, type):
+        return model
+    try:
+        return model_classes()[model]
+    except KeyError:
+        raise KeyError(f"Modelo desconocido: {model!r}") from None
+
+
+def _value(
+    name: str, annotation: Any, index: int, rng: random.Random, list_size: int
+) -> Any:
+    """Genera un valor para un campo según su tipo."""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Annotated:
+        return _value(name, typing.get_args(annotation)[0], index, rng, list_size)
+    if origin is Union:
+        options = [a for a in typing.get_args(annotation) if a is not type(None)]
+        # Union[StrictFloat, StrictInt]: se prefiere float
+        return _value(name, options[0], index, rng, list_size)
+    if origin in (list, List):
+        (item,) = typing.get_args(annotation)
+        return [
+            _value(name, item, index * list_size + i, rng, list_size)
+            for i in range(list_size)
+        ]
+    if origin in (dict, Dict):
+        return {}
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return synthetic_record(annotation, index, rng, list_size)
+    if annotation is bool:
+        return index % 2 == 0
+    if annotation is int:
+        lowered = name.lower()
+        if "date" in lowered or "time" in lowered:
+            return BASE_TIMESTAMP + index * TIMESTAMP_STEP
+        return rng.randint(0, 10_000)
+    if annotation is float:
+        return round(rng.uniform(0, 100_000), 4)
+    if annotation is str:
+        return STRING_VALUES.get(name, f"{name}-{index}")
+    return None
+
+
+def synthetic_record(
+    model: Union[str, Type[BaseModel]],
+    index: int = 0,
+    rng: Optional[random.Random] = None,
+    list_size: int = 3,
+) -> Dict[str, Any]:
+    """
+    Genera un registro JSON (con los alias de la API) para un modelo.
+
+    Args:
+        model: Nombre o clase del modelo
+        index: Posición del registro; define las fechas (``openDate``...)
+        rng: Generador de números aleatorios; por defecto uno con semilla
+            ``index``
+        list_size: Elementos de los campos lista (ej: ``data`` de los
+            perfiles)
+
+    Returns:
+        Diccionario que ``Model.from_dict`` acepta
+    """
+    cls = resolve_model(model)
+    rng = rng if rng is not None else random.Random(index)
+    record = {}
+    for name, field in cls.model_fields.items():
+        if name == "additional_properties":
+            continue
+        value = _value(field.alias or name, field.annotation, index, rng, list_size)
+        if value is not None:
+            record[field.alias or name] = value
+    return record
+
+
+def synthetic_rows(
+    model: Union[str, Type[BaseModel]], rows: int, seed: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Genera una lista de registros con fechas consecutivas.
+
+    Args:
+        model: Nombre o clase del modelo
+        rows: Número de registros
+        seed: Semilla de los valores numéricos
+
+    Returns:
+        Lista de registros JSON
+    """
+    cls = resolve_model(model)
+    rng = random.Random(seed)
+    return [synthetic_record(cls, i, rng) for i in range(rows)]
+
+
+def synthetic_payload(
+    model: Union[str, Type[BaseModel]], rows: int, seed: int = 0
+) -> bytes:
+    """
+    Genera el cuerpo JSON de una respuesta con ``rows`` registros.
+
+    Args:
+        model: Nombre o clase del modelo
+        rows: Número de registros
+        seed: Semilla de los valores numéricos
+
+    Returns:
+        JSON codificado en UTF-8
+    """
+    return json.dumps(synthetic_rows(model, rows, seed)).encode()
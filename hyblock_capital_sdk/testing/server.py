@@ -0,0 +1,302 @@
+"""
+Servidor HTTP local que imita la API de Hyblock Capital.
+
+``StandInServer`` responde a todas las rutas de las APIs generadas
+(``/klines``, ``/liquidationLevels``, ``/catalog``...) con payloads
+sintéticos del modelo de respuesta de cada ruta, de modo que los tests y las
+pruebas de carga ejercitan el transporte HTTP/1.1 real sin red ni
+consumo de hits. Permite configurar latencia, tasa de errores, inyección de
+429, límite de hits por API key y tamaño de los payloads.
+
+Example:
+    with StandInServer(latency=0.02, rate_limit_rate=0.01) as server:
+        api_client = hc.ApiClient(server.configuration())
+        klines = hc.OrderflowApi(api_client).klines_get(
+            coin="BTC", timeframe="1m", exchange="binance"
+        )
+"""
+
+import inspect
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from .. import api
+from ..configuration import Configuration
+from .payloads import resolve_model, synthetic_record, synthetic_rows
+
+_RESOURCE_PATH = re.compile(r"resource_path=['\"]([^'\"]+)['\"]")
+_RESPONSE_200 = re.compile(r"['\"]200['\"]: ['\"](\w+)['\"]")
+
+
+@lru_cache(maxsize=None)
+def api_routes() -> Dict[str, str]:
+    """
+    Obtiene las rutas de las APIs generadas y su modelo de respuesta.
+
+    Se leen del código generado (``resource_path`` y el tipo de la respuesta
+    200 de cada método), así que se actualizan solas al regenerar el SDK.
+
+    Returns:
+        Diccionario ruta (ej: "/klines") -> nombre del modelo (ej: "Klines")
+    """
+    routes = {}
+    for name in dir(api):
+        cls = getattr(api, name)
+        if not isinstance(cls, type) or not name.endswith("Api"):
+            continue
+        for attr, func in vars(cls).items():
+            if not (attr.startswith("_") and attr.endswith("_serialize")):
+                continue
+            public = getattr(cls, attr[1 : -len("_serialize")], None)
+            path = _RESOURCE_PATH.search(inspect.getsource(func))
+            model = _RESPONSE_200.search(inspect.getsource(public)) if public else None
+            if path and model:
+                routes[path.group(1)] = model.group(1)
+    return routes
+
+
+class StandInServer:
+    """
+    Servidor local con las rutas de la API y fallos configurables.
+
+    Attributes:
+        latency: Segundos de espera antes de cada respuesta
+        jitter: Variación aleatoria máxima (±) de la latencia
+        error_rate: Probabilidad de responder 500
+        rate_limit_rate: Probabilidad de responder 429
+        hit_limit: Hits disponibles por API key (None = sin límite); al
+            agotarse se responde 429 y ``/remainingHitBalance`` (que no
+            consume hits) informa el saldo restante
+        retry_after: Valor del header ``Retry-After`` de los 429
+        rows: None para responder un objeto (lo que esperan las APIs
+            generadas) o un número para responder una lista de ese tamaño
+        list_size: Elementos de los campos lista de cada objeto
+        api_key: API key exigida en ``x-api-key`` (None = no se valida)
+        requests: Peticiones recibidas por ruta
+        statuses: Respuestas enviadas por código HTTP
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        hit_limit: Optional[int] = None,
+        retry_after: float = 1.0,
+        rows: Optional[int] = None,
+        list_size: int = 3,
+        api_key: Optional[str] = None,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Inicializa el servidor (sin arrancarlo).
+
+        Args:
+            latency: Segundos de espera antes de cada respuesta
+            jitter: Variación aleatoria máxima de la latencia
+            error_rate: Probabilidad de responder 500
+            rate_limit_rate: Probabilidad de responder 429
+            hit_limit: Hits disponibles por API key
+            retry_after: Segundos del header ``Retry-After``
+            rows: Filas de cada respuesta, o None para un objeto
+            list_size: Elementos de los campos lista de cada objeto
+            api_key: API key exigida, o None para no validar
+            seed: Semilla de los fallos aleatorios y los payloads
+            host: Interfaz donde escuchar
+            port: Puerto (0 = uno libre)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.hit_limit = hit_limit
+        self.retry_after = retry_after
+        self.rows = rows
+        self.list_size = list_size
+        self.api_key = api_key
+        self.seed = seed
+        self.requests: Counter = Counter()
+        self.statuses: Counter = Counter()
+
+        self._address = (host, port)
+        self._rng = random.Random(seed)
+        self._hits: Counter = Counter()
+        self._payloads: Dict[Tuple[str, Optional[int], int], bytes] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    @property
+    def host(self) -> str:
+        """URL base del servidor (ej: "http://127.0.0.1:54321")."""
+        if self._server is None:
+            raise RuntimeError("El servidor no está arrancado")
+        return f"http://{self._address[0]}:{self._server.server_port}"
+
+    def start(self) -> "StandInServer":
+        """
+        Arranca el servidor en un hilo en segundo plano.
+
+        Returns:
+            El propio servidor
+        """
+        if self._server is None:
+            self._server = ThreadingHTTPServer(self._address, self._handler())
+            self._server.daemon_threads = True
+            threading.Thread(
+                target=self._server.serve_forever, name="hyblock-standin", daemon=True
+            ).start()
+        return self
+
+    def stop(self) -> None:
+        """Detiene el servidor y libera el puerto."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def configuration(self, **kwargs: Any) -> Configuration:
+        """
+        Crea una ``Configuration`` apuntando al servidor.
+
+        Args:
+            **kwargs: Argumentos adicionales de ``Configuration``
+
+        Returns:
+            Configuración con ``host`` y, si se exige, la API key
+        """
+        if self.api_key is not None:
+            kwargs.setdefault("api_key", {"Api Key": self.api_key})
+        return Configuration(host=self.host, **kwargs)
+
+    def reset(self) -> None:
+        """Reinicia los contadores y el consumo de hits."""
+        with self._lock:
+            self.requests.clear()
+            self.statuses.clear()
+            self._hits.clear()
+
+    def payload(self, path: str) -> Optional[bytes]:
+        """
+        Obtiene el cuerpo JSON que se responde en una ruta.
+
+        Args:
+            path: Ruta de la API (ej: "/klines")
+
+        Returns:
+            JSON codificado, o None si la ruta no existe
+        """
+        model = api_routes().get(path)
+        if model is None:
+            return None
+        key = (path, self.rows, self.list_size)
+        body = self._payloads.get(key)
+        if body is None:
+            if self.rows is None:
+                data: Any = synthetic_record(
+                    model, rng=random.Random(self.seed), list_size=self.list_size
+                )
+            else:
+                data = synthetic_rows(model, self.rows, self.seed)
+            body = json.dumps(data).encode()
+            self._payloads[key] = body
+        return body
+
+    def respond(
+        self, path: str, query: Dict[str, str], headers: Dict[str, str]
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        """
+        Decide la respuesta a una petición.
+
+        Args:
+            path: Ruta sin query
+            query: Parámetros de la query
+            headers: Headers de la petición (en minúsculas)
+
+        Returns:
+            Tupla (código HTTP, cuerpo, headers extra)
+        """
+        key = headers.get("x-api-key")
+        with self._lock:
+            self.requests[path] += 1
+            roll = self._rng.random()
+            delay = self.latency + self._rng.uniform(-self.jitter, self.jitter)
+            authorized = self.api_key is None or key == self.api_key
+            if authorized and path != "/remainingHitBalance":
+                self._hits[key] += 1
+            hits = self._hits[key]
+        if delay > 0:
+            time.sleep(delay)
+
+        if not authorized:
+            return 401, self._error(401), {}
+        if path == "/remainingHitBalance" and self.hit_limit is not None:
+            remaining = max(0, self.hit_limit - hits)
+            return 200, json.dumps({"remaining_hits": remaining}).encode(), {}
+        retry_after = {"Retry-After": f"{self.retry_after:g}"}
+        if self.hit_limit is not None and hits > self.hit_limit:
+            return 429, self._error(429), retry_after
+        if roll < self.rate_limit_rate:
+            return 429, self._error(429), retry_after
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 500, self._error(500), {}
+
+        body = self.payload(path)
+        if body is None:
+            return 404, self._error(404), {}
+        return 200, body, {}
+
+    @staticmethod
+    def _error(status: int) -> bytes:
+        error = resolve_model(f"Error{status}")()
+        # lo mismo que error.to_dict() de un modelo recién creado
+        body = error.model_dump(
+            by_alias=True, exclude={"additional_properties"}, exclude_none=True
+        )
+        return json.dumps(body).encode()
+
+    def _handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers y cuerpo van en escrituras separadas; sin TCP_NODELAY
+            # el ACK retardado añade ~40 ms a cada respuesta
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                path, _, query = self.path.partition("?")
+                headers = {k.lower(): v for k, v in self.headers.items()}
+                status, body, extra = server.respond(
+                    path, dict(parse_qsl(query)), headers
+                )
+                with server._lock:
+                    server.statuses[status] += 1
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in extra.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,350 @@
+"""
+Tiempos por fase de cada petición de ``ApiClient``.
+
+Cuando una llamada es lenta no se sabe si el tiempo se fue en la red, en
+``json.loads`` o en la validación de pydantic. Asignando un callback a
+``ApiClient.request_observer`` cada petición registra un ``RequestTimings``
+con sus fases y lo entrega al callback al terminar la deserialización:
+
+- ``queue_wait``: espera por una conexión libre (sólo con ``PoolMonitor``)
+- ``connect``: apertura de conexiones TCP/TLS nuevas
+- ``ttfb``: desde el envío hasta recibir los headers, sin ``connect``
+- ``download``: lectura del cuerpo
+- ``decode``: decodificación del texto y ``json.loads``
+- ``model``: construcción de los modelos (``from_dict``)
+
+Las peticiones que fallan sin respuesta (conexión rechazada, timeout...) se
+entregan igual, con ``status`` None y la excepción en ``error``.
+
+``ApiClient`` instrumenta el ``PoolManager`` al crear el transporte, de modo
+que cada conexión nueva mide su ``connect``; fuera de eso, sin observer no se
+crea ningún objeto ni se toma ningún tiempo.
+
+Example:
+    def log_slow(timings):
+        if timings.total > 1.0:
+            print(timings.to_dict())
+
+    api_client.request_observer = log_slow
+"""
+
+import logging
+import threading
+import time
+import weakref
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, Optional
+
+import urllib3
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("queue_wait", "connect", "ttfb", "download", "decode", "model")
+
+# segundos de connect acumulados por el hilo en la petición en curso
+_connect = threading.local()
+
+# PoolManager instrumentados -> sus clases de pool originales
+_instrumented: "weakref.WeakKeyDictionary[urllib3.PoolManager, Dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _timed_connect(connect: Callable[[Any], None]) -> Callable[[Any], None]:
+    def timed(self: Any) -> None:
+        started = time.perf_counter()
+        try:
+            connect(self)
+        finally:
+            _connect.seconds = getattr(_connect, "seconds", 0.0) + (
+                time.perf_counter() - started
+            )
+
+    return timed
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """``HTTPConnection`` que registra la duración de ``connect``."""
+
+    connect = _timed_connect(HTTPConnection.connect)
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    """``HTTPSConnection`` que registra la duración de ``connect`` (TCP + TLS)."""
+
+    connect = _timed_connect(HTTPSConnection.connect)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+def instrument_pool_manager(pool_manager: urllib3.PoolManager) -> None:
+    """
+    Hace que las conexiones nuevas de un ``PoolManager`` midan su ``connect``.
+
+    Afecta a los pools ya creados y a los que se creen después. Llamarla
+    varias veces no tiene efecto adicional; ``restore_pool_manager`` la
+    deshace.
+
+    Args:
+        pool_manager: ``PoolManager`` del ``RESTClientObject``
+    """
+    if pool_manager in _instrumented:
+        return
+    _instrumented[pool_manager] = pool_manager.pool_classes_by_scheme
+    pool_manager.pool_classes_by_scheme = {
+        "http": TimedHTTPConnectionPool,
+        "https": TimedHTTPSConnectionPool,
+    }
+    for key in pool_manager.pools.keys():
+        pool = pool_manager.pools.get(key)
+        if pool is None:
+            continue
+        if isinstance(pool, HTTPSConnectionPool):
+            pool.ConnectionCls = TimedHTTPSConnection
+        else:
+            pool.ConnectionCls = TimedHTTPConnection
+
+
+def restore_pool_manager(pool_manager: urllib3.PoolManager) -> None:
+    """
+    Devuelve a un ``PoolManager`` sus clases de conexión originales.
+
+    Args:
+        pool_manager: ``PoolManager`` instrumentado con
+            ``instrument_pool_manager``; si no lo está no se modifica
+    """
+    original = _instrumented.pop(pool_manager, None)
+    if original is None:
+        return
+    pool_manager.pool_classes_by_scheme = original
+    for key in pool_manager.pools.keys():
+        pool = pool_manager.pools.get(key)
+        if pool is None:
+            continue
+        if isinstance(pool, HTTPSConnectionPool):
+            pool.ConnectionCls = HTTPSConnection
+        else:
+            pool.ConnectionCls = HTTPConnection
+
+
+def is_instrumented(pool_manager: Optional[urllib3.PoolManager]) -> bool:
+    """
+    Indica si las conexiones nuevas de un ``PoolManager`` miden su ``connect``.
+
+    Args:
+        pool_manager: ``PoolManager`` del transporte, o None si el transporte
+            no usa urllib3
+
+    Returns:
+        True si se instrumentó con ``instrument_pool_manager``
+    """
+    return pool_manager is not None and pool_manager in _instrumented
+
+
+def count_rows(data: Any) -> int:
+    """
+    Cuenta las filas de un JSON decodificado.
+
+    Args:
+        data: Lista, diccionario (con o sin clave ``data``) u otro valor
+
+    Returns:
+        Longitud de la lista, 1 para un objeto, 0 en otro caso
+    """
+    if isinstance(data, list):
+        return len(data)
+    if isinstance(data, dict):
+        rows = data.get("data")
+        return len(rows) if isinstance(rows, list) else 1
+    return 0
+
+
+class RequestTimings:
+    """
+    Tiempos y tamaños de una petición.
+
+    Attributes:
+        method: Método HTTP
+        url: URL completa
+        status: Código HTTP de la respuesta, o None si no hubo respuesta
+        error: Excepción del transporte si la petición falló sin respuesta
+        cached: True si la respuesta salió de la ``ResponseCache``
+        queue_wait: Segundos esperando una conexión libre
+        connect: Segundos abriendo conexiones, o None si el transporte no lo
+            informa
+        ttfb: Segundos hasta recibir los headers, sin ``connect``
+        download: Segundos leyendo el cuerpo
+        decode: Segundos decodificando el JSON
+        model: Segundos construyendo los modelos
+        request_bytes: Tamaño del cuerpo enviado
+        response_bytes: Tamaño del cuerpo recibido
+        rows: Filas del JSON recibido
+        retries: Reintentos hechos por urllib3 antes de la respuesta
+        retry_after: Segundos indicados en el header ``Retry-After``
+        started_ns: Instante de inicio (``time.time_ns``)
+        finished_ns: Instante en que se entregó al observer
+        span: Span de la petición abierto por el observer (``Tracer``)
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "status",
+        "error",
+        "cached",
+        "request_bytes",
+        "response_bytes",
+        "rows",
+        "retries",
+        "retry_after",
+        "started_ns",
+        "finished_ns",
+        "observer",
+        "span",
+        "_mark",
+    ) + PHASES
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        observer: Callable[["RequestTimings"], Any],
+        body: Any = None,
+    ):
+        self.method = method
+        self.url = url
+        self.observer = observer
+        self.status: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.cached = False
+        self.request_bytes = len(body) if isinstance(body, (str, bytes)) else 0
+        self.response_bytes = 0
+        self.rows = 0
+        self.retries = 0
+        self.retry_after: Optional[float] = None
+        self.started_ns = time.time_ns()
+        self.finished_ns: Optional[int] = None
+        self.span: Any = None
+        self.queue_wait = 0.0
+        self.connect: Optional[float] = 0.0
+        self.ttfb = 0.0
+        self.download = 0.0
+        self.decode = 0.0
+        self.model = 0.0
+        self._mark = time.perf_counter()
+
+    @property
+    def total(self) -> float:
+        """Suma de todas las fases en segundos."""
+        return sum(getattr(self, phase) or 0.0 for phase in PHASES)
+
+    def open_span(self, name: str) -> ContextManager[Any]:
+        """
+        Abre un span de la petición si el observer genera trazas.
+
+        Args:
+            name: Nombre del span (ej: "hyblock.call_api")
+
+        Returns:
+            Context manager del span, o uno vacío si el observer no tiene
+            ``open_span`` (ver ``tracing.Tracer``)
+        """
+        open_span = getattr(self.observer, "open_span", None)
+        if open_span is None:
+            return nullcontext()
+        span: ContextManager[Any] = open_span(self, name)
+        return span
+
+    def start(self) -> None:
+        """Empieza a medir una fase."""
+        self._mark = time.perf_counter()
+
+    def stop(self, phase: str) -> None:
+        """Termina la fase en curso y empieza la siguiente."""
+        now = time.perf_counter()
+        setattr(self, phase, getattr(self, phase) + now - self._mark)
+        self._mark = now
+
+    def send(self) -> None:
+        """Marca el envío de la petición."""
+        _connect.seconds = 0.0
+        self.start()
+
+    def headers_received(self, response: Any, instrumented: bool) -> None:
+        """
+        Marca la recepción de los headers y separa ``connect`` de ``ttfb``.
+
+        Args:
+            response: ``RESTResponse`` recibido
+            instrumented: True si el transporte mide ``connect``
+        """
+        self.stop("ttfb")
+        retries = getattr(response.response, "retries", None)
+        self.retries = len(getattr(retries, "history", None) or ())
+        retry_after = response.getheader("Retry-After")
+        try:
+            self.retry_after = float(retry_after) if retry_after else None
+        except ValueError:
+            self.retry_after = None
+        if instrumented:
+            self.connect = _connect.seconds
+            self.ttfb = max(0.0, self.ttfb - self.connect)
+        else:
+            self.connect = None
+
+    def finish(
+        self,
+        status: Optional[int],
+        data: Optional[bytes],
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Completa los datos de la respuesta y entrega los tiempos al observer.
+
+        Los errores del observer se registran en el log y no se propagan.
+
+        Args:
+            status: Código HTTP, o None si el transporte falló
+            data: Cuerpo de la respuesta
+            error: Excepción del transporte, si no hubo respuesta
+        """
+        self.status = status
+        self.error = error
+        self.response_bytes = len(data) if data is not None else 0
+        self.finished_ns = time.time_ns()
+        try:
+            self.observer(self)
+        except Exception:
+            logger.exception("Falló el observer de tiempos de %s", self.url)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convierte los tiempos a diccionario.
+
+        Returns:
+            Diccionario con los datos de la petición, cada fase y ``total``
+        """
+        result: Dict[str, Any] = {
+            "method": self.method,
+            "url": self.url,
+            "status": self.status,
+            "error": repr(self.error) if self.error is not None else None,
+            "cached": self.cached,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "rows": self.rows,
+            "retries": self.retries,
+            "retry_after": self.retry_after,
+        }
+        for phase in PHASES:
+            result[phase] = getattr(self, phase)
+        result["total"] = self.total
+        return result
@@ -0,0 +1,472 @@
+"""
+Trazas y métricas de las llamadas del SDK.
+
+``Tracer`` se asigna como ``ApiClient.request_observer``. Mientras dura cada
+petición mantiene abiertos dos spans reales:
+
+- ``hyblock.call_api`` (red), activo en el hilo durante ``call_api`` y
+  terminado al entregarse los tiempos de la petición;
+- ``hyblock.response_deserialize`` (decodificación y modelos), hijo del
+  anterior.
+
+Los spans llevan los atributos ``hyblock.resource``, ``hyblock.coin``,
+``hyblock.exchange``, ``hyblock.timeframe``, ``http.status_code``,
+``hyblock.response_bytes`` y ``hyblock.rows``. Además se registran métricas:
+contadores de peticiones, errores, reintentos, aciertos de caché y respuestas
+429, e histogramas de latencia, espera por conexión y del ``Retry-After``
+indicado por el servidor.
+
+Las peticiones que fallan sin respuesta (conexión rechazada, timeout...)
+también cierran su span con error y cuentan en ``hyblock.client.errors``.
+
+Los spans y las métricas se entregan a un ``Exporter``. ``InMemoryExporter``
+los guarda en listas (para tests) y ``OpenTelemetryExporter`` los reenvía a
+OpenTelemetry, que es una dependencia opcional
+(``pip install hyblock-capital-sdk[tracing]``).
+
+Example:
+    exporter = OpenTelemetryExporter()
+    api_client.request_observer = Tracer(exporter)
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+from urllib.parse import parse_qsl, urlsplit
+
+from .timings import RequestTimings
+
+logger = logging.getLogger(__name__)
+
+TRACED_PARAMS = ("coin", "exchange", "timeframe")
+
+
+class Span(NamedTuple):
+    """Span terminado de una llamada del SDK."""
+
+    name: str
+    parent: Optional[str]
+    start_ns: int
+    end_ns: int
+    attributes: Dict[str, Any]
+    error: bool
+
+    @property
+    def duration(self) -> float:
+        """Duración del span en segundos."""
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+class MetricPoint(NamedTuple):
+    """Medición de un contador (``counter``) o histograma (``histogram``)."""
+
+    name: str
+    kind: str
+    value: float
+    attributes: Dict[str, Any]
+
+
+class Exporter(ABC):
+    """
+    Destino de los spans y métricas del ``Tracer``.
+
+    Las subclases implementan ``start_span``, ``end_span`` y
+    ``export_metric``; todos se llaman desde el hilo que hizo la petición.
+    """
+
+    @abstractmethod
+    def start_span(
+        self, name: str, attributes: Dict[str, Any], parent: Any = None
+    ) -> ContextManager[Any]:
+        """
+        Empieza un span y lo hace el span activo del hilo durante el bloque.
+
+        Al salir del bloque el span sigue abierto hasta ``end_span``.
+
+        Args:
+            name: Nombre del span
+            attributes: Atributos iniciales
+            parent: Span padre devuelto por este método; por defecto el span
+                activo del hilo
+        """
+
+    @abstractmethod
+    def end_span(
+        self,
+        span: Any,
+        attributes: Dict[str, Any],
+        error: bool,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Termina un span empezado con ``start_span``.
+
+        Args:
+            span: Span a terminar
+            attributes: Atributos a agregar
+            error: True si la operación falló
+            exception: Excepción que terminó la operación, si la hubo
+        """
+
+    @abstractmethod
+    def export_metric(self, point: MetricPoint) -> None:
+        """Exporta una medición de contador o histograma."""
+
+
+class _OpenSpan:
+    """Span en curso de ``InMemoryExporter``."""
+
+    __slots__ = ("name", "parent", "start_ns", "attributes")
+
+    def __init__(self, name: str, parent: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.parent = parent
+        self.start_ns = time.time_ns()
+        self.attributes = dict(attributes)
+
+
+class InMemoryExporter(Exporter):
+    """
+    Exporter que guarda los spans y métricas en memoria.
+
+    Attributes:
+        spans: Spans exportados, en orden
+        metrics: Métricas exportadas, en orden
+    """
+
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+        self.metrics: List[MetricPoint] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def start_span(
+        self, name: str, attributes: Dict[str, Any], parent: Any = None
+    ) -> Iterator[_OpenSpan]:
+        yield _OpenSpan(name, parent.name if parent is not None else None, attributes)
+
+    def end_span(
+        self,
+        span: Any,
+        attributes: Dict[str, Any],
+        error: bool,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        finished = Span(
+            name=span.name,
+            parent=span.parent,
+            start_ns=span.start_ns,
+            end_ns=time.time_ns(),
+            attributes={**span.attributes, **attributes},
+            error=error,
+        )
+        with self._lock:
+            self.spans.append(finished)
+
+    def export_metric(self, point: MetricPoint) -> None:
+        with self._lock:
+            self.metrics.append(point)
+
+    def counter(self, name: str, **attributes: Any) -> float:
+        """
+        Suma un contador, opcionalmente filtrado por atributos.
+
+        Args:
+            name: Nombre de la métrica
+            **attributes: Atributos que deben coincidir
+
+        Returns:
+            Suma de los valores
+        """
+        return sum(p.value for p in self._points(name, "counter", attributes))
+
+    def histogram(self, name: str, **attributes: Any) -> List[float]:
+        """
+        Obtiene los valores registrados en un histograma.
+
+        Args:
+            name: Nombre de la métrica
+            **attributes: Atributos que deben coincidir
+
+        Returns:
+            Valores en orden de registro
+        """
+        return [p.value for p in self._points(name, "histogram", attributes)]
+
+    def clear(self) -> None:
+        """Descarta los spans y métricas guardados."""
+        with self._lock:
+            self.spans.clear()
+            self.metrics.clear()
+
+    def _points(
+        self, name: str, kind: str, attributes: Dict[str, Any]
+    ) -> List[MetricPoint]:
+        with self._lock:
+            return [
+                p
+                for p in self.metrics
+                if p.name == name
+                and p.kind == kind
+                and all(p.attributes.get(k) == v for k, v in attributes.items())
+            ]
+
+
+class OpenTelemetryExporter(Exporter):
+    """
+    Exporter que reenvía los spans y métricas a OpenTelemetry.
+
+    ``hyblock.call_api`` se crea con ``start_as_current_span`` como hijo del
+    span activo en el hilo que hizo la petición, de modo que los spans de la
+    instrumentación de urllib3 (si la hay) quedan dentro de él.
+    """
+
+    def __init__(self, tracer_provider: Any = None, meter_provider: Any = None):
+        """
+        Inicializa el exporter.
+
+        Args:
+            tracer_provider: ``TracerProvider``; por defecto el global
+            meter_provider: ``MeterProvider``; por defecto el global
+
+        Raises:
+            ImportError: Si opentelemetry-api no está instalado
+        """
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as e:  # pragma: no cover - depende del entorno
+            raise ImportError(
+                "OpenTelemetryExporter requiere opentelemetry-api. "
+                "Instálalo con: pip install hyblock-capital-sdk[tracing]"
+            ) from e
+
+        self._trace = trace
+        self._status_error = trace.Status(trace.StatusCode.ERROR)
+        self._tracer = trace.get_tracer(
+            "hyblock_capital_sdk", tracer_provider=tracer_provider
+        )
+        self._meter = metrics.get_meter(
+            "hyblock_capital_sdk", meter_provider=meter_provider
+        )
+        self._instruments: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def start_span(
+        self, name: str, attributes: Dict[str, Any], parent: Any = None
+    ) -> ContextManager[Any]:
+        context = None
+        if parent is not None:
+            context = self._trace.set_span_in_context(parent)
+        # end_span registra la excepción y el estado
+        return self._tracer.start_as_current_span(
+            name,
+            context=context,
+            attributes=_otel_attributes(attributes),
+            record_exception=False,
+            set_status_on_exception=False,
+            end_on_exit=False,
+        )
+
+    def end_span(
+        self,
+        span: Any,
+        attributes: Dict[str, Any],
+        error: bool,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        span.set_attributes(_otel_attributes(attributes))
+        if exception is not None:
+            span.record_exception(exception)
+        if error:
+            span.set_status(self._status_error)
+        span.end()
+
+    def export_metric(self, point: MetricPoint) -> None:
+        instrument = self._instrument(point.name, point.kind)
+        attributes = _otel_attributes(point.attributes)
+        if point.kind == "counter":
+            instrument.add(point.value, attributes)
+        else:
+            instrument.record(point.value, attributes)
+
+    def _instrument(self, name: str, kind: str) -> Any:
+        with self._lock:
+            instrument = self._instruments.get(name)
+            if instrument is None:
+                if kind == "counter":
+                    instrument = self._meter.create_counter(name)
+                else:
+                    instrument = self._meter.create_histogram(name, unit="s")
+                self._instruments[name] = instrument
+            return instrument
+
+
+def _otel_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """Quita los atributos None, que OpenTelemetry no acepta."""
+    return {key: value for key, value in attributes.items() if value is not None}
+
+
+def request_attributes(url: str, base_path: str = "") -> Dict[str, Any]:
+    """
+    Extrae los atributos de traza de una URL de la API.
+
+    Args:
+        url: URL completa de la petición
+        base_path: Prefijo del host que no forma parte del recurso
+            (ej: "/v1")
+
+    Returns:
+        Diccionario con ``hyblock.resource`` y, si están en la query,
+        ``hyblock.coin``, ``hyblock.exchange`` y ``hyblock.timeframe``
+    """
+    parts = urlsplit(url)
+    resource = parts.path
+    if base_path and resource.startswith(base_path):
+        resource = resource[len(base_path) :] or "/"
+    attributes: Dict[str, Any] = {"hyblock.resource": resource}
+    for key, value in parse_qsl(parts.query):
+        if key in TRACED_PARAMS:
+            attributes[f"hyblock.{key}"] = value
+    return attributes
+
+
+class Tracer:
+    """
+    Observer de peticiones que genera spans y métricas.
+
+    Se asigna a ``ApiClient.request_observer``; para conservar otro observer
+    se indica en ``observer`` y se llama después. Los spans requieren que el
+    ``Tracer`` sea el observer asignado al cliente: encadenado dentro de otro
+    observer sólo registra métricas.
+
+    Attributes:
+        exporter: Destino de spans y métricas
+    """
+
+    def __init__(
+        self,
+        exporter: Exporter,
+        base_path: str = "",
+        observer: Optional[Callable[[RequestTimings], Any]] = None,
+    ):
+        """
+        Inicializa el tracer.
+
+        Args:
+            exporter: Destino de spans y métricas
+            base_path: Prefijo de ruta del host a quitar del recurso
+                (ej: "/v1")
+            observer: Observer adicional que también recibe los tiempos
+        """
+        self.exporter = exporter
+        self.base_path = base_path
+        self.observer = observer
+
+    def __call__(self, timings: RequestTimings) -> None:
+        try:
+            self.record(timings)
+        finally:
+            if self.observer is not None:
+                self.observer(timings)
+
+    @contextmanager
+    def open_span(self, timings: RequestTimings, name: str) -> Iterator[Any]:
+        """
+        Abre el span de una fase de la petición (la llama ``RequestTimings``).
+
+        El primer span de la petición (``hyblock.call_api``) queda abierto en
+        ``timings.span`` hasta ``record``; los siguientes son sus hijos y se
+        terminan al salir del bloque.
+
+        Args:
+            timings: Tiempos de la petición en curso
+            name: Nombre del span
+        """
+        parent = timings.span
+        attributes = request_attributes(timings.url, self.base_path)
+        with self.exporter.start_span(name, attributes, parent) as span:
+            if parent is None:
+                timings.span = span
+                yield span
+                return
+            try:
+                yield span
+            except BaseException as e:
+                self.exporter.end_span(span, {"hyblock.rows": timings.rows}, True, e)
+                raise
+            self.exporter.end_span(span, {"hyblock.rows": timings.rows}, False)
+
+    def record(self, timings: RequestTimings) -> None:
+        """
+        Termina el span de una petición y exporta sus métricas.
+
+        Args:
+            timings: Tiempos entregados por ``ApiClient``
+        """
+        attributes = request_attributes(timings.url, self.base_path)
+        status = timings.status
+        error = status is None or status >= 400
+        metric_attributes = {
+            "hyblock.resource": attributes["hyblock.resource"],
+            "http.status_code": status,
+        }
+
+        if timings.span is not None:
+            self.exporter.end_span(
+                timings.span,
+                {
+                    "http.method": timings.method,
+                    "http.status_code": status,
+                    "hyblock.cached": timings.cached,
+                    "hyblock.retries": timings.retries,
+                    "hyblock.response_bytes": timings.response_bytes,
+                    "hyblock.rows": timings.rows,
+                },
+                error,
+                timings.error,
+            )
+
+        def counter(
+            name: str, value: float = 1, extra: Optional[Dict[str, Any]] = None
+        ) -> None:
+            self.exporter.export_metric(
+                MetricPoint(
+                    name, "counter", value, {**metric_attributes, **(extra or {})}
+                )
+            )
+
+        def histogram(name: str, value: float) -> None:
+            self.exporter.export_metric(
+                MetricPoint(name, "histogram", value, metric_attributes)
+            )
+
+        counter("hyblock.client.requests")
+        histogram("hyblock.client.duration", timings.total)
+        if error:
+            error_type = (
+                type(timings.error).__name__ if timings.error is not None else status
+            )
+            counter("hyblock.client.errors", extra={"error.type": str(error_type)})
+        if timings.cached:
+            counter("hyblock.client.cache_hits")
+        else:
+            histogram("hyblock.client.queue_wait", timings.queue_wait)
+        if timings.retries:
+            counter("hyblock.client.retries", timings.retries)
+        if status == 429:
+            counter("hyblock.client.rate_limited")
+            if timings.retry_after is not None:
+                # valor del header, no el tiempo esperado: el SDK no espera
+                histogram("hyblock.client.retry_after", timings.retry_after)
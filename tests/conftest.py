@@ -4,6 +4,7 @@ Configuración global de pytest para los tests del SDK de Hyblock Capital.
 Define fixtures, configuraciones y utilidades compartidas entre todos los tests.
 """
 
+import json
 import os
 import pytest
 from typing import Dict, Any
@@ -164,6 +165,79 @@ def mock_websocket_client():
         yield mock_ws
 
 
+class FakeClock:
+    """Reloj controlable para simular el paso del tiempo."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    """
+    Fixture que proporciona un reloj controlable.
+
+    Returns:
+        ``FakeClock`` en el instante 0; se avanza asignando ``fake_clock.now``
+    """
+    return FakeClock()
+
+
+@pytest.fixture
+def http_response():
+    """
+    Fixture que proporciona una fábrica de respuestas HTTP almacenadas.
+
+    Returns:
+        Función ``http_response(payload, status=200, headers=None)`` que crea
+        un ``RESTResponse``; ``payload`` se serializa a JSON salvo que ya sea
+        ``bytes``
+    """
+    from hyblock_capital_sdk.response_cache import StoredResponse
+    from hyblock_capital_sdk.rest import RESTResponse
+
+    def factory(payload: Any, status: int = 200, headers=None):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        return RESTResponse(StoredResponse(status, "OK", body, headers or {}))
+
+    return factory
+
+
+@pytest.fixture
+def standin_server():
+    """
+    Fixture que arranca un servidor local con las rutas de la API.
+
+    Returns:
+        ``StandInServer`` arrancado; se detiene al terminar el test
+    """
+    from hyblock_capital_sdk.testing import StandInServer
+
+    with StandInServer() as server:
+        yield server
+
+
+@pytest.fixture
+def unreachable_client():
+    """
+    Fixture que proporciona un ``ApiClient`` apuntando a un puerto cerrado.
+
+    Returns:
+        ``ApiClient`` sin reintentos cuyas peticiones fallan al conectar
+    """
+    import socket
+
+    import hyblock_capital_sdk as hc
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return hc.ApiClient(hc.Configuration(host=f"http://127.0.0.1:{port}", retries=0))
+
+
 @pytest.fixture(autouse=True)
 def reset_environment():
     """
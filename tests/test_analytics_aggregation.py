@@ -0,0 +1,111 @@
+"""
+Tests para la agregación local de series de varios exchanges.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+import hyblock_capital_sdk as hc
+
+np = pytest.importorskip("numpy")
+
+from hyblock_capital_sdk.analytics import (  # noqa: E402
+    ExchangeSeriesCache,
+    aggregate_exchanges,
+)
+
+FUNDING = {
+    "binance": [
+        hc.FundingRate(open_date=100, funding_rate=0.01),
+        hc.FundingRate(open_date=200, funding_rate=0.03),
+    ],
+    "bybit": [
+        hc.FundingRate(open_date=100, funding_rate=0.03),
+        hc.FundingRate(open_date=300, funding_rate=0.05),
+    ],
+}
+
+OPEN_INTEREST = {
+    "binance": [hc.OpenInterest(open_date=100, close=300.0)],
+    "bybit": [hc.OpenInterest(open_date=100, close=100.0)],
+}
+
+
+class TestAggregateExchanges:
+    """Tests para aggregate_exchanges."""
+
+    def test_sum_and_average(self):
+        """Verificar suma y promedio ignorando los exchanges sin dato."""
+        total = aggregate_exchanges(FUNDING, "funding_rate", how="sum")
+        average = aggregate_exchanges(FUNDING, "funding_rate", how="average")
+
+        assert total.timestamps.tolist() == [100, 200, 300]
+        np.testing.assert_allclose(total.values, [0.04, 0.03, 0.05])
+        np.testing.assert_allclose(average.values, [0.02, 0.03, 0.05])
+        assert average.counts.tolist() == [2, 1, 1]
+
+    def test_oi_weighted(self):
+        """Verificar el promedio ponderado por open interest."""
+        weighted = aggregate_exchanges(
+            FUNDING, "funding_rate", how="oi_weighted", weights=OPEN_INTEREST
+        )
+
+        # En 100: (0.01 * 300 + 0.03 * 100) / 400; luego se arrastra el peso.
+        np.testing.assert_allclose(weighted.values, [0.015, 0.03, 0.05])
+
+    def test_to_records(self):
+        """Verificar la conversión al formato de la API."""
+        average = aggregate_exchanges(FUNDING, "funding_rate")
+
+        assert average.to_records("fundingRate")[0] == {
+            "openDate": 100,
+            "fundingRate": pytest.approx(0.02),
+        }
+
+    def test_invalid_parameters(self):
+        """Verificar la validación de parámetros."""
+        with pytest.raises(ValueError):
+            aggregate_exchanges(FUNDING, "funding_rate", how="median")
+        with pytest.raises(ValueError, match="requiere weights"):
+            aggregate_exchanges(FUNDING, "funding_rate", how="oi_weighted")
+        with pytest.raises(ValueError, match="Faltan los pesos"):
+            aggregate_exchanges(FUNDING, "funding_rate", how="oi_weighted", weights={})
+
+
+class TestExchangeSeriesCache:
+    """Tests para ExchangeSeriesCache."""
+
+    def test_views_reuse_cached_exchanges(self):
+        """Verificar que cambiar la vista sólo descargue exchanges nuevos."""
+        endpoint = Mock(side_effect=lambda exchange, **_: FUNDING.get(exchange, []))
+        endpoint.__qualname__ = "FundingRateApi.funding_rate_get"
+        funding = ExchangeSeriesCache(
+            endpoint, "funding_rate", coin="BTC", timeframe="1h"
+        )
+
+        funding.aggregate(["binance", "bybit"], how="sum")
+        funding.aggregate(["binance"], how="average")
+        funding.aggregate(["binance", "bybit", "okx"], how="average")
+
+        assert [c.kwargs["exchange"] for c in endpoint.call_args_list] == [
+            "binance",
+            "bybit",
+            "okx",
+        ]
+        endpoint.assert_called_with(exchange="okx", coin="BTC", timeframe="1h")
+
+    def test_oi_weighted_with_cache(self):
+        """Verificar la agregación ponderada con una caché de pesos."""
+        funding = ExchangeSeriesCache(
+            Mock(side_effect=lambda exchange: FUNDING[exchange]), "funding_rate"
+        )
+        oi = ExchangeSeriesCache(
+            Mock(side_effect=lambda exchange: OPEN_INTEREST[exchange]), "close"
+        )
+
+        weighted = funding.aggregate(["binance", "bybit"], "oi_weighted", weights=oi)
+
+        assert weighted.values[0] == pytest.approx(0.015)
+        with pytest.raises(ValueError):
+            funding.aggregate(["binance"], "oi_weighted")
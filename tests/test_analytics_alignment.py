@@ -0,0 +1,84 @@
+"""
+Tests para la alineación temporal de series de varios exchanges.
+"""
+
+import pytest
+
+import hyblock_capital_sdk as hc
+
+np = pytest.importorskip("numpy")
+
+from hyblock_capital_sdk.analytics import align_on_open_date  # noqa: E402
+
+
+@pytest.fixture
+def exchange_series():
+    """Series de cuentas globales con huecos distintos por exchange."""
+    return {
+        "binance": [
+            hc.BinanceGlobalAccounts(open_date=300, ls_ratio=1.3),
+            hc.BinanceGlobalAccounts(open_date=100, ls_ratio=1.1),
+            hc.BinanceGlobalAccounts(open_date=200, ls_ratio=1.2),
+        ],
+        "bybit": [
+            hc.BybitGlobalAccounts(open_date=100, ls_ratio=2.1),
+            hc.BybitGlobalAccounts(open_date=400, ls_ratio=2.4),
+        ],
+        "okx": {
+            "data": [
+                {"openDate": 200, "lsRatio": 3.2},
+                {"openDate": 300, "lsRatio": 3.3},
+            ]
+        },
+    }
+
+
+class TestAlignOnOpenDate:
+    """Tests para align_on_open_date."""
+
+    def test_outer_join(self, exchange_series):
+        """Verificar la unión de timestamps con NaN en los huecos."""
+        aligned = align_on_open_date(exchange_series, fields="ls_ratio")
+
+        assert aligned.timestamps.tolist() == [100, 200, 300, 400]
+        assert aligned.columns == ["binance", "bybit", "okx"]
+        assert aligned.values.shape == (4, 3)
+        np.testing.assert_array_equal(aligned["binance"], [1.1, 1.2, 1.3, np.nan])
+        np.testing.assert_array_equal(aligned["okx"], [np.nan, 3.2, 3.3, np.nan])
+
+    def test_inner_join(self, exchange_series):
+        """Verificar la intersección de timestamps."""
+        aligned = align_on_open_date(
+            {"binance": exchange_series["binance"], "okx": exchange_series["okx"]},
+            fields="ls_ratio",
+            how="inner",
+        )
+
+        assert aligned.timestamps.tolist() == [200, 300]
+        assert aligned.values.tolist() == [[1.2, 3.2], [1.3, 3.3]]
+
+    def test_forward_fill_with_tolerance(self, exchange_series):
+        """Verificar el arrastre del último valor con antigüedad máxima."""
+        aligned = align_on_open_date(
+            exchange_series, fields="ls_ratio", fill="ffill", tolerance=100
+        )
+
+        np.testing.assert_array_equal(aligned["bybit"], [2.1, 2.1, np.nan, 2.4])
+        np.testing.assert_array_equal(aligned["binance"], [1.1, 1.2, 1.3, 1.3])
+        assert aligned.complete_rows().timestamps.tolist() == [200, 400]
+
+    def test_multiple_fields(self, exchange_series):
+        """Verificar los nombres de columna con varios campos."""
+        aligned = align_on_open_date(
+            {"binance": exchange_series["binance"]},
+            fields=["ls_ratio", "long_pct"],
+            how="left",
+        )
+
+        assert aligned.columns == ["binance.ls_ratio", "binance.long_pct"]
+        assert aligned.to_dict()["openDate"] == [100, 200, 300]
+
+    def test_invalid_mode(self, exchange_series):
+        """Verificar la validación de parámetros."""
+        with pytest.raises(ValueError):
+            align_on_open_date(exchange_series, fields="ls_ratio", how="cross")
@@ -0,0 +1,100 @@
+"""
+Tests para la caché de liquidaciones descompuesta por bucket.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+import hyblock_capital_sdk as hc
+
+np = pytest.importorskip("numpy")
+
+from hyblock_capital_sdk.analytics import (  # noqa: E402
+    BucketCache,
+    build_bucket_columns,
+    parse_buckets,
+)
+
+
+def liquidations(bucket, **params):
+    """Respuesta simulada de liquidation_get para un bucket."""
+    b = int(bucket)
+    records = [
+        hc.Liquidation(open_date=100, long_liquidation=b, short_liquidation=10 * b)
+    ]
+    if b != 7:
+        records.append(hc.Liquidation(open_date=200, long_liquidation=b))
+    return records
+
+
+@pytest.fixture
+def liquidation_get():
+    """Mock de LiquidityApi.liquidation_get."""
+    endpoint = Mock(side_effect=liquidations)
+    endpoint.__qualname__ = "LiquidityApi.liquidation_get"
+    return endpoint
+
+
+class TestParseBuckets:
+    """Tests para parse_buckets."""
+
+    def test_formats(self):
+        """Verificar los formatos aceptados."""
+        assert parse_buckets("6, 4,5,4") == (4, 5, 6)
+        assert parse_buckets(7) == (7,)
+        assert parse_buckets(None) == (1, 2, 3, 4, 5, 6, 7)
+
+    def test_invalid(self):
+        """Verificar la validación de buckets."""
+        for bucket in ("0", "8", "a", ""):
+            with pytest.raises(ValueError):
+                parse_buckets(bucket)
+
+
+class TestBucketColumns:
+    """Tests para build_bucket_columns."""
+
+    def test_combine(self):
+        """Verificar la suma local de una combinación de buckets."""
+        columns = build_bucket_columns({b: liquidations(b) for b in range(1, 8)})
+
+        assert columns.fields == ["long_liquidation", "short_liquidation"]
+        assert columns.values.shape == (2, 7, 2)
+
+        combined = columns.combine("4,5,6")
+        assert combined["open_date"].tolist() == [100, 200]
+        assert combined["long_liquidation"].tolist() == [15, 15]
+        assert combined["short_liquidation"][0] == 150
+        assert np.isnan(combined["short_liquidation"][1])
+
+    def test_to_records(self):
+        """Verificar la reconstrucción de los modelos de la API."""
+        columns = build_bucket_columns({b: liquidations(b) for b in range(1, 8)})
+
+        records = columns.to_records("7")
+
+        assert records[0] == hc.Liquidation(
+            open_date=100, long_liquidation=7, short_liquidation=70
+        )
+        assert records[1].long_liquidation is None
+
+
+class TestBucketCache:
+    """Tests para BucketCache."""
+
+    def test_one_fetch_per_bucket_and_window(self, liquidation_get):
+        """Verificar que las combinaciones se respondan sin nuevas llamadas."""
+        cache = BucketCache(liquidation_get, coin="BTC", timeframe="1h")
+
+        whales = cache.get("6,7")
+        retail = cache.get("1,2,3")
+        cache.get(start_time=50)
+
+        assert whales[0].long_liquidation == 13
+        assert retail[0].short_liquidation == 60
+        assert liquidation_get.call_count == 14
+        liquidation_get.assert_any_call(bucket="3", coin="BTC", timeframe="1h")
+        liquidation_get.assert_called_with(
+            bucket="7", coin="BTC", timeframe="1h", start_time=50
+        )
@@ -0,0 +1,107 @@
+"""
+Tests para la agregación vectorizada de pools de liquidación.
+"""
+
+import pytest
+
+import hyblock_capital_sdk as hc
+
+np = pytest.importorskip("numpy")
+
+from hyblock_capital_sdk.analytics import (  # noqa: E402
+    aggregate_liquidation_levels,
+)
+from hyblock_capital_sdk.analytics.liquidation_pools import (  # noqa: E402
+    parse_leverage,
+)
+
+
+@pytest.fixture
+def liquidation_levels():
+    """Niveles de liquidación de ejemplo con distintos apalancamientos."""
+    return [
+        hc.LiquidationLevels(price=21010.0, size=100000.0, leverage="5x", side="long"),
+        hc.LiquidationLevels(price=21040.0, size=50000.0, leverage="25x", side="long"),
+        hc.LiquidationLevels(price=21120.0, size=80000.0, leverage="10x", side="short"),
+        hc.LiquidationLevels(
+            price=21480.0, size=20000.0, leverage="100x", side="short"
+        ),
+        hc.LiquidationLevels(price=20900.0, size=30000.0, leverage="50x", side="long"),
+    ]
+
+
+class TestLiquidationPoolAggregator:
+    """Tests para aggregate_liquidation_levels."""
+
+    def test_aggregates_by_price_bucket(self, liquidation_levels):
+        """Verificar la suma long/short por bucket de precio."""
+        pools = aggregate_liquidation_levels(liquidation_levels, bucket_size=100)
+
+        assert pools.prices.tolist() == [20900.0, 21000.0, 21100.0, 21400.0]
+        assert pools.long_size.tolist() == [30000.0, 150000.0, 0.0, 0.0]
+        assert pools.short_size.tolist() == [0.0, 0.0, 80000.0, 20000.0]
+        assert pools.count.tolist() == [1, 2, 1, 1]
+
+    def test_leverage_tier_breakdown(self, liquidation_levels):
+        """Verificar el desglose por nivel de apalancamiento."""
+        pools = aggregate_liquidation_levels(liquidation_levels, bucket_size=100)
+
+        assert pools.tier_totals() == {
+            "low": 100000.0,
+            "medium": 80000.0,
+            "high": 50000.0,
+            "extreme": 50000.0,
+        }
+        assert pools.tier("high").tolist() == [0.0, 50000.0, 0.0, 0.0]
+        assert np.allclose(pools.tier_size.sum(axis=1), pools.total_size)
+
+    def test_nearest_pools(self, liquidation_levels):
+        """Verificar la búsqueda de pools cercanos al precio actual."""
+        pools = aggregate_liquidation_levels(liquidation_levels, bucket_size=100)
+
+        nearest = pools.nearest(current_price=21130.0, k=2)
+        assert [pool.price for pool in nearest] == [21100.0, 21000.0]
+        assert nearest[0].distance == pytest.approx(30.0)
+
+        assert [p.price for p in pools.above(21050.0, k=2)] == [21100.0, 21400.0]
+        assert [p.price for p in pools.below(21050.0, k=2)] == [21000.0, 20900.0]
+        assert [p.price for p in pools.nearest(21050.0, side="long")] == [21000.0]
+
+    def test_accepts_raw_json(self):
+        """Verificar que se acepte el JSON crudo de la API."""
+        raw = {
+            "data": [
+                {"price": 100.0, "size": 1.0, "leverage": "10x", "side": "long"},
+                {"price": 100.0, "size": 2.0, "leverage": None, "side": "short"},
+            ]
+        }
+        pools = aggregate_liquidation_levels(raw)
+
+        assert pools.long_size.tolist() == [1.0]
+        assert pools.short_size.tolist() == [2.0]
+        assert pools.tier_totals()["medium"] == 1.0
+
+    def test_side_is_case_insensitive(self):
+        """Verificar que se acepten lados en mayúsculas."""
+        raw = [
+            {"price": 100.0, "size": 1.0, "leverage": "10x", "side": "Long"},
+            {"price": 100.0, "size": 2.0, "leverage": "10x", "side": "SHORT"},
+        ]
+        pools = aggregate_liquidation_levels(raw)
+
+        assert pools.long_size.tolist() == [1.0]
+        assert pools.short_size.tolist() == [2.0]
+
+    def test_empty_response(self):
+        """Verificar el comportamiento con una respuesta vacía."""
+        pools = aggregate_liquidation_levels([])
+
+        assert len(pools) == 0
+        assert pools.nearest(100.0) == []
+
+    def test_parse_leverage(self):
+        """Verificar la conversión de strings de apalancamiento."""
+        values = parse_leverage(np.array(["5x", "12.5X", None, "n/a"], dtype=object))
+
+        assert values[:2].tolist() == [5.0, 12.5]
+        assert np.isnan(values[2:]).all()
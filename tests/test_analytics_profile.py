@@ -0,0 +1,142 @@
+"""
+Tests para el motor local de perfiles de open interest y volumen.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+import hyblock_capital_sdk as hc
+
+np = pytest.importorskip("numpy")
+
+from hyblock_capital_sdk.analytics import (  # noqa: E402
+    Profile,
+    ProfileEngine,
+    merge_profiles,
+)
+
+Level = hc.OpenInterestProfileDataInner
+
+
+@pytest.fixture
+def volume_profile():
+    """Perfil de volumen con precisión 10."""
+    return hc.VolumeProfile(
+        start_date=100,
+        end_date=200,
+        current_price=21025.0,
+        data=[
+            Level(price=21030.0, size=5.0),
+            Level(price=21000.0, size=1.0),
+            Level(price=21010.0, size=2.0),
+            Level(price=21020.0, size=8.0),
+            Level(price=21040.0, size=4.0),
+        ],
+    )
+
+
+class TestProfile:
+    """Tests para Profile."""
+
+    def test_from_response(self, volume_profile):
+        """Verificar la conversión ordenada desde el modelo."""
+        profile = Profile.from_response(volume_profile)
+
+        assert profile.prices.tolist() == [21000, 21010, 21020, 21030, 21040]
+        assert profile.sizes.tolist() == [1, 2, 8, 5, 4]
+        assert profile.bin_size == 10
+        assert profile.current_price == 21025.0
+        assert profile.total_size == 20
+
+    def test_from_raw_json(self, volume_profile):
+        """Verificar la conversión desde la respuesta JSON cruda."""
+        profile = Profile.from_response([volume_profile.to_dict()])
+
+        assert profile.end_date == 200
+        assert len(profile) == 5
+
+    def test_from_raw_dict(self, volume_profile):
+        """Verificar que se conserven los metadatos del JSON crudo."""
+        profile = Profile.from_response(volume_profile.to_dict())
+
+        assert profile.current_price == 21025.0
+        assert (profile.start_date, profile.end_date) == (100, 200)
+        assert profile.sizes.tolist() == [1, 2, 8, 5, 4]
+
+    def test_rebin(self, volume_profile):
+        """Verificar el re-agrupado a un bin más ancho."""
+        profile = Profile.from_response(volume_profile).rebin(20)
+
+        assert profile.prices.tolist() == [21000, 21020, 21040]
+        assert profile.sizes.tolist() == [3, 13, 4]
+        assert profile.bin_size == 20
+
+    def test_point_of_control_and_value_area(self, volume_profile):
+        """Verificar el POC y el área de valor."""
+        profile = Profile.from_response(volume_profile)
+
+        assert profile.point_of_control() == 21020
+        assert profile.value_area(0.6) == (21020, 21030)
+        assert profile.value_area(0.8) == (21020, 21040)
+
+    def test_value_area_is_contiguous(self):
+        """Verificar que el área de valor se expanda desde el POC."""
+        profile = Profile.from_levels([100, 110, 120, 130, 140], [6, 1, 10, 1, 1])
+
+        # los dos niveles más grandes (100 y 120) bastan, pero el área de
+        # valor crece por niveles adyacentes desde el POC
+        assert profile.value_area(0.8) == (100, 140)
+        assert profile.value_area(0.5) == (120, 120)
+
+    def test_slice_and_to_dict(self, volume_profile):
+        """Verificar el recorte por precio y la serialización."""
+        profile = Profile.from_response(volume_profile).slice(21010, 21020)
+
+        assert profile.to_dict()["data"] == [
+            {"price": 21010.0, "size": 2.0},
+            {"price": 21020.0, "size": 8.0},
+        ]
+
+    def test_invalid_parameters(self, volume_profile):
+        """Verificar la validación de parámetros."""
+        profile = Profile.from_response(volume_profile)
+        with pytest.raises(ValueError):
+            profile.rebin(0)
+        with pytest.raises(ValueError):
+            profile.value_area(1.5)
+
+
+class TestMergeProfiles:
+    """Tests para merge_profiles."""
+
+    def test_merge_uses_coarsest_bin(self):
+        """Verificar la fusión de exchanges con distinta precisión."""
+        fine = Profile.from_levels([100, 105, 110], [1, 1, 1])
+        coarse = Profile.from_levels([100, 110], [2, 3])
+
+        merged = merge_profiles([fine, coarse])
+
+        assert merged.bin_size == 10
+        assert merged.prices.tolist() == [100, 110]
+        assert merged.sizes.tolist() == [4, 4]
+
+
+class TestProfileEngine:
+    """Tests para ProfileEngine."""
+
+    def test_fetches_once_per_key(self, volume_profile):
+        """Verificar que cada zoom se calcule sin nuevas llamadas."""
+        endpoint = Mock(return_value=volume_profile)
+        endpoint.__qualname__ = "ProfileToolApi.volume_profile_get"
+        engine = ProfileEngine(endpoint, precision="10")
+
+        engine.get("binance", "BTC", "volume", bin_size=20)
+        engine.get("binance", "BTC", "volume", bin_size=40)
+        merged = engine.merged(["binance", "bybit"], "BTC", "volume")
+
+        assert endpoint.call_count == 2
+        endpoint.assert_called_with(
+            exchange="bybit", coin="BTC", profile_type="volume", precision="10"
+        )
+        assert merged.total_size == 40
@@ -0,0 +1,105 @@
+"""
+Tests para el remuestreo local de series a timeframes mayores.
+"""
+
+import pytest
+
+import hyblock_capital_sdk as hc
+
+np = pytest.importorskip("numpy")
+
+from hyblock_capital_sdk.analytics import (  # noqa: E402
+    resample,
+    resample_columns,
+    timeframe_seconds,
+)
+
+
+def make_klines(count, start=1661235900):
+    """Genera velas de 1m consecutivas con precios crecientes."""
+    return [
+        hc.Klines(
+            open_date=start + 60 * i,
+            open=100.0 + i,
+            high=101.0 + i,
+            low=99.0 + i,
+            close=100.5 + i,
+        )
+        for i in range(count)
+    ]
+
+
+class TestResample:
+    """Tests para resample y resample_columns."""
+
+    def test_klines_ohlc(self):
+        """Verificar la semántica OHLC al pasar de 1m a 5m."""
+        result = resample(make_klines(10), "5m")
+
+        assert len(result) == 2
+        assert isinstance(result[0], hc.Klines)
+        assert result[0].open_date == 1661235900
+        assert result[0].open == 100.0
+        assert result[0].high == 105.0
+        assert result[0].low == 99.0
+        assert result[0].close == 104.5
+        assert result[1].open == 105.0
+
+    def test_volume_sum_and_unsorted_input(self):
+        """Verificar la suma de volúmenes con entrada desordenada."""
+        volumes = [
+            hc.BuyVolume(open_date=1661236020, buy_volume=3.0),
+            hc.BuyVolume(open_date=1661235900, buy_volume=1.0),
+            hc.BuyVolume(open_date=1661235960, buy_volume=2.0),
+        ]
+        columns = resample_columns(volumes, "5m")
+
+        assert columns["buy_volume"].tolist() == [6.0]
+        assert columns["bars"].tolist() == [3]
+
+    def test_sum_of_missing_field_is_none(self):
+        """Verificar que un bucket sin datos no se reporte como suma 0."""
+        counts = [
+            hc.MarketOrderCount(open_date=1661235900, buy=2.0),
+            hc.MarketOrderCount(open_date=1661235960, buy=3.0),
+        ]
+        result = resample(counts, "5m")
+
+        assert result[0].buy == 5.0
+        assert result[0].sell is None
+        assert np.isnan(resample_columns(counts, "5m")["sell"]).all()
+
+    def test_ratio_uses_last_value(self):
+        """Verificar que los ratios tomen el último valor del bucket."""
+        ratios = [
+            {"openDate": 1661235900 + 60 * i, "bidAskRatio": float(i)} for i in range(6)
+        ]
+        result = resample(ratios, "5m")
+
+        assert result == [
+            {"openDate": 1661235900, "bidAskRatio": 4.0},
+            {"openDate": 1661236200, "bidAskRatio": 5.0},
+        ]
+
+    def test_drop_partial(self):
+        """Verificar que se descarten los buckets incompletos."""
+        result = resample(make_klines(12), "5m", drop_partial=True)
+
+        assert [k.open_date for k in result] == [1661235900, 1661236200]
+
+    def test_custom_rules_for_dicts(self):
+        """Verificar las reglas por nombre de modelo con diccionarios."""
+        raw = {
+            "data": [
+                {"openDate": 1661235900 + 60 * i, "volumeDelta": 1.5} for i in range(5)
+            ]
+        }
+        result = resample(raw, "5m", rules="VolumeDelta")
+
+        assert result == [{"openDate": 1661235900, "volumeDelta": 7.5}]
+
+    def test_invalid_timeframe(self):
+        """Verificar la validación del timeframe."""
+        assert timeframe_seconds("4h") == 14400
+        with pytest.raises(ValueError):
+            resample(make_klines(2), "2h")
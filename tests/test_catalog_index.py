@@ -0,0 +1,158 @@
+"""
+Tests para el índice del catálogo de endpoints, exchanges y monedas.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.catalog_index import CatalogIndex, parse_catalog
+from hyblock_capital_sdk.exceptions import ApiValueError
+
+CATALOG = {
+    "klines": {"binance": ["BTC", "ETH"], "bybit": ["BTC"]},
+    "bybitGlobalAccounts": {"bybit": ["BTC", "SOL"]},
+}
+
+
+class TestParseCatalog:
+    """Tests para parse_catalog."""
+
+    def test_endpoint_exchange_symbols(self):
+        """Verificar el índice endpoint -> exchange -> símbolos."""
+        index = parse_catalog({"data": CATALOG})
+
+        assert index["klines"]["binance"] == frozenset({"btc", "eth"})
+        assert index["bybitglobalaccounts"]["bybit"] == frozenset({"btc", "sol"})
+
+    def test_exchange_level_catalog(self):
+        """Verificar el catálogo filtrado por endpoint (exchange -> símbolos)."""
+        index = parse_catalog(hc.Catalog(binance="BTC,ETH", bybit="BTC"))
+
+        assert index["*"] == {
+            "binance": frozenset({"btc", "eth"}),
+            "bybit": frozenset({"btc"}),
+        }
+
+
+class TestCatalogIndex:
+    """Tests para CatalogIndex."""
+
+    @pytest.fixture
+    def catalog(self):
+        """Índice cargado con el catálogo de ejemplo."""
+        return CatalogIndex.from_catalog(CATALOG)
+
+    def test_lookups(self, catalog):
+        """Verificar las consultas de exchanges y símbolos."""
+        assert catalog.endpoints() == ["bybitglobalaccounts", "klines"]
+        assert catalog.exchanges("/klines") == ["binance", "bybit"]
+        assert catalog.exchanges("klines", coin="eth") == ["binance"]
+        assert catalog.symbols("klines") == ["btc", "eth"]
+        assert catalog.symbols("klines", exchange="Bybit") == ["btc"]
+
+    def test_is_supported(self, catalog):
+        """Verificar la validación de combinaciones."""
+        assert catalog.is_supported("klines", "BTC", "binance,bybit")
+        assert catalog.is_supported("klines", "ETH")
+        assert not catalog.is_supported("klines", "ETH", "bybit")
+        assert not catalog.is_supported("klines", "BTC", "okx")
+        assert catalog.is_supported("fundingRate", "DOGE", "okx")
+
+    def test_validate_raises(self, catalog):
+        """Verificar el error descriptivo ante combinaciones inválidas."""
+        with pytest.raises(ApiValueError, match="coin 'sol'"):
+            catalog.validate("klines", "SOL", "binance")
+
+    def test_targets(self, catalog):
+        """Verificar la enumeración de destinos para trabajos masivos."""
+        assert catalog.targets("klines") == [
+            ("binance", "btc"),
+            ("binance", "eth"),
+            ("bybit", "btc"),
+        ]
+        assert catalog.targets("klines", coins=["ETH"]) == [("binance", "eth")]
+        assert catalog.targets("klines", exchanges=["bybit"]) == [("bybit", "btc")]
+
+    def test_ttl_refresh(self, fake_clock):
+        """Verificar la primera carga sincrónica y el refresco al vencer el TTL."""
+        fetch = Mock(return_value=CATALOG)
+        catalog = CatalogIndex(fetch=fetch, ttl=60, clock=fake_clock, background=False)
+
+        assert catalog.exchanges("klines") == ["binance", "bybit"]
+        catalog.exchanges("klines")
+        assert fetch.call_count == 1
+
+        fake_clock.now = 61
+        fetch.return_value = {"klines": {"okx": ["BTC"]}}
+        assert catalog.exchanges("klines") == ["okx"]
+        assert fetch.call_count == 2
+
+    def test_failed_refresh_keeps_index(self, fake_clock):
+        """Verificar que un error de descarga no borre el índice vigente."""
+        fetch = Mock(return_value=CATALOG)
+        catalog = CatalogIndex(fetch=fetch, ttl=60, clock=fake_clock, background=False)
+        catalog.refresh()
+
+        fake_clock.now = 120
+        fetch.side_effect = RuntimeError("sin conexión")
+
+        assert catalog.refresh() is False
+        assert catalog.exchanges("klines") == ["binance", "bybit"]
+
+    def test_failed_first_load_backs_off(self, fake_clock):
+        """Verificar que un fallo no repita la descarga en cada petición."""
+        fetch = Mock(side_effect=RuntimeError("sin conexión"))
+        catalog = CatalogIndex(
+            fetch=fetch, retry_interval=30, clock=fake_clock, background=False
+        )
+
+        for _ in range(5):
+            assert catalog.is_supported("klines", "SOL", "binance")
+        assert fetch.call_count == 1
+        assert catalog.failed_at == 0
+
+        fake_clock.now = 30
+        fetch.side_effect = None
+        fetch.return_value = CATALOG
+        assert not catalog.is_supported("klines", "SOL", "binance")
+        assert fetch.call_count == 2
+        assert catalog.failed_at is None
+
+    def test_downloads_with_catalog_api(self):
+        """Verificar la descarga cruda mediante CatalogApi."""
+        catalog_api = Mock()
+        catalog_api.catalog_get_without_preload_content.return_value.read.return_value = json.dumps(
+            CATALOG
+        ).encode()
+        catalog = CatalogIndex(catalog_api)
+
+        assert catalog.symbols("klines", "binance") == ["btc", "eth"]
+
+
+class TestApiClientIntegration:
+    """Tests para la validación local desde ApiClient."""
+
+    def test_rejects_invalid_request_without_network(self):
+        """Verificar que una combinación inválida no llegue a la red."""
+        api_client = hc.ApiClient(hc.Configuration())
+        api_client.catalog_index = CatalogIndex.from_catalog(CATALOG)
+        orderflow_api = hc.OrderflowApi(api_client)
+
+        with patch.object(api_client.rest_client, "request") as request:
+            with pytest.raises(ApiValueError):
+                orderflow_api.klines_get(coin="SOL", timeframe="1h", exchange="binance")
+            request.assert_not_called()
+
+    def test_valid_request_is_serialized(self):
+        """Verificar que las combinaciones válidas se serialicen normalmente."""
+        api_client = hc.ApiClient(hc.Configuration())
+        api_client.catalog_index = CatalogIndex.from_catalog(CATALOG)
+
+        _, url, _, _, _ = api_client.param_serialize(
+            "GET", "/klines", query_params=[("coin", "btc"), ("exchange", "bybit")]
+        )
+
+        assert url.endswith("/klines?coin=btc&exchange=bybit")
@@ -0,0 +1,145 @@
+"""
+Tests para el pool de clientes con varias API keys.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.client_pool import ApiClientPool
+from hyblock_capital_sdk.rest import RESTResponse
+
+
+def make_pool(keys=("key-1", "key-2"), **kwargs):
+    configurations = [
+        hc.Configuration(host="http://x", api_key={"Api Key": key}) for key in keys
+    ]
+    kwargs.setdefault("balance_ttl", None)
+    return ApiClientPool(configurations, **kwargs)
+
+
+class TestApiClientPool:
+    """Tests para ApiClientPool."""
+
+    def test_requires_configurations(self):
+        """Verificar que el pool necesite al menos una configuración."""
+        with pytest.raises(ValueError):
+            ApiClientPool([])
+
+    def test_routes_to_highest_balance(self, http_response):
+        """Verificar el ruteo a la key con más hits disponibles."""
+        pool = make_pool()
+        pool.keys[0].remaining = 10
+        pool.keys[1].remaining = 50
+        orderflow_api = hc.OrderflowApi(pool)
+        used_keys = []
+
+        def request(client_index):
+            def side_effect(method, url, headers=None, **kwargs):
+                used_keys.append((client_index, headers["x-api-key"]))
+                return http_response({"openDate": 1, "close": 2.0})
+
+            return side_effect
+
+        with patch.object(
+            pool.keys[0].client.rest_client, "request", side_effect=request(0)
+        ), patch.object(
+            pool.keys[1].client.rest_client, "request", side_effect=request(1)
+        ):
+            klines = orderflow_api.klines_get(
+                coin="BTC", timeframe="1h", exchange="binance"
+            )
+
+        assert klines == hc.Klines(open_date=1, close=2.0)
+        assert used_keys == [(1, "key-2")]
+        assert pool.keys[1].remaining == 49
+
+    def test_balances_even_out(self, http_response):
+        """Verificar que las peticiones se repartan al igualarse el saldo."""
+        pool = make_pool()
+        pool.keys[0].remaining = 3
+        pool.keys[1].remaining = 4
+
+        with patch.object(
+            pool.keys[0].client.rest_client, "request", return_value=http_response([])
+        ) as first, patch.object(
+            pool.keys[1].client.rest_client, "request", return_value=http_response([])
+        ) as second:
+            for _ in range(5):
+                pool.call_api("GET", "http://x/klines")
+
+        assert (first.call_count, second.call_count) == (2, 3)
+
+    def test_failover_on_429(self, http_response, fake_clock):
+        """Verificar el reintento con otra key tras un 429."""
+        pool = make_pool(clock=fake_clock)
+
+        with patch.object(
+            pool.keys[0].client.rest_client,
+            "request",
+            return_value=http_response({}, status=429, headers={"Retry-After": "30"}),
+        ) as first, patch.object(
+            pool.keys[1].client.rest_client, "request", return_value=http_response([])
+        ) as second:
+            response = pool.call_api("GET", "http://x/klines")
+            assert response.status == 200
+            assert pool.keys[0].cooldown_until == 30
+
+            pool.call_api("GET", "http://x/klines")
+
+        assert first.call_count == 1
+        assert second.call_count == 2
+        assert pool.stats()[0]["throttled"] == 1
+
+    def test_retried_429_releases_connection(self, http_response):
+        """Verificar que el 429 descartado libere su conexión."""
+        pool = make_pool()
+        throttled = Mock(status=429, reason="Too Many Requests", data=b"{}")
+        throttled.headers = {"Retry-After": "30"}
+
+        with patch.object(
+            pool.keys[0].client.rest_client,
+            "request",
+            return_value=RESTResponse(throttled),
+        ), patch.object(
+            pool.keys[1].client.rest_client, "request", return_value=http_response([])
+        ):
+            assert pool.call_api("GET", "http://x/klines").status == 200
+
+        throttled.release_conn.assert_called_once_with()
+
+    def test_all_keys_throttled(self, http_response):
+        """Verificar que se retorne el 429 si todas las keys están limitadas."""
+        pool = make_pool()
+
+        with patch.object(
+            pool.keys[0].client.rest_client,
+            "request",
+            return_value=http_response({}, status=429),
+        ), patch.object(
+            pool.keys[1].client.rest_client,
+            "request",
+            return_value=http_response({}, status=429),
+        ):
+            response = pool.call_api("GET", "http://x/klines")
+
+        assert response.status == 429
+
+    def test_refresh_balances(self, http_response):
+        """Verificar la consulta del saldo de cada key."""
+        pool = make_pool()
+        balances = iter([{"remaining_hits": 5}, {"remaining_hits": 80}])
+
+        for state in pool.keys:
+            patch.object(
+                state.client.rest_client,
+                "request",
+                side_effect=lambda *a, **k: http_response(next(balances)),
+            ).start()
+        try:
+            assert pool.refresh_balances() == {0: 5, 1: 80}
+        finally:
+            patch.stopall()
+
+        assert pool.select() is pool.keys[1]
@@ -0,0 +1,181 @@
+"""
+Tests para el pre-calentamiento y el tamaño adaptativo del pool de conexiones.
+"""
+
+import socket
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from urllib3.connectionpool import HTTPConnectionPool
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.connection_pool import (
+    PoolMonitor,
+    _checkin,
+    _checkout,
+    _set_maxsize,
+    host_pool,
+    prewarm,
+)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestPrewarm:
+    """Tests para prewarm."""
+
+    def test_prewarm_opens_connections(self, standin_server):
+        """Verificar que las conexiones abiertas se reutilicen."""
+        api_client = hc.ApiClient(standin_server.configuration())
+
+        assert prewarm(api_client, 3) == 3
+        pool = host_pool(api_client)
+        assert pool.num_connections == 3
+
+        hc.OrderflowApi(api_client).klines_get(
+            coin="BTC", timeframe="1h", exchange="binance"
+        )
+        assert pool.num_connections == 3
+
+    def test_prewarm_on_construction(self, standin_server):
+        """Verificar el pre-calentamiento configurado en Configuration."""
+        config = standin_server.configuration()
+        config.prewarm_connections = 2
+
+        api_client = hc.ApiClient(config)
+
+        assert host_pool(api_client).num_connections == 2
+
+    def test_prewarm_skipped_in_replay(self, standin_server, tmp_path):
+        """Verificar que en reproducción no se abran conexiones reales."""
+        config = standin_server.configuration()
+        config.recording_path = str(tmp_path / "session.jsonl.gz")
+        config.recording_mode = "replay"
+        config.prewarm_connections = 2
+
+        api_client = hc.ApiClient(config)
+
+        assert prewarm(api_client, 2) == 0
+        assert host_pool(api_client).num_connections == 0
+
+    def test_prewarm_disabled_without_pool_internals(self, standin_server):
+        """Verificar que se desactive con una urllib3 no compatible."""
+        api_client = hc.ApiClient(standin_server.configuration())
+
+        with patch("hyblock_capital_sdk.connection_pool.POOL_INTERNALS", False):
+            assert prewarm(api_client, 2) == 0
+
+    def test_prewarm_unreachable_host(self):
+        """Verificar que un host inaccesible no lance excepciones."""
+        api_client = hc.ApiClient(
+            hc.Configuration(host=f"http://127.0.0.1:{free_port()}")
+        )
+
+        assert prewarm(api_client, 2) == 0
+
+
+class TestPoolMonitor:
+    """Tests para PoolMonitor."""
+
+    def make_monitor(self, **kwargs):
+        config = hc.Configuration(host="http://x")
+        config.connection_pool_maxsize = kwargs.pop("configured", 1)
+        return PoolMonitor(hc.ApiClient(config), **kwargs)
+
+    def test_invalid_sizes(self):
+        """Verificar la validación de min_size y max_size."""
+        with pytest.raises(ValueError):
+            self.make_monitor(min_size=4, max_size=2)
+
+    def test_grows_on_saturation(self):
+        """Verificar que el pool crezca hasta max_size."""
+        monitor = self.make_monitor(min_size=1, max_size=2)
+        monitor.acquire()
+        monitor.acquire()
+
+        assert monitor.size == 2
+        pool_kw = monitor.api_client.rest_client.pool_manager.connection_pool_kw
+        assert pool_kw["maxsize"] == 2
+        assert monitor.stats()["waited"] == 0
+
+    def test_waits_at_max_size(self):
+        """Verificar la espera y las métricas cuando el pool está saturado."""
+        monitor = self.make_monitor(min_size=1, max_size=1)
+        monitor.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            monitor.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        time.sleep(0.05)
+        assert not acquired.is_set()
+
+        monitor.release()
+        thread.join(timeout=5)
+        stats = monitor.stats()
+
+        assert acquired.is_set()
+        assert stats["waited"] == 1
+        assert stats["saturation"] == 0.5
+        assert stats["max_wait"] > 0
+
+    def test_shrinks_after_window(self, fake_clock):
+        """Verificar la reducción del pool cuando baja la demanda."""
+        monitor = self.make_monitor(
+            configured=8, min_size=2, max_size=16, window=10, clock=fake_clock
+        )
+        monitor.acquire()
+        monitor.acquire()
+        monitor.release()
+        monitor.release()
+        assert monitor.size == 8
+
+        fake_clock.now = 10
+        monitor.acquire()
+        monitor.release()
+
+        assert monitor.size == 2
+
+    def test_shrink_keeps_warm_connections(self):
+        """Verificar que al reducir se cierren las conexiones más frías."""
+        pool = HTTPConnectionPool("localhost", maxsize=4)
+        conns = _checkout(pool, 4)
+        _checkin(pool, conns)
+
+        _set_maxsize(pool, 2)
+
+        assert pool.pool.queue == conns[2:]
+        assert _checkout(pool, 2) == [conns[3], conns[2]]
+
+    def test_shrink_drops_empty_slots_first(self):
+        """Verificar que se descarten primero los huecos sin conexión."""
+        pool = HTTPConnectionPool("localhost", maxsize=4)
+        conn = pool._get_conn()
+        pool._put_conn(conn)
+
+        _set_maxsize(pool, 2)
+
+        assert pool.pool.queue == [None, conn]
+
+    def test_call_api_uses_monitor(self, http_response):
+        """Verificar que call_api reserve y libere la conexión."""
+        api_client = hc.ApiClient(hc.Configuration(host="http://x"))
+        api_client.pool_monitor = PoolMonitor(api_client)
+        response = http_response(b"[]")
+
+        with patch.object(api_client.rest_client, "request", return_value=response):
+            api_client.call_api("GET", "http://x/klines")
+
+        stats = api_client.pool_monitor.stats()
+        assert stats["requests"] == 1
+        assert stats["in_flight"] == 0
+        assert response.data == b"[]"
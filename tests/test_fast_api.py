@@ -0,0 +1,84 @@
+"""
+Tests para las variantes de las APIs sin validación de argumentos.
+"""
+
+import inspect
+
+import pytest
+from pydantic import ValidationError
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.fast_api import (
+    argument_validation_enabled,
+    fast_api,
+    set_argument_validation,
+)
+
+
+@pytest.fixture
+def api_client(standin_server):
+    return hc.ApiClient(standin_server.configuration())
+
+
+@pytest.fixture
+def validation_disabled():
+    set_argument_validation(False)
+    yield
+    set_argument_validation(True)
+
+
+class TestFastApi:
+    """Tests para fast_api."""
+
+    def test_same_signatures_and_results(self, api_client):
+        """Verificar firmas y resultados iguales a la API validada."""
+        fast_cls = fast_api(hc.OrderflowApi)
+        kwargs = {"coin": "BTC", "timeframe": "1m", "exchange": "binance"}
+
+        assert fast_cls.__name__ == "FastOrderflowApi"
+        assert issubclass(fast_cls, hc.OrderflowApi)
+        assert inspect.signature(fast_cls.klines_get) == inspect.signature(
+            hc.OrderflowApi.klines_get
+        )
+        assert fast_cls(api_client).klines_get(**kwargs) == hc.OrderflowApi(
+            api_client
+        ).klines_get(**kwargs)
+
+    def test_skips_validation(self, api_client, standin_server):
+        """Verificar que no se validen los argumentos."""
+        with pytest.raises(ValidationError):
+            hc.OrderflowApi(api_client).klines_get(
+                coin="BTC", timeframe="1m", exchange="binance", limit="10"
+            )
+        fast_api(hc.OrderflowApi)(api_client).klines_get(
+            coin="BTC", timeframe="1m", exchange="binance", limit="10"
+        )
+        assert standin_server.requests["/klines"] == 1
+
+    def test_cached_class(self):
+        """Verificar que se reutilice la misma subclase."""
+        assert fast_api(hc.CatalogApi) is fast_api(hc.CatalogApi)
+
+    def test_rejects_non_api_class(self):
+        """Verificar que se rechace una clase sin validate_call."""
+        with pytest.raises(TypeError):
+            fast_api(hc.Configuration)
+
+
+class TestSetArgumentValidation:
+    """Tests para set_argument_validation."""
+
+    def test_disable_and_restore(self, api_client, validation_disabled):
+        """Verificar que el switch global desactive y restaure la validación."""
+        assert not argument_validation_enabled()
+        hc.OrderflowApi(api_client).klines_get(
+            coin="BTC", timeframe="1m", exchange="binance", limit="10"
+        )
+        assert fast_api(hc.LiquidityApi).__name__ == "FastLiquidityApi"
+
+        set_argument_validation(True)
+        assert argument_validation_enabled()
+        with pytest.raises(ValidationError):
+            hc.OrderflowApi(api_client).klines_get(
+                coin="BTC", timeframe="1m", exchange="binance", limit="10"
+            )
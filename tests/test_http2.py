@@ -0,0 +1,150 @@
+"""
+Tests para la selección de transporte y el transporte HTTP/2.
+"""
+
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import hyblock_capital_sdk as hc
+
+
+class TestTransportSelection:
+    """Tests para Configuration.transport."""
+
+    def test_default_transport(self):
+        """Verificar que por defecto se use urllib3."""
+        api_client = hc.ApiClient(hc.Configuration())
+
+        assert isinstance(api_client.rest_client, hc.rest.RESTClientObject)
+
+    def test_unknown_transport(self):
+        """Verificar el error con un transporte desconocido."""
+        config = hc.Configuration()
+        config.transport = "carrier-pigeon"
+
+        with pytest.raises(hc.ApiValueError):
+            hc.ApiClient(config)
+
+    def test_http2_without_httpx(self):
+        """Verificar el mensaje de error si httpx no está instalado."""
+        config = hc.Configuration()
+        config.transport = "http2"
+
+        with patch.dict(sys.modules, {"httpx": None}):
+            sys.modules.pop("hyblock_capital_sdk.http2", None)
+            with pytest.raises(ImportError, match="http2"):
+                hc.ApiClient(config)
+        sys.modules.pop("hyblock_capital_sdk.http2", None)
+
+
+class TestHTTP2ClientObject:
+    """Tests para HTTP2ClientObject."""
+
+    @pytest.fixture
+    def mocked(self):
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={"openDate": 1, "close": 2.0},
+                headers={"X-Test": "1"},
+            )
+
+        config = hc.Configuration(host="http://x", api_key={"Api Key": "secret"})
+        config.transport = "http2"
+        api_client = hc.ApiClient(config)
+        api_client.rest_client.client = httpx.Client(
+            transport=httpx.MockTransport(handler)
+        )
+        return api_client, requests
+
+    def test_get_through_generated_api(self, mocked):
+        """Verificar una petición completa con la API generada."""
+        api_client, requests = mocked
+        from hyblock_capital_sdk.http2 import HTTP2ClientObject
+
+        klines = hc.OrderflowApi(api_client).klines_get(
+            coin="BTC", timeframe="1h", exchange="binance"
+        )
+
+        assert isinstance(api_client.rest_client, HTTP2ClientObject)
+        assert klines == hc.Klines(open_date=1, close=2.0)
+        request = requests[0]
+        assert request.url.params["coin"] == "BTC"
+        assert request.headers["x-api-key"] == "secret"
+
+    def test_response_interface(self, mocked):
+        """Verificar la interfaz de RESTResponse y el cuerpo JSON enviado."""
+        api_client, requests = mocked
+        response = api_client.rest_client.request(
+            "POST", "http://x/echo", headers={}, body={"a": 1}
+        )
+
+        assert response.status == 200
+        assert json.loads(response.read()) == {"openDate": 1, "close": 2.0}
+        assert response.getheader("x-test") == "1"
+        assert json.loads(requests[0].content) == {"a": 1}
+
+    def test_body_and_post_params(self, mocked):
+        """Verificar que body y post_params sean excluyentes."""
+        api_client, _ = mocked
+        with pytest.raises(hc.ApiValueError):
+            api_client.rest_client.request(
+                "POST", "http://x/echo", body={"a": 1}, post_params=[("b", 2)]
+            )
+
+    def test_client_certificate_with_default_verification(self):
+        """Verificar que el certificado de cliente se cargue sin ssl_ca_cert."""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        from hyblock_capital_sdk import http2
+
+        config = hc.Configuration(host="https://x")
+        config.cert_file = "client.pem"
+        config.key_file = "client.key"
+
+        with patch.object(http2.ssl, "create_default_context") as context, patch.object(
+            httpx, "HTTPTransport", wraps=httpx.HTTPTransport
+        ) as transport:
+            http2.HTTP2ClientObject(config)
+
+        context.return_value.load_cert_chain.assert_called_once_with(
+            "client.pem", "client.key"
+        )
+        assert transport.call_args.kwargs["verify"] is context.return_value
+
+    def test_proxy_keeps_retries(self):
+        """Verificar que con proxy se conserven los reintentos configurados."""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        from hyblock_capital_sdk import http2
+
+        config = hc.Configuration(host="https://x", retries=3)
+        config.proxy = "http://proxy:3128"
+
+        with patch.object(
+            httpx, "HTTPTransport", wraps=httpx.HTTPTransport
+        ) as transport:
+            http2.HTTP2ClientObject(config)
+
+        assert transport.call_args.kwargs["proxy"] == "http://proxy:3128"
+        assert transport.call_args.kwargs["retries"] == 3
+
+    def test_default_timeout(self):
+        """Verificar que sin _request_timeout se use el timeout de httpx."""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        from hyblock_capital_sdk import http2
+
+        timeout = http2.HTTP2ClientObject._timeout
+
+        assert timeout(None) is httpx.USE_CLIENT_DEFAULT
+        assert timeout(2.5) == httpx.Timeout(2.5)
+        assert timeout((1, 3)) == httpx.Timeout(None, connect=1, read=3)
@@ -0,0 +1,219 @@
+"""
+Tests para la contabilidad de memoria de respuestas y cachés.
+"""
+
+import gc
+import json
+import logging
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.memory import CompactRows, MemoryTracker, estimate_size
+from hyblock_capital_sdk.response_cache import ResponseCache
+from hyblock_capital_sdk.testing import StandInServer, synthetic_rows
+
+
+def heatmap_models(n):
+    rows = synthetic_rows("LiquidationHeatmap", n)
+    return hc.ApiClient().deserialize(
+        json.dumps(rows), "List[LiquidationHeatmap]", "application/json"
+    )
+
+
+def klines(api_client, coin="BTC"):
+    return hc.OrderflowApi(api_client).klines_get(
+        coin=coin, timeframe="1m", exchange="binance"
+    )
+
+
+class TestEstimateSize:
+    """Tests para estimate_size."""
+
+    def test_close_to_allocated_memory(self):
+        """Verificar que la estimación se acerque a la memoria asignada."""
+        tracemalloc.start()
+        try:
+            models = heatmap_models(5000)
+            allocated = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        assert estimate_size(models) == pytest.approx(allocated, rel=0.25)
+
+
+class TestCompactRows:
+    """Tests para CompactRows."""
+
+    def test_models_round_trip(self):
+        """Verificar que las filas reconstruidas sean iguales a las originales."""
+        models = heatmap_models(100)
+        rows = CompactRows(models)
+
+        assert len(rows) == 100
+        assert rows == models
+        assert rows[-1] == models[-1]
+        assert rows[10:12] == models[10:12]
+        assert list(rows.column("size")) == [m.size for m in models]
+        with pytest.raises(IndexError):
+            rows[100]
+
+    def test_dict_rows_with_missing_keys(self):
+        """Verificar filas diccionario con claves ausentes."""
+        data = [{"a": 1, "b": "x"}, {"a": 2}, {"b": "x", "c": 1.5}]
+        rows = CompactRows(data)
+        assert rows.to_list() == data
+        assert rows.fields == ("a", "b", "c")
+
+    def test_uses_less_memory(self):
+        """Verificar que la versión columnar ocupe mucho menos."""
+        models = heatmap_models(5000)
+        assert estimate_size(CompactRows(models)) * 5 < estimate_size(models)
+
+
+class TestResponseCacheAccounting:
+    """Tests para ResponseCache.nbytes y shrink."""
+
+    def test_shrink_evicts_least_recent(self, http_response):
+        """Verificar que shrink desaloje las entradas menos usadas."""
+        cache = ResponseCache()
+        for name in ("a", "b", "c"):
+            cache.put("GET", f"http://x/{name}", http_response({"v": "x" * 100}))
+        cache.get("GET", "http://x/a")
+        size = cache.nbytes
+
+        assert cache.shrink(size // 3 + 1) == 2
+        assert ("GET", "http://x/a") in cache
+        assert cache.nbytes <= size // 3 + 1
+
+    def test_nbytes_follows_changes(self, http_response, fake_clock):
+        """Verificar el contador de bytes al reemplazar, vencer e invalidar."""
+        cache = ResponseCache(maxsize=2, ttl=10, clock=fake_clock)
+
+        def stored_bytes():
+            return sum(len(entry[1].data) for entry in cache._entries.values())
+
+        cache.put("GET", "http://x/a", http_response({"v": "x" * 10}))
+        cache.put("GET", "http://x/a", http_response({"v": "x" * 50}))
+        cache.put("GET", "http://x/b", http_response({"v": "x" * 20}))
+        cache.put("GET", "http://x/c", http_response({"v": "x" * 30}))
+        assert len(cache) == 2
+        assert cache.nbytes == stored_bytes()
+
+        fake_clock.now = 20
+        assert cache.get("GET", "http://x/b") is None
+        assert cache.nbytes == stored_bytes()
+        cache.invalidate("http://x/c")
+        assert cache.nbytes == 0
+
+
+class TestMemoryTracker:
+    """Tests para MemoryTracker."""
+
+    def test_report_per_endpoint(self, standin_server):
+        """Verificar el uso por endpoint y la liberación de respuestas."""
+        tracker = MemoryTracker()
+        api_client = hc.ApiClient(standin_server.configuration())
+        api_client.memory_tracker = tracker
+
+        first = klines(api_client)
+        second = klines(api_client, "ETH")
+        catalog = hc.CatalogApi(api_client).catalog_get()
+        report = tracker.report()
+
+        assert report["endpoints"]["/klines"]["responses"] == 2
+        assert report["endpoints"]["/klines"]["bytes"] > 0
+        assert report["endpoints"]["/catalog"]["responses"] == 1
+        assert report["total"] == report["responses"] > 0
+
+        del first, second, catalog
+        gc.collect()
+        assert tracker.report()["endpoints"] == {}
+        assert tracker.responses_bytes() == 0
+
+    def test_with_http_info_counts_raw_body(self, standin_server):
+        """Verificar que se cuente el cuerpo crudo de un ApiResponse vivo."""
+        tracker = MemoryTracker()
+        api_client = hc.ApiClient(standin_server.configuration())
+        api_client.memory_tracker = tracker
+
+        response = hc.OrderflowApi(api_client).klines_get_with_http_info(
+            coin="BTC", timeframe="1m", exchange="binance"
+        )
+        stats = tracker.report()["endpoints"]["/klines"]
+        assert stats["raw_bytes"] == len(response.raw_data)
+
+    def test_budget_evicts_caches_first(self, standin_server, caplog):
+        """Verificar que se desalojen las cachés antes de compactar."""
+        api_client = hc.ApiClient(standin_server.configuration())
+        api_client.response_cache = ResponseCache()
+        api_client.memory_tracker = MemoryTracker()
+        for coin in ("BTC", "ETH", "SOL"):
+            klines(api_client, coin)
+        live = klines(api_client, "XRP")
+        assert api_client.memory_tracker.caches_bytes() > 0
+
+        tracker = api_client.memory_tracker
+        tracker.budget = tracker.responses_bytes()
+        with caplog.at_level(logging.INFO, logger="hyblock_capital_sdk.memory"):
+            klines(api_client, "ADA")
+            klines(api_client, "ADA")
+
+        assert tracker.evicted > 0
+        # cada mensaje informa sólo las entradas desalojadas en esa llamada
+        counts = [r.args[0] for r in caplog.records]
+        assert all(counts) and sum(counts) == tracker.evicted
+        assert tracker.compacted == 0
+        assert live is not None
+
+    def test_budget_compacts_list_responses(self):
+        """Verificar que una lista grande se retorne compactada."""
+        tracker = MemoryTracker(budget=1, compact_min_rows=100, compact=True)
+        with StandInServer(rows=500) as server:
+            api_client = hc.ApiClient(server.configuration())
+            api_client.memory_tracker = tracker
+            response = api_client.call_api("GET", server.host + "/liquidationHeatmap")
+            response.read()
+            data = api_client.response_deserialize(
+                response, {"200": "List[LiquidationHeatmap]"}
+            ).data
+
+        assert isinstance(data, CompactRows)
+        assert len(data) == 500
+        assert isinstance(data[0], hc.LiquidationHeatmap)
+        assert tracker.report()["endpoints"]["/liquidationHeatmap"]["compacted"] == 1
+
+    def test_compaction_is_opt_in(self):
+        """Verificar que sin compact=True se retorne la lista original."""
+        tracker = MemoryTracker(budget=1, compact_min_rows=100)
+        with StandInServer(rows=500) as server:
+            api_client = hc.ApiClient(server.configuration())
+            api_client.memory_tracker = tracker
+            response = api_client.call_api("GET", server.host + "/liquidationHeatmap")
+            response.read()
+            data = api_client.response_deserialize(
+                response, {"200": "List[LiquidationHeatmap]"}
+            ).data
+
+        assert isinstance(data, list)
+        assert tracker.compacted == 0
+
+    def test_delivered_responses_are_not_modified(self, http_response):
+        """Verificar que sólo se compacten respuestas aún no entregadas."""
+        api_client = hc.ApiClient(hc.Configuration(host="http://x"))
+        tracker = MemoryTracker(compact_min_rows=100, compact=True)
+        api_client.memory_tracker = tracker
+        payload = {"data": synthetic_rows("LiquidationHeatmap", 2000)}
+
+        with patch.object(
+            api_client.rest_client, "request", return_value=http_response(payload)
+        ):
+            large = klines(api_client)
+            tracker.budget = tracker.responses_bytes() // 2
+            compacted = klines(api_client, "ETH")
+
+        assert type(large.additional_properties["data"]) is list
+        assert isinstance(compacted.additional_properties["data"], CompactRows)
+        assert compacted.additional_properties["data"][0] == payload["data"][0]
+        assert tracker.compacted == 1
@@ -0,0 +1,192 @@
+"""
+Tests para el planificador de consultas de orderbook por profundidad.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.orderbook_depth import (
+    DepthPlanner,
+    DepthRequest,
+    depth_levels,
+    depth_range,
+    split_by_depth,
+)
+
+PARAMS = {"coin": "BTC", "exchange": "binance", "timeframe": "5m"}
+
+
+def ratio_response(depth):
+    return {
+        "data": [
+            {"openDate": 300, "bidAskRatio": float(i), "depth": level}
+            for i, level in enumerate(depth_levels(depth))
+        ]
+    }
+
+
+class RatioApi:
+    """API falsa ligada a un cliente, como las APIs generadas."""
+
+    def __init__(self, api_client):
+        self.api_client = api_client
+        self.calls = 0
+
+    def bid_ask_ratio_get(self, depth, **params):
+        self.calls += 1
+        return ratio_response(depth)
+
+
+def ratio_endpoint():
+    """Mock de bid_ask_ratio_get que etiqueta cada registro con su bucket."""
+
+    endpoint = Mock(side_effect=lambda depth, **params: ratio_response(depth))
+    endpoint.__qualname__ = "OrderbookApi.bid_ask_ratio_get"
+    return endpoint
+
+
+class TestDepthRanges:
+    """Tests para los rangos de profundidad."""
+
+    def test_depth_levels(self):
+        """Verificar los buckets incluidos en cada rango."""
+        assert depth_levels("0,full") == ("quote", "1", "5", "10", "20", "full")
+        assert depth_levels("quote,20") == ("quote", "1", "2", "5", "10", "20")
+        assert depth_levels("quote,2") == ("quote", "1", "2")
+        assert depth_levels("5%") == ("5",)
+
+    def test_depth_range(self):
+        """Verificar el rango mínimo que cubre varios niveles."""
+        assert depth_range(["20", "1", "5"]) == "1,20"
+
+    def test_invalid_depth(self):
+        """Verificar la validación de rangos."""
+        with pytest.raises(ValueError):
+            depth_levels("3")
+        with pytest.raises(ValueError):
+            depth_levels("20,1")
+
+
+class TestSplitByDepth:
+    """Tests para split_by_depth."""
+
+    def test_positional_split(self):
+        """Verificar la asignación por orden cuando no hay etiqueta."""
+        records = [
+            hc.BidAskRatio(open_date=600, bid_ask_ratio=1.0),
+            hc.BidAskRatio(open_date=600, bid_ask_ratio=2.0),
+            hc.BidAskRatio(open_date=300, bid_ask_ratio=3.0),
+            hc.BidAskRatio(open_date=300, bid_ask_ratio=4.0),
+        ]
+
+        series = split_by_depth(records, ["1", "2"])
+
+        assert [r.bid_ask_ratio for r in series["1"]] == [3.0, 1.0]
+        assert [r.bid_ask_ratio for r in series["2"]] == [4.0, 2.0]
+
+    def test_positional_full_range(self):
+        """Verificar la respuesta documentada de depth='0,full' sin etiquetas."""
+        levels = depth_levels("0,full")
+        records = [{"openDate": 300, "bidAskRatio": float(i)} for i in range(6)]
+
+        series = split_by_depth(records, levels)
+
+        assert [series[level][0]["bidAskRatio"] for level in levels] == [
+            0.0,
+            1.0,
+            2.0,
+            3.0,
+            4.0,
+            5.0,
+        ]
+
+    def test_positional_without_two(self):
+        """Verificar una respuesta sin el bucket '2' para un rango que lo cubre."""
+        records = [{"openDate": 300, "bidAskRatio": float(i)} for i in range(3)]
+
+        series = split_by_depth(records, depth_levels("1,10"))
+
+        assert series["2"] == []
+        assert [series[level][0]["bidAskRatio"] for level in ("1", "5", "10")] == [
+            0.0,
+            1.0,
+            2.0,
+        ]
+
+    def test_mismatched_response(self):
+        """Verificar el error cuando la respuesta no coincide con los niveles."""
+        with pytest.raises(ValueError):
+            split_by_depth([{"openDate": 300, "bidAskRatio": 1.0}], ["1", "5"])
+
+
+class TestDepthPlanner:
+    """Tests para DepthPlanner."""
+
+    def test_plan_groups_by_params(self):
+        """Verificar que sólo se agrupen consultas con los mismos parámetros."""
+        endpoint = ratio_endpoint()
+        planner = DepthPlanner()
+
+        planned = planner.plan(
+            [
+                DepthRequest(endpoint, "1", PARAMS),
+                DepthRequest(endpoint, "20", PARAMS),
+                DepthRequest(endpoint, "5", dict(PARAMS, coin="ETH")),
+            ]
+        )
+
+        assert [(p.depth, p.params["coin"]) for p in planned] == [
+            ("1,20", "BTC"),
+            ("5,5", "ETH"),
+        ]
+
+    def test_fetch_uses_one_call(self):
+        """Verificar que varias profundidades se resuelvan con una llamada."""
+        endpoint = ratio_endpoint()
+        planner = DepthPlanner()
+
+        one, five, twenty = planner.fetch(
+            [DepthRequest(endpoint, level, PARAMS) for level in ("1", "5", "20")]
+        )
+
+        endpoint.assert_called_once_with(depth="1,20", **PARAMS)
+        assert one[0]["depth"] == "1"
+        assert five[0]["depth"] == "5"
+        assert twenty[0]["depth"] == "20"
+
+    def test_cache(self, fake_clock):
+        """Verificar que los niveles extra del rango queden en caché."""
+        endpoint = ratio_endpoint()
+        planner = DepthPlanner(ttl=60, clock=fake_clock)
+        planner.fetch([DepthRequest(endpoint, level, PARAMS) for level in ("1", "10")])
+
+        assert planner.get(endpoint, "2", **PARAMS)[0]["depth"] == "2"
+        assert endpoint.call_count == 1
+
+        fake_clock.now = 61
+        planner.get(endpoint, "2", **PARAMS)
+        endpoint.assert_called_with(depth="2,2", **PARAMS)
+        assert endpoint.call_count == 2
+
+    def test_cache_per_client(self):
+        """Verificar que dos ApiClient no compartan resultados."""
+        first = RatioApi(hc.ApiClient(hc.Configuration(host="http://a")))
+        second = RatioApi(hc.ApiClient(hc.Configuration(host="http://b")))
+        planner = DepthPlanner()
+
+        planner.fetch(
+            [
+                DepthRequest(first.bid_ask_ratio_get, "1", PARAMS),
+                DepthRequest(second.bid_ask_ratio_get, "5", PARAMS),
+            ]
+        )
+        planner.get(second.bid_ask_ratio_get, "1", **PARAMS)
+
+        assert (first.calls, second.calls) == (1, 2)
+
+    def test_zero_is_not_a_bucket(self):
+        """Verificar que '0' no se acepte como profundidad de una serie."""
+        with pytest.raises(ValueError):
+            DepthPlanner().plan([DepthRequest(ratio_endpoint(), "0", PARAMS)])
@@ -0,0 +1,171 @@
+"""
+Tests para la caché de respuestas y el prefetch guiado por patrones.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.prefetch import Prefetcher, split_url
+from hyblock_capital_sdk.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Tests para ResponseCache."""
+
+    def test_get_put(self, http_response):
+        """Verificar el guardado de respuestas GET exitosas."""
+        cache = ResponseCache()
+        cache.put("GET", "http://x/klines?coin=BTC", http_response([1]))
+
+        cached = cache.get("GET", "http://x/klines?coin=BTC")
+
+        assert cached.data == b"[1]"
+        assert cached.status == 200
+        assert cache.get("GET", "http://x/klines?coin=ETH") is None
+        assert cache.stats()["hits"] == 1
+
+    def test_not_cacheable(self, http_response):
+        """Verificar que no se guarden errores ni métodos distintos de GET."""
+        cache = ResponseCache()
+
+        assert not cache.put("GET", "u", http_response({}, status=429))
+        assert not cache.put("POST", "u", http_response({}))
+
+    def test_ttl_and_lru(self, http_response, fake_clock):
+        """Verificar la expiración y el desalojo LRU."""
+        cache = ResponseCache(maxsize=2, ttl=10, clock=fake_clock)
+        for url in ("a", "b", "c"):
+            cache.put("GET", url, http_response([]))
+
+        assert cache.get("GET", "a") is None
+        assert cache.get("GET", "b") is not None
+
+        fake_clock.now = 10
+        assert cache.get("GET", "c") is None
+
+
+class TestPrefetcherPredictions:
+    """Tests para la predicción de peticiones."""
+
+    @pytest.fixture
+    def prefetcher(self):
+        return Prefetcher(hc.ApiClient(hc.Configuration()))
+
+    def test_window_stepping(self, prefetcher):
+        """Verificar la predicción de la siguiente ventana temporal."""
+        base = "http://x/klines?coin=BTC&timeframe=1h&startTime={}&endTime={}"
+
+        assert prefetcher.predict(base.format(0, 100)) == []
+        assert prefetcher.predict(base.format(100, 200)) == [base.format(200, 300)]
+
+    def test_irregular_windows(self, prefetcher):
+        """Verificar que no se prediga con pasos distintos."""
+        base = "http://x/klines?coin=BTC&startTime={}&endTime={}"
+        prefetcher.predict(base.format(0, 100))
+
+        assert prefetcher.predict(base.format(100, 150)) == []
+
+    def test_non_numeric_window(self, prefetcher):
+        """Verificar que una ventana no numérica no se prediga ni falle."""
+        base = "http://x/klines?coin=BTC&startTime={}"
+        prefetcher.predict(base.format("2024-01-01"))
+
+        assert prefetcher.predict(base.format("2024-01-02")) == []
+
+    def test_coin_sequence(self, prefetcher):
+        """Verificar el aprendizaje del orden de monedas."""
+        url = "http://x/fundingRate?coin={}&timeframe=1h"
+        for coin in ("BTC", "ETH", "SOL"):
+            prefetcher.predict(url.format(coin))
+
+        assert prefetcher.predict(url.format("BTC")) == [url.format("ETH")]
+        assert split_url(url.format("ETH"))[1] == [("coin", "ETH"), ("timeframe", "1h")]
+
+    def test_patterns_are_bounded(self):
+        """Verificar que se olviden las series usadas hace más tiempo."""
+        prefetcher = Prefetcher(hc.ApiClient(hc.Configuration()), maxsize=2)
+        base = "http://x/klines?coin={}&startTime={}&endTime={}"
+        for coin in ("BTC", "ETH", "SOL"):
+            prefetcher.predict(base.format(coin, 0, 100))
+
+        assert len(prefetcher._windows) == 2
+        assert base.format("BTC", 200, 300) not in prefetcher.predict(
+            base.format("BTC", 100, 200)
+        )
+        assert base.format("SOL", 200, 300) in prefetcher.predict(
+            base.format("SOL", 100, 200)
+        )
+
+
+class TestApiClientPrefetch:
+    """Tests para la integración con ApiClient."""
+
+    def test_prefetched_window_is_served_from_cache(self, http_response):
+        """Verificar que la ventana precargada no genere una petición real."""
+        api_client = hc.ApiClient(hc.Configuration(host="http://x"))
+        api_client.response_cache = ResponseCache()
+        api_client.prefetcher = Prefetcher(api_client, budget_share=0.5)
+        orderflow_api = hc.OrderflowApi(api_client)
+
+        with patch.object(
+            api_client.rest_client,
+            "request",
+            side_effect=lambda *a, **k: http_response({"openDate": 1, "close": 2.0}),
+        ) as request:
+            for start in (0, 100):
+                orderflow_api.klines_get(
+                    coin="BTC",
+                    timeframe="1h",
+                    exchange="binance",
+                    start_time=str(start),
+                    end_time=str(start + 100),
+                )
+            api_client.prefetcher.wait()
+            assert request.call_count == 3
+
+            klines = orderflow_api.klines_get(
+                coin="BTC",
+                timeframe="1h",
+                exchange="binance",
+                start_time="200",
+                end_time="300",
+            )
+
+        assert request.call_count == 3
+        assert klines == hc.Klines(open_date=1, close=2.0)
+        assert api_client.response_cache.prefetch_hits == 1
+        assert api_client.prefetcher.real_requests == 2
+
+    def test_prefetcher_error_does_not_break_request(self, http_response):
+        """Verificar que un fallo del prefetcher no afecte a la petición real."""
+        api_client = hc.ApiClient(hc.Configuration(host="http://x"))
+        api_client.response_cache = ResponseCache()
+        api_client.prefetcher = Prefetcher(api_client)
+
+        with patch.object(
+            api_client.rest_client, "request", return_value=http_response([])
+        ), patch.object(Prefetcher, "predict", side_effect=RuntimeError("bug")):
+            response = api_client.call_api("GET", "http://x/klines?coin=BTC")
+
+        assert response.status == 200
+
+    def test_budget_limits_prefetch(self, http_response):
+        """Verificar que el prefetch respete la fracción del budget."""
+        api_client = hc.ApiClient(hc.Configuration(host="http://x"))
+        api_client.response_cache = ResponseCache()
+        prefetcher = Prefetcher(api_client, budget_share=0.0)
+        api_client.prefetcher = prefetcher
+
+        with patch.object(
+            api_client.rest_client, "request", return_value=http_response([])
+        ) as request:
+            for start in (0, 100, 200):
+                api_client.call_api(
+                    "GET", f"http://x/klines?startTime={start}&endTime={start + 100}"
+                )
+            prefetcher.wait()
+
+        assert request.call_count == 3
+        assert prefetcher.prefetched == 0
@@ -0,0 +1,74 @@
+"""
+Tests para la codificación rápida de la query string.
+"""
+
+import datetime
+from unittest.mock import patch
+
+import pytest
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.query import encode_query
+
+
+def generic_query(api_client, params, collection_formats=None):
+    """Codifica con el camino genérico de ApiClient."""
+    with patch("hyblock_capital_sdk.api_client.encode_query", lambda *a: None):
+        return api_client.parameters_to_url_query(
+            api_client.sanitize_for_serialization(params), collection_formats
+        )
+
+
+class TestEncodeQuery:
+    """Tests para encode_query."""
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            [("coin", "BTC"), ("timeframe", "1m"), ("exchange", "binance")],
+            [("limit", 1000), ("startTime", "1704067200"), ("endTime", -5)],
+            [("bucket", 0.1), ("big", 1e20), ("small", 1.5e-07)],
+            [("flag", True), ("other", False)],
+            [("coin", "1000PEPE/USDT perp&x=ñ")],
+            {"coin": "ETH", "limit": 10},
+        ],
+    )
+    def test_matches_generic_path(self, params):
+        """Verificar que el resultado sea idéntico al camino genérico."""
+        expected = generic_query(hc.ApiClient(), params)
+        assert encode_query(params) == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [datetime.date(2024, 1, 1), ["a", "b"], {"a": 1}, None],
+    )
+    def test_non_scalar_values_fall_back(self, value):
+        """Verificar que los valores no escalares usen el camino genérico."""
+        assert encode_query([("coin", "BTC"), ("x", value)]) is None
+
+    def test_collection_formats_fall_back(self):
+        """Verificar que un parámetro con formato de colección no se codifique."""
+        assert encode_query([("coin", "BTC")], {"coin": "csv"}) is None
+        assert encode_query([("coin", "BTC")], {"other": "csv"}) == "coin=BTC"
+
+
+class TestParamSerialize:
+    """Tests de la query generada por param_serialize."""
+
+    def test_scalar_query(self):
+        """Verificar la URL de una petición típica."""
+        api_client = hc.ApiClient(hc.Configuration(host="http://x"))
+        _, url, _, _, _ = api_client.param_serialize(
+            "GET", "/klines", query_params=[("coin", "BTC"), ("limit", 5)]
+        )
+        assert url == "http://x/klines?coin=BTC&limit=5"
+
+    def test_generic_fallback(self):
+        """Verificar que los valores no escalares sigan serializándose."""
+        api_client = hc.ApiClient(hc.Configuration(host="http://x"))
+        _, url, _, _, _ = api_client.param_serialize(
+            "GET",
+            "/klines",
+            query_params=[("coin", "BTC"), ("date", datetime.date(2024, 1, 2))],
+        )
+        assert url == "http://x/klines?coin=BTC&date=2024-01-02"
@@ -0,0 +1,129 @@
+"""
+Tests para el transporte de grabación y reproducción.
+"""
+
+import gzip
+
+import pytest
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.recording import (
+    RecordingArchive,
+    RecordReplayClientObject,
+    UnrecordedRequestError,
+    normalize_url,
+)
+from hyblock_capital_sdk.response_cache import StoredResponse
+from hyblock_capital_sdk.testing import StandInServer
+
+
+def klines(api_client, coin="BTC"):
+    return hc.OrderflowApi(api_client).klines_get(
+        coin=coin, timeframe="1m", exchange="binance"
+    )
+
+
+def recording_client(server, path, mode, strict=True):
+    config = server.configuration()
+    config.recording_path = str(path)
+    config.recording_mode = mode
+    config.recording_strict = strict
+    return hc.ApiClient(config)
+
+
+class TestNormalizeUrl:
+    """Tests para normalize_url."""
+
+    def test_sorts_query_and_lowercases_host(self):
+        """Verificar que URLs equivalentes se normalicen igual."""
+        assert normalize_url(
+            "HTTPS://Api.example.com:443/klines?coin=BTC&exchange=binance"
+        ) == normalize_url("https://api.example.com/klines?exchange=binance&coin=BTC")
+
+    def test_keeps_path_case_and_custom_port(self):
+        """Verificar que se conserven la ruta y los puertos no estándar."""
+        assert (
+            normalize_url("http://localhost:8080/liquidationLevels?a=1")
+            == "http://localhost:8080/liquidationLevels?a=1"
+        )
+
+
+class TestRecordingArchive:
+    """Tests para RecordingArchive."""
+
+    def test_persists_compressed(self, tmp_path):
+        """Verificar que las respuestas se guarden comprimidas y se recarguen."""
+        path = tmp_path / "archive.jsonl.gz"
+        archive = RecordingArchive(str(path))
+        archive.put("GET", "http://x/a?b=1&a=2", StoredResponse(200, "OK", b"{}", {}))
+        archive.put("GET", "http://x/bin", StoredResponse(200, "OK", b"\xff\x00", {}))
+
+        with gzip.open(path, "rt") as f:
+            assert len(f.readlines()) == 2
+        reloaded = RecordingArchive(str(path))
+        assert len(reloaded) == 2
+        assert reloaded.get("GET", "http://x/a?a=2&b=1").data == b"{}"
+        assert reloaded.get("GET", "http://x/bin").data == b"\xff\x00"
+        assert ("GET", "http://x/missing") not in reloaded
+
+    def test_last_recording_wins(self, tmp_path):
+        """Verificar que una URL regrabada conserve la última respuesta."""
+        path = str(tmp_path / "archive.jsonl.gz")
+        archive = RecordingArchive(path)
+        archive.put("GET", "http://x/a", StoredResponse(200, "OK", b"1", {}))
+        archive.put("GET", "http://x/a", StoredResponse(200, "OK", b"2", {}))
+        assert RecordingArchive(path).get("GET", "http://x/a").data == b"2"
+
+
+class TestRecordReplayClientObject:
+    """Tests para RecordReplayClientObject."""
+
+    def test_record_then_replay_offline(self, tmp_path):
+        """Verificar que lo grabado se reproduzca sin servidor."""
+        path = tmp_path / "klines.jsonl.gz"
+        with StandInServer() as server:
+            recorded = klines(recording_client(server, path, "record"))
+            replay_client = recording_client(server, path, "replay")
+
+        assert replay_client.rest_client.replayed == 0
+        assert klines(replay_client) == recorded
+        assert replay_client.rest_client.replayed == 1
+
+    def test_strict_replay_rejects_unrecorded(self, tmp_path):
+        """Verificar que el modo estricto falle ante peticiones no grabadas."""
+        with StandInServer() as server:
+            api_client = recording_client(server, tmp_path / "empty.gz", "replay")
+            with pytest.raises(UnrecordedRequestError) as excinfo:
+                klines(api_client)
+
+        assert "coin=BTC" in str(excinfo.value)
+        assert server.requests["/klines"] == 0
+
+    def test_lenient_replay_records_misses(self, tmp_path):
+        """Verificar que el modo no estricto grabe lo que falta."""
+        path = tmp_path / "archive.gz"
+        with StandInServer() as server:
+            api_client = recording_client(server, path, "replay", strict=False)
+            klines(api_client)
+            klines(api_client)
+
+        assert server.requests["/klines"] == 1
+        assert api_client.rest_client.recorded == 1
+        assert api_client.rest_client.replayed == 1
+
+    def test_rate_limited_responses_are_not_recorded(self, tmp_path):
+        """Verificar que los 429 no queden grabados."""
+        path = tmp_path / "archive.gz"
+        with StandInServer(rate_limit_rate=1.0, retry_after=0) as server:
+            api_client = recording_client(server, path, "record")
+            with pytest.raises(hc.ApiException):
+                klines(api_client)
+
+        assert len(api_client.rest_client.archive) == 0
+
+    def test_invalid_mode(self, tmp_path):
+        """Verificar que se rechace un modo desconocido."""
+        with pytest.raises(hc.ApiValueError):
+            RecordReplayClientObject(
+                None, RecordingArchive(str(tmp_path / "a.gz")), mode="rewind"
+            )
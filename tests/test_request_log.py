@@ -0,0 +1,135 @@
+"""
+Tests para el log muestreado de peticiones.
+"""
+
+import logging
+import random
+
+import pytest
+from urllib3.exceptions import MaxRetryError
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.request_log import RequestLogger
+from hyblock_capital_sdk.testing import StandInServer
+
+
+def klines(api_client, coin="BTC"):
+    return hc.OrderflowApi(api_client).klines_get(
+        coin=coin, timeframe="1m", exchange="binance"
+    )
+
+
+@pytest.fixture
+def api_client(standin_server):
+    return hc.ApiClient(standin_server.configuration())
+
+
+class TestRequestLogger:
+    """Tests para RequestLogger."""
+
+    def test_logs_structured_metadata(self, api_client, caplog):
+        """Verificar la línea y los datos estructurados de una petición."""
+        api_client.request_observer = RequestLogger(sample_rate=1.0)
+        with caplog.at_level(logging.DEBUG, logger="hyblock_capital_sdk.request_log"):
+            klines(api_client)
+
+        (record,) = caplog.records
+        assert record.levelno == logging.DEBUG
+        assert record.getMessage().startswith("GET /klines params=coin=BTC")
+        assert "status=200" in record.getMessage()
+        data = record.hyblock.to_dict()
+        assert data["path"] == "/klines"
+        assert data["params"] == {
+            "coin": "BTC",
+            "timeframe": "1m",
+            "exchange": "binance",
+        }
+        assert data["response_bytes"] > 0
+
+    def test_sampling(self, api_client, caplog):
+        """Verificar que sólo se registre la muestra de peticiones exitosas."""
+        request_logger = RequestLogger(sample_rate=0.25, rng=random.Random(1))
+        api_client.request_observer = request_logger
+        with caplog.at_level(logging.DEBUG, logger="hyblock_capital_sdk.request_log"):
+            for _ in range(40):
+                klines(api_client)
+
+        assert request_logger.observed == 40
+        assert 0 < request_logger.logged < 40
+        assert len(caplog.records) == request_logger.logged
+
+    def test_formatting_is_lazy(self, api_client, monkeypatch):
+        """Verificar que no se formatee nada si el nivel está desactivado."""
+        formatted = []
+        monkeypatch.setattr(
+            "hyblock_capital_sdk.request_log.RequestEntry.__str__",
+            lambda self: formatted.append(1) or "",
+        )
+        request_logger = RequestLogger(sample_rate=1.0)
+        api_client.request_observer = request_logger
+        logging.getLogger("hyblock_capital_sdk.request_log").setLevel(logging.INFO)
+        try:
+            klines(api_client)
+        finally:
+            logging.getLogger("hyblock_capital_sdk.request_log").setLevel(
+                logging.NOTSET
+            )
+
+        assert formatted == []
+        assert request_logger.logged == 0
+
+    def test_ring_buffer(self, api_client):
+        """Verificar que el buffer guarde las últimas N peticiones."""
+        request_logger = RequestLogger(sample_rate=0.0, buffer_size=3)
+        api_client.request_observer = request_logger
+        for coin in ("BTC", "ETH", "SOL", "XRP"):
+            klines(api_client, coin)
+
+        dump = request_logger.dump()
+        assert [entry["params"]["coin"] for entry in dump] == ["ETH", "SOL", "XRP"]
+        request_logger.clear()
+        assert request_logger.dump() == []
+
+    def test_errors_always_logged_and_dump_buffer(self, caplog):
+        """Verificar que un error de servidor registre el buffer completo."""
+        request_logger = RequestLogger(sample_rate=0.0)
+        with StandInServer() as server:
+            api_client = hc.ApiClient(server.configuration())
+            api_client.request_observer = request_logger
+            klines(api_client, "ETH")
+            server.error_rate = 1.0
+            with caplog.at_level(logging.WARNING):
+                with pytest.raises(hc.ApiException):
+                    klines(api_client, "BTC")
+
+        error, dump = caplog.records
+        assert "status=500" in error.getMessage()
+        assert "coin=ETH" in dump.getMessage()
+        assert "coin=BTC" in dump.getMessage()
+
+    def test_transport_error_dumps_buffer(self, unreachable_client, caplog):
+        """Verificar que una petición sin respuesta registre el buffer."""
+        request_logger = RequestLogger(sample_rate=0.0)
+        unreachable_client.request_observer = request_logger
+
+        with caplog.at_level(logging.WARNING):
+            with pytest.raises(MaxRetryError):
+                klines(unreachable_client)
+
+        error, dump = caplog.records
+        assert "status=None" in error.getMessage()
+        assert "error=MaxRetryError" in error.getMessage()
+        assert "coin=BTC" in dump.getMessage()
+        assert (request_logger.observed, request_logger.logged) == (1, 1)
+
+    def test_chains_observer(self, api_client):
+        """Verificar que se llame al observer adicional."""
+        seen = []
+        api_client.request_observer = RequestLogger(observer=seen.append)
+        klines(api_client)
+        assert len(seen) == 1
+
+    def test_invalid_sample_rate(self):
+        """Verificar que se rechace una tasa de muestreo fuera de rango."""
+        with pytest.raises(ValueError):
+            RequestLogger(sample_rate=2.0)
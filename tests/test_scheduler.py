@@ -0,0 +1,162 @@
+"""
+Tests para el scheduler de polling alineado a las barras.
+"""
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.scheduler import PollingScheduler, next_boundary
+
+START = 1661235600  # Múltiplo de 1h
+
+
+def endpoint(name, open_date=START):
+    """Mock de endpoint que retorna una barra de volume delta."""
+    mock = Mock(return_value=[hc.VolumeDelta(open_date=open_date, volume_delta=1.0)])
+    mock.__qualname__ = name
+    return mock
+
+
+class TestNextBoundary:
+    """Tests para next_boundary."""
+
+    def test_boundaries(self):
+        """Verificar la frontera siguiente con retardo de asentamiento."""
+        assert next_boundary(START + 10, 300, 2.0) == START + 302
+        assert next_boundary(START + 1, 300, 2.0) == START + 2
+        assert next_boundary(START + 2, 300, 2.0) == START + 302
+        assert next_boundary(START, 60) == START + 60
+
+
+class TestPollingScheduler:
+    """Tests para PollingScheduler."""
+
+    def test_initial_poll_is_due_immediately(self, fake_clock):
+        """Verificar que la descarga inicial no espere a la frontera."""
+        fake_clock.now = START + 10
+        scheduler = PollingScheduler(clock=fake_clock)
+        scheduler.subscribe(endpoint("OrderflowApi.volume_delta_get"), "BTC", "5m")
+
+        assert scheduler.next_wakeup() == START + 10
+        assert len(scheduler.due()) == 1
+
+    def test_batches_due_subscriptions(self, fake_clock):
+        """Verificar que las suscripciones que vencen juntas se consulten juntas."""
+        fake_clock.now = START + 10
+        received = []
+        scheduler = PollingScheduler(settle_delay=2.0, clock=fake_clock)
+        five = endpoint("OrderflowApi.volume_delta_get")
+        hour = endpoint("OrderflowApi.klines_get")
+        scheduler.subscribe(five, "BTC", "5m")
+        scheduler.subscribe(five, "ETH", "5m")
+        scheduler.subscribe(hour, "BTC", "1h")
+        scheduler.add_listener(lambda sync, bars: received.append(sync.coin))
+
+        updates = scheduler.run_pending()
+
+        assert len(updates) == 3
+        assert sorted(received) == ["BTC", "BTC", "ETH"]
+        assert scheduler.next_wakeup() == START + 302
+
+        fake_clock.now = START + 302
+        assert {sync.coin for sync in scheduler.due()} == {"BTC", "ETH"}
+        assert all(sync.timeframe == "5m" for sync in scheduler.due())
+        scheduler.stop()
+
+    def test_callback_and_errors(self, fake_clock):
+        """Verificar callbacks por serie y que un error no corte el ciclo."""
+        fake_clock.now = START
+        errors = []
+        callback = Mock()
+        failing = endpoint("FundingApi.funding_rate_get")
+        failing.side_effect = RuntimeError("boom")
+        scheduler = PollingScheduler(
+            clock=fake_clock, on_error=lambda sync, e: errors.append(str(e))
+        )
+        sync = scheduler.subscribe(
+            endpoint("OrderflowApi.volume_delta_get"), "BTC", "1m", callback=callback
+        )
+        scheduler.subscribe(failing, "BTC", "1m")
+
+        updates = scheduler.run_pending()
+
+        assert [s for s, _ in updates] == [sync]
+        callback.assert_called_once()
+        assert errors == ["boom"]
+        assert scheduler.due() == []
+        scheduler.stop()
+
+    def test_unsubscribe(self, fake_clock):
+        """Verificar que una serie dada de baja no se consulte."""
+        fake_clock.now = START
+        scheduler = PollingScheduler(clock=fake_clock)
+        sync = scheduler.subscribe(endpoint("OrderflowApi.klines_get"), "BTC", "1m")
+
+        scheduler.unsubscribe(sync)
+
+        assert scheduler.next_wakeup() is None
+        assert scheduler.run_pending() == []
+
+    def test_stream(self, fake_clock):
+        """Verificar el iterador asíncrono."""
+        fake_clock.now = START
+        scheduler = PollingScheduler(clock=fake_clock)
+        scheduler.subscribe(endpoint("OrderflowApi.klines_get"), "BTC", "1m")
+
+        async def first_update():
+            async for sync, bars in scheduler.stream():
+                scheduler.stop()
+                return sync, bars
+
+        sync, bars = asyncio.run(first_update())
+
+        assert sync.coin == "BTC"
+        assert bars[0].volume_delta == 1.0
+
+    def test_subscribe_and_stop_wake_the_loop(self, fake_clock):
+        """Verificar que subscribe y stop no esperen a la próxima frontera."""
+        fake_clock.now = START
+        polled = threading.Event()
+        scheduler = PollingScheduler(settle_delay=0.0, clock=fake_clock)
+        scheduler.start()
+        thread = scheduler._thread
+
+        scheduler.subscribe(
+            endpoint("OrderflowApi.klines_get"),
+            "BTC",
+            "1d",
+            callback=lambda sync, bars: polled.set(),
+        )
+        assert polled.wait(2)
+        assert scheduler.next_wakeup() == next_boundary(START, 86400)
+
+        scheduler.stop(timeout=2)
+        assert not thread.is_alive()
+
+    def test_stream_sees_new_subscriptions(self, fake_clock):
+        """Verificar que el iterador despierte al suscribir una serie."""
+        fake_clock.now = START
+        scheduler = PollingScheduler(clock=fake_clock)
+
+        async def first_update():
+            threading.Timer(
+                0.05,
+                scheduler.subscribe,
+                (endpoint("OrderflowApi.klines_get"), "ETH", "1d"),
+            ).start()
+            async for sync, bars in scheduler.stream():
+                scheduler.stop()
+                return sync
+
+        sync = asyncio.run(asyncio.wait_for(first_update(), 2))
+
+        assert sync.coin == "ETH"
+
+    def test_invalid_settle_delay(self):
+        """Verificar la validación del retardo."""
+        with pytest.raises(ValueError):
+            PollingScheduler(settle_delay=-1)
@@ -0,0 +1,61 @@
+"""
+Tests para la serialización masiva de modelos a JSON.
+"""
+
+import json
+
+import pytest
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.memory import CompactRows
+from hyblock_capital_sdk.serialization import to_json_many
+from hyblock_capital_sdk.testing import model_classes, synthetic_rows
+
+
+def build(model, rows):
+    cls = model_classes()[model] if isinstance(model, str) else model
+    return [cls.from_dict(row) for row in rows]
+
+
+class TestToJsonMany:
+    """Tests para to_json_many."""
+
+    @pytest.mark.parametrize("model", sorted(model_classes()))
+    def test_matches_to_dict(self, model):
+        """Verificar el mismo contenido que to_dict() en todos los modelos."""
+        models = build(model, synthetic_rows(model, 3))
+        payload = to_json_many(models)
+
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == [m.to_dict() for m in models]
+
+    def test_empty(self):
+        """Verificar una lista vacía."""
+        assert to_json_many([]) == b"[]"
+
+    def test_additional_properties(self):
+        """Verificar propiedades adicionales en el modelo y en la lista anidada."""
+        rows = synthetic_rows("VolumeProfile", 3)
+        rows[0]["newField"] = {"a": [1, 2]}
+        rows[1]["data"][0]["nested"] = "x"
+        rows[2]["data"] = []
+        models = build(hc.VolumeProfile, rows)
+
+        assert json.loads(to_json_many(models)) == [m.to_dict() for m in models]
+
+    def test_none_fields_omitted(self):
+        """Verificar que los campos None no se serialicen."""
+        models = [hc.VolumeProfile(start_date=1), hc.VolumeProfile()]
+        assert to_json_many(models) == b'[{"startDate":1},{}]'
+
+    def test_mixed_classes(self):
+        """Verificar una lista con modelos de distintas clases."""
+        models = build("Klines", synthetic_rows("Klines", 2)) + build(
+            "VolumeProfile", synthetic_rows("VolumeProfile", 2)
+        )
+        assert json.loads(to_json_many(models)) == [m.to_dict() for m in models]
+
+    def test_compact_rows(self):
+        """Verificar que se acepten filas compactadas por MemoryTracker."""
+        models = build("Klines", synthetic_rows("Klines", 10))
+        assert to_json_many(CompactRows(models)) == to_json_many(models)
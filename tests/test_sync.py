@@ -0,0 +1,142 @@
+"""
+Tests para la sincronización incremental de series temporales.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.series import timeframe_seconds
+from hyblock_capital_sdk.sync import IncrementalSync, SyncManager
+
+START = 1661235900
+
+
+def kline(open_date, close):
+    """Crea una vela de 1m con el cierre indicado."""
+    return hc.Klines(
+        open_date=open_date, open=close, high=close, low=close, close=close
+    )
+
+
+@pytest.fixture
+def clock(fake_clock):
+    """Reloj ubicado a mitad de la tercera barra."""
+    fake_clock.now = START + 150
+    return fake_clock
+
+
+@pytest.fixture
+def klines_get():
+    """Mock de OrderflowApi.klines_get."""
+    endpoint = Mock()
+    endpoint.__qualname__ = "OrderflowApi.klines_get"
+    return endpoint
+
+
+class TestIncrementalSync:
+    """Tests para IncrementalSync."""
+
+    def test_initial_poll_uses_limit(self, klines_get, clock):
+        """Verificar que la primera llamada pida la ventana completa."""
+        klines_get.return_value = [kline(START + 60 * i, 100 + i) for i in range(3)]
+        sync = IncrementalSync(
+            klines_get, "BTC", "1m", exchange="binance", maxlen=10, clock=clock
+        )
+
+        new_bars = sync.poll()
+
+        klines_get.assert_called_once_with(
+            coin="BTC", timeframe="1m", exchange="binance", limit=10
+        )
+        assert len(new_bars) == 3
+        assert sync.last_closed == START + 60
+        assert sync.key == ("OrderflowApi.klines_get", "BTC", "binance", "1m", None)
+
+    def test_incremental_poll_replaces_open_bar(self, klines_get, clock):
+        """Verificar que se pida desde la última barra cerrada y se reemplace la abierta."""
+        klines_get.return_value = [kline(START + 60 * i, 100 + i) for i in range(3)]
+        sync = IncrementalSync(klines_get, "BTC", "1m", maxlen=10, clock=clock)
+        sync.poll()
+
+        clock.now = START + 200
+        klines_get.return_value = [kline(START + 180, 104), kline(START + 120, 103)]
+        changed = sync.poll()
+
+        assert klines_get.call_args.kwargs["start_time"] == str(START + 61)
+        assert [bar.close for bar in changed] == [103, 104]
+        assert [bar.close for bar in sync.snapshot()] == [100, 101, 103, 104]
+        assert sync.last_closed == START + 120
+
+    def test_ring_buffer_is_bounded(self, klines_get, clock):
+        """Verificar que el buffer descarte las barras más antiguas."""
+        klines_get.return_value = [kline(START + 60 * i, i) for i in range(5)]
+        clock.now = START + 600
+        sync = IncrementalSync(klines_get, "BTC", "1m", maxlen=3, clock=clock)
+
+        sync.poll()
+
+        assert len(sync) == 3
+        assert sync.last_open_date == START + 240
+        assert [bar.close for bar in sync] == [2, 3, 4]
+
+    def test_accepts_raw_json(self, clock):
+        """Verificar que se acepten respuestas en formato JSON crudo."""
+        sync = IncrementalSync(Mock(), "BTC", "1m", clock=clock)
+
+        changed = sync.apply({"data": [{"openDate": START, "fundingRate": 0.01}]})
+
+        assert changed == [{"openDate": START, "fundingRate": 0.01}]
+        assert sync.last_closed == START
+
+    def test_reset(self, klines_get, clock):
+        """Verificar que reset fuerce una descarga completa."""
+        klines_get.return_value = [kline(START, 100)]
+        sync = IncrementalSync(klines_get, "BTC", "1m", maxlen=5, clock=clock)
+        sync.poll()
+        sync.reset()
+
+        assert len(sync) == 0
+        assert sync.request_params()["limit"] == 5
+
+
+class TestSyncManager:
+    """Tests para SyncManager."""
+
+    def test_one_sync_per_key(self, klines_get, clock):
+        """Verificar que se reutilice la sincronización de cada serie."""
+        manager = SyncManager(maxlen=10, clock=clock)
+
+        first = manager.get(klines_get, "BTC", "1m", exchange="binance")
+        second = manager.get(klines_get, "BTC", "1m", exchange="binance")
+        other = manager.get(klines_get, "ETH", "1m", exchange="binance")
+
+        assert first is second
+        assert first is not other
+        assert len(manager) == 2
+
+    def test_one_sync_per_client(self, clock):
+        """Verificar que dos ApiClient no compartan la sincronización."""
+        manager = SyncManager(maxlen=10, clock=clock)
+        first = hc.OrderflowApi(hc.ApiClient()).klines_get
+        second = hc.OrderflowApi(hc.ApiClient()).klines_get
+
+        assert manager.get(first, "BTC", "1m") is not manager.get(second, "BTC", "1m")
+        assert manager.get(first, "BTC", "1m") is manager.get(first, "BTC", "1m")
+
+    def test_poll_all(self, klines_get, clock):
+        """Verificar la consulta de todas las series registradas."""
+        klines_get.return_value = [kline(START, 100)]
+        manager = SyncManager(clock=clock)
+        sync = manager.get(klines_get, "BTC", "1m")
+
+        updates = manager.poll_all()
+
+        assert updates[sync.key][0].close == 100
+
+    def test_invalid_timeframe(self, klines_get):
+        """Verificar la validación del timeframe."""
+        assert timeframe_seconds("15m") == 900
+        with pytest.raises(ValueError):
+            IncrementalSync(klines_get, "BTC", "3m")
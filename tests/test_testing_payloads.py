@@ -0,0 +1,54 @@
+"""
+Tests para los payloads sintéticos de hyblock_capital_sdk.testing.
+"""
+
+import json
+
+import pytest
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.testing import (
+    model_classes,
+    resolve_model,
+    synthetic_payload,
+    synthetic_record,
+    synthetic_rows,
+)
+
+
+class TestSyntheticPayloads:
+    """Tests para la generación de payloads sintéticos."""
+
+    def test_every_model_round_trips(self):
+        """Verificar que cada modelo acepte y reproduzca su registro."""
+        classes = model_classes()
+
+        assert "Klines" in classes
+        for name, cls in classes.items():
+            record = synthetic_record(cls, index=1)
+            assert cls.from_dict(record).to_dict() == record, name
+
+    def test_rows_are_deterministic(self):
+        """Verificar que las filas sean deterministas y con fechas crecientes."""
+        rows = synthetic_rows("Klines", 5, seed=7)
+
+        assert rows == synthetic_rows("Klines", 5, seed=7)
+        assert [r["openDate"] for r in rows] == sorted(r["openDate"] for r in rows)
+        assert len({r["openDate"] for r in rows}) == 5
+
+    def test_payload_deserializes(self):
+        """Verificar que el payload se deserialice con ApiClient."""
+        payload = synthetic_payload("OpenInterestProfile", 3)
+
+        result = hc.ApiClient().deserialize(
+            payload.decode(), "List[OpenInterestProfile]", "application/json"
+        )
+
+        assert len(result) == 3
+        assert len(result[0].data) == 3
+        assert json.loads(payload)[0]["startDate"] == result[0].start_date
+
+    def test_unknown_model(self):
+        """Verificar el error con un modelo inexistente."""
+        with pytest.raises(KeyError):
+            resolve_model("NoExiste")
@@ -0,0 +1,123 @@
+"""
+Tests para el servidor local que imita la API.
+"""
+
+import time
+
+import pytest
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.client_pool import ApiClientPool
+from hyblock_capital_sdk.exceptions import ServiceException, UnauthorizedException
+from hyblock_capital_sdk.testing import StandInServer, api_routes
+
+
+class TestApiRoutes:
+    """Tests para api_routes."""
+
+    def test_includes_generated_paths(self):
+        """Verificar que se descubran las rutas y sus modelos de respuesta."""
+        routes = api_routes()
+        assert routes["/klines"] == "Klines"
+        assert routes["/liquidationLevels"] == "LiquidationLevels"
+        assert routes["/catalog"] == "Catalog"
+        assert len(routes) > 50
+
+
+class TestStandInServer:
+    """Tests para StandInServer."""
+
+    def test_serves_generated_apis(self, standin_server):
+        """Verificar que las APIs generadas deserialicen las respuestas."""
+        api_client = hc.ApiClient(standin_server.configuration())
+        klines = hc.OrderflowApi(api_client).klines_get(
+            coin="BTC", timeframe="1m", exchange="binance"
+        )
+        catalog = hc.CatalogApi(api_client).catalog_get()
+
+        assert isinstance(klines, hc.Klines)
+        assert isinstance(catalog, hc.Catalog)
+        assert standin_server.requests["/klines"] == 1
+        assert standin_server.statuses[200] == 2
+
+    def test_every_route_deserializes(self, standin_server):
+        """Verificar que cada ruta responda JSON válido para su modelo."""
+        api_client = hc.ApiClient(standin_server.configuration())
+        for path, model in api_routes().items():
+            response = api_client.call_api("GET", standin_server.host + path)
+            response.read()
+            data = api_client.response_deserialize(response, {"200": model}).data
+            assert type(data).__name__ == model
+
+    def test_unknown_path(self, standin_server):
+        """Verificar que una ruta desconocida responda 404."""
+        api_client = hc.ApiClient(standin_server.configuration())
+        response = api_client.call_api("GET", standin_server.host + "/nope")
+        assert response.status == 404
+
+    def test_rate_limit_injection(self):
+        """Verificar los 429 inyectados con su Retry-After."""
+        # urllib3 reintenta los 429 esperando el Retry-After (3 veces)
+        with StandInServer(rate_limit_rate=1.0, retry_after=0) as server:
+            api_client = hc.ApiClient(server.configuration())
+            with pytest.raises(hc.ApiException) as excinfo:
+                hc.OrderflowApi(api_client).klines_get(
+                    coin="BTC", timeframe="1m", exchange="binance"
+                )
+
+        assert excinfo.value.status == 429
+        assert excinfo.value.headers["Retry-After"] == "0"
+        assert server.statuses[429] == 4
+
+    def test_error_injection(self):
+        """Verificar los errores 500 inyectados."""
+        with StandInServer(error_rate=1.0) as server:
+            api_client = hc.ApiClient(server.configuration())
+            with pytest.raises(ServiceException):
+                hc.CatalogApi(api_client).catalog_get()
+
+    def test_api_key_required(self):
+        """Verificar que se rechace una API key distinta a la exigida."""
+        with StandInServer(api_key="secret") as server:
+            good = hc.ApiClient(server.configuration())
+            bad = hc.ApiClient(server.configuration(api_key={"Api Key": "other"}))
+            hc.CatalogApi(good).catalog_get()
+            with pytest.raises(UnauthorizedException):
+                hc.CatalogApi(bad).catalog_get()
+
+    def test_latency(self):
+        """Verificar que se aplique la latencia configurada."""
+        with StandInServer(latency=0.05) as server:
+            api_client = hc.ApiClient(server.configuration())
+            started = time.perf_counter()
+            hc.CatalogApi(api_client).catalog_get()
+            assert time.perf_counter() - started >= 0.05
+
+    def test_rows_and_list_size(self):
+        """Verificar el tamaño configurable de los payloads."""
+        server = StandInServer(rows=10)
+        assert server.payload("/klines").count(b"openDate") == 10
+        small = StandInServer(list_size=1).payload("/volumeProfile")
+        large = StandInServer(list_size=50).payload("/volumeProfile")
+        assert len(large) > len(small)
+
+    def test_hit_limit_with_client_pool(self):
+        """Verificar el saldo y los 429 por key con ApiClientPool."""
+        with StandInServer(hit_limit=2, retry_after=0) as server:
+            pool = ApiClientPool(
+                [
+                    server.configuration(api_key={"Api Key": "key-1"}),
+                    server.configuration(api_key={"Api Key": "key-2"}),
+                ]
+            )
+            balances = pool.refresh_balances()
+            orderflow_api = hc.OrderflowApi(pool)
+            for _ in range(4):
+                orderflow_api.klines_get(coin="BTC", timeframe="1m", exchange="x")
+            with pytest.raises(hc.ApiException) as excinfo:
+                orderflow_api.klines_get(coin="BTC", timeframe="1m", exchange="x")
+
+        assert balances == {0: 2, 1: 2}
+        assert excinfo.value.status == 429
+        assert [state.requests for state in pool.keys] == [3, 2]
+        assert [state.throttled for state in pool.keys] == [1, 0]
@@ -0,0 +1,178 @@
+"""
+Tests de concurrencia para un ApiClient compartido entre hilos.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+import hyblock_capital_sdk as hc
+
+
+class TestSharedApiClient:
+    """Tests para el uso de un ApiClient desde varios hilos."""
+
+    def test_param_serialize_does_not_mutate_headers(self):
+        """Verificar que param_serialize no modifique el dict recibido."""
+        api_client = hc.ApiClient(hc.Configuration(host="http://x"))
+        headers = {"Accept": "application/json"}
+
+        _, _, serialized, _, _ = api_client.param_serialize(
+            "GET", "/klines", header_params=headers
+        )
+
+        assert headers == {"Accept": "application/json"}
+        assert serialized["User-Agent"] == api_client.user_agent
+
+    def test_set_default_header_is_copy_on_write(self):
+        """Verificar que set_default_header reemplace el dict de headers."""
+        api_client = hc.ApiClient()
+        before = api_client.default_headers
+
+        api_client.set_default_header("X-Trace", "1")
+
+        assert "X-Trace" not in before
+        assert api_client.default_headers["X-Trace"] == "1"
+
+    def test_concurrent_requests_and_header_updates(self, http_response):
+        """Verificar peticiones concurrentes mientras cambian los headers."""
+        config = hc.Configuration(host="http://x", api_key={"Api Key": "secret"})
+        api_client = hc.ApiClient(config)
+        orderflow_api = hc.OrderflowApi(api_client)
+        seen = []
+        stop = threading.Event()
+
+        def request(method, url, headers=None, **kwargs):
+            seen.append(dict(headers))
+            return http_response({"openDate": 1, "close": 2.0})
+
+        def churn_headers():
+            i = 0
+            while not stop.is_set():
+                api_client.set_default_header("X-Counter", str(i))
+                i += 1
+
+        def call(i):
+            return orderflow_api.klines_get(
+                coin="BTC", timeframe="1h", exchange="binance", limit=i + 1
+            )
+
+        with patch.object(api_client.rest_client, "request", side_effect=request):
+            writer = threading.Thread(target=churn_headers)
+            writer.start()
+            try:
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    results = list(executor.map(call, range(400)))
+            finally:
+                stop.set()
+                writer.join()
+
+        assert all(r == hc.Klines(open_date=1, close=2.0) for r in results)
+        assert len(seen) == 400
+        assert all(h["x-api-key"] == "secret" for h in seen)
+        assert all(h["User-Agent"] == api_client.user_agent for h in seen)
+
+    def test_update_configuration_is_copy_on_write(self):
+        """Verificar que update_configuration publique una copia."""
+        config = hc.Configuration(host="http://x", api_key={"Api Key": "old"})
+        api_client = hc.ApiClient(config)
+        rest_client = api_client.rest_client
+
+        updated = api_client.update_configuration(api_key={"Api Key": "new"})
+
+        assert config.api_key == {"Api Key": "old"}
+        assert api_client.configuration is updated
+        assert updated.api_key == {"Api Key": "new"}
+        assert api_client.rest_client is rest_client
+        with pytest.raises(hc.ApiValueError):
+            api_client.update_configuration(no_such_setting=1)
+
+    def test_update_configuration_rebuilds_transport(self):
+        """Verificar que cambiar los reintentos reconstruya el transporte."""
+        api_client = hc.ApiClient(hc.Configuration(host="http://x"))
+        rest_client = api_client.rest_client
+
+        with patch.object(rest_client, "close") as close, patch(
+            "hyblock_capital_sdk.api_client.prewarm"
+        ) as prewarm:
+            api_client.update_configuration(retries=5, prewarm_connections=2)
+
+        assert api_client.rest_client is not rest_client
+        assert (
+            api_client.rest_client.pool_manager.connection_pool_kw["retries"].total == 5
+        )
+        close.assert_called_once_with()
+        prewarm.assert_called_once_with(api_client, 2)
+
+    def test_auth_uses_the_serialized_configuration(self):
+        """Verificar que la autenticación use la configuración de la petición."""
+        config = hc.Configuration(host="http://x", api_key={"Api Key": "old"})
+        api_client = hc.ApiClient(config)
+        api_client.update_configuration(api_key={"Api Key": "new"})
+        headers = {}
+
+        api_client.update_params_for_auth(
+            headers, [], ["Api Key"], "/klines", "GET", None, configuration=config
+        )
+
+        assert headers["x-api-key"] == "old"
+
+    def test_concurrent_requests_and_key_rotation(self, http_response):
+        """Verificar que cada petición use una configuración completa."""
+        api_client = hc.ApiClient(
+            hc.Configuration(host="http://x", api_key={"Api Key": "key-0"})
+        )
+        orderflow_api = hc.OrderflowApi(api_client)
+        seen = []
+        stop = threading.Event()
+
+        def request(method, url, headers=None, **kwargs):
+            seen.append(headers["x-api-key"])
+            return http_response({"openDate": 1, "close": 2.0})
+
+        def rotate_keys():
+            i = 0
+            while not stop.is_set():
+                i += 1
+                api_client.update_configuration(api_key={"Api Key": f"key-{i}"})
+
+        with patch.object(api_client.rest_client, "request", side_effect=request):
+            writer = threading.Thread(target=rotate_keys)
+            writer.start()
+            try:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    list(
+                        executor.map(
+                            lambda _: orderflow_api.klines_get(
+                                coin="BTC", timeframe="1h", exchange="binance"
+                            ),
+                            range(200),
+                        )
+                    )
+            finally:
+                stop.set()
+                writer.join()
+
+        assert len(seen) == 200
+        assert all(key.startswith("key-") for key in seen)
+
+    def test_get_default_is_singleton_across_threads(self):
+        """Verificar que get_default cree una sola instancia por defecto."""
+        hc.ApiClient.set_default(None)
+        hc.Configuration.set_default(None)
+        barrier = threading.Barrier(8)
+
+        def get_default(_):
+            barrier.wait()
+            return hc.ApiClient.get_default()
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                clients = list(executor.map(get_default, range(8)))
+            assert len({id(c) for c in clients}) == 1
+            assert len({id(c.configuration) for c in clients}) == 1
+        finally:
+            hc.ApiClient.set_default(None)
+            hc.Configuration.set_default(None)
@@ -0,0 +1,138 @@
+"""
+Tests para los tiempos por fase de las peticiones.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import MaxRetryError
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.response_cache import ResponseCache
+from hyblock_capital_sdk.timings import (
+    PHASES,
+    TimedHTTPConnection,
+    count_rows,
+    is_instrumented,
+)
+
+PAYLOAD = json.dumps({"openDate": 1, "close": 2.0}).encode()
+
+
+@pytest.fixture
+def api_client(standin_server):
+    return hc.ApiClient(standin_server.configuration())
+
+
+def klines(api_client):
+    return hc.OrderflowApi(api_client).klines_get(
+        coin="BTC", timeframe="1h", exchange="binance"
+    )
+
+
+class TestRequestTimings:
+    """Tests para ApiClient.request_observer."""
+
+    def test_phases_and_sizes(self, api_client, standin_server):
+        """Verificar las fases, el tamaño y las filas de una petición."""
+        recorded = []
+        api_client.request_observer = recorded.append
+
+        klines(api_client)
+        klines(api_client)
+
+        first, second = recorded
+        assert first.status == 200
+        assert first.response_bytes == len(standin_server.payload("/klines"))
+        assert first.rows == 1
+        assert first.connect > 0
+        assert second.connect == 0
+        assert all(first.to_dict()[phase] >= 0 for phase in PHASES)
+        assert first.total == pytest.approx(sum(first.to_dict()[p] for p in PHASES))
+        assert "coin=BTC" in first.url
+
+    def test_error_response_is_reported(self, api_client, standin_server):
+        """Verificar que los errores HTTP también se reporten."""
+        standin_server.error_rate = 1.0
+        recorded = []
+        api_client.request_observer = recorded.append
+
+        with pytest.raises(hc.ApiException):
+            klines(api_client)
+
+        assert recorded[0].status == 500
+
+    def test_transport_error_is_reported(self, unreachable_client):
+        """Verificar que una petición sin respuesta también se reporte."""
+        recorded = []
+        unreachable_client.request_observer = recorded.append
+
+        with pytest.raises(MaxRetryError) as raised:
+            klines(unreachable_client)
+
+        (timings,) = recorded
+        assert timings.status is None
+        assert timings.error is raised.value
+        assert timings.to_dict()["error"] == repr(raised.value)
+
+    def test_instrumented_once_and_restored_on_close(self, api_client):
+        """Verificar que el pool se instrumente al crear el cliente."""
+        pool_manager = api_client.rest_client.pool_manager
+        pool = pool_manager.connection_from_url(api_client.configuration.host)
+
+        assert is_instrumented(pool_manager)
+        assert pool.ConnectionCls is TimedHTTPConnection
+
+        api_client.rest_client.close()
+
+        assert not is_instrumented(pool_manager)
+        new_pool = pool_manager.connection_from_url(api_client.configuration.host)
+        assert new_pool.ConnectionCls is HTTPConnection
+
+    def test_observer_errors_are_ignored(self, api_client, standin_server):
+        """Verificar que un observer con errores no afecte a la petición."""
+
+        def observer(timings):
+            raise RuntimeError("boom")
+
+        api_client.request_observer = observer
+
+        expected = hc.Klines.from_json(standin_server.payload("/klines").decode())
+        assert klines(api_client) == expected
+
+    def test_cached_response(self, http_response):
+        """Verificar la marca de respuestas servidas desde la caché."""
+        api_client = hc.ApiClient(hc.Configuration(host="http://x"))
+        api_client.response_cache = ResponseCache()
+        recorded = []
+        api_client.request_observer = recorded.append
+        response = http_response(PAYLOAD)
+
+        with patch.object(api_client.rest_client, "request", return_value=response):
+            klines(api_client)
+            klines(api_client)
+
+        assert [t.cached for t in recorded] == [False, True]
+
+    def test_disabled_by_default(self, http_response):
+        """Verificar que sin observer no se adjunten tiempos."""
+        api_client = hc.ApiClient(hc.Configuration(host="http://x"))
+        response = http_response(PAYLOAD)
+
+        with patch.object(api_client.rest_client, "request", return_value=response):
+            result = api_client.call_api("GET", "http://x/klines")
+
+        assert not hasattr(result, "timings")
+
+
+class TestCountRows:
+    """Tests para count_rows."""
+
+    def test_count_rows(self):
+        """Verificar el conteo de filas según la forma del JSON."""
+        assert count_rows([1, 2, 3]) == 3
+        assert count_rows({"data": [1, 2]}) == 2
+        assert count_rows({"a": 1}) == 1
+        assert count_rows("texto") == 0
@@ -0,0 +1,239 @@
+"""
+Tests para las trazas y métricas de las llamadas del SDK.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from urllib3.exceptions import MaxRetryError
+
+import hyblock_capital_sdk as hc
+from hyblock_capital_sdk.response_cache import ResponseCache
+from hyblock_capital_sdk.tracing import (
+    Exporter,
+    InMemoryExporter,
+    OpenTelemetryExporter,
+    Tracer,
+    request_attributes,
+)
+
+PAYLOAD = json.dumps({"openDate": 1, "close": 2.0}).encode()
+
+
+def klines(api_client):
+    return hc.OrderflowApi(api_client).klines_get(
+        coin="BTC", timeframe="1h", exchange="binance"
+    )
+
+
+@pytest.fixture
+def traced():
+    api_client = hc.ApiClient(hc.Configuration(host="http://x/v1"))
+    exporter = InMemoryExporter()
+    api_client.request_observer = Tracer(exporter, base_path="/v1")
+    return api_client, exporter
+
+
+class TestTracer:
+    """Tests para Tracer con InMemoryExporter."""
+
+    def test_spans(self, http_response, traced):
+        """Verificar los spans y sus atributos."""
+        api_client, exporter = traced
+
+        with patch.object(
+            api_client.rest_client, "request", return_value=http_response(PAYLOAD)
+        ):
+            klines(api_client)
+
+        # el hijo termina antes que el padre
+        deserialize, call = exporter.spans
+        assert call.name == "hyblock.call_api"
+        assert deserialize.name == "hyblock.response_deserialize"
+        assert call.parent is None
+        assert deserialize.parent == "hyblock.call_api"
+        assert call.attributes["hyblock.resource"] == "/klines"
+        assert call.attributes["hyblock.coin"] == "BTC"
+        assert call.attributes["hyblock.exchange"] == "binance"
+        assert call.attributes["hyblock.timeframe"] == "1h"
+        assert call.attributes["http.status_code"] == 200
+        assert call.attributes["hyblock.response_bytes"] == len(PAYLOAD)
+        assert deserialize.attributes["hyblock.rows"] == 1
+        assert call.start_ns <= deserialize.start_ns
+        assert deserialize.start_ns <= deserialize.end_ns <= call.end_ns
+        assert not call.error
+
+    def test_metrics(self, http_response, traced):
+        """Verificar los contadores de peticiones y aciertos de caché."""
+        api_client, exporter = traced
+        api_client.response_cache = ResponseCache()
+
+        with patch.object(
+            api_client.rest_client, "request", return_value=http_response(PAYLOAD)
+        ):
+            klines(api_client)
+            klines(api_client)
+
+        assert exporter.counter("hyblock.client.requests") == 2
+        assert exporter.counter("hyblock.client.cache_hits") == 1
+        assert len(exporter.histogram("hyblock.client.duration")) == 2
+        assert exporter.counter(
+            "hyblock.client.requests", **{"hyblock.resource": "/klines"}
+        )
+
+    def test_rate_limited(self, http_response, traced):
+        """Verificar las métricas de respuestas 429."""
+        api_client, exporter = traced
+
+        with patch.object(
+            api_client.rest_client,
+            "request",
+            return_value=http_response(PAYLOAD, 429, {"Retry-After": "12"}),
+        ):
+            with pytest.raises(hc.ApiException):
+                klines(api_client)
+
+        assert exporter.counter("hyblock.client.rate_limited") == 1
+        assert exporter.counter("hyblock.client.errors", **{"error.type": "429"}) == 1
+        assert exporter.histogram("hyblock.client.retry_after") == [12.0]
+        assert exporter.spans[-1].name == "hyblock.call_api"
+        assert exporter.spans[-1].error
+
+    def test_transport_error(self, unreachable_client):
+        """Verificar el span y la métrica de una petición sin respuesta."""
+        exporter = InMemoryExporter()
+        unreachable_client.request_observer = Tracer(exporter)
+
+        with pytest.raises(MaxRetryError):
+            klines(unreachable_client)
+
+        (call,) = exporter.spans
+        assert call.name == "hyblock.call_api"
+        assert call.error
+        assert call.attributes["http.status_code"] is None
+        assert (
+            exporter.counter("hyblock.client.errors", **{"error.type": "MaxRetryError"})
+            == 1
+        )
+
+    def test_chained_observer(self, http_response):
+        """Verificar que el observer adicional siga recibiendo los tiempos."""
+        api_client = hc.ApiClient(hc.Configuration(host="http://x"))
+        recorded = []
+        api_client.request_observer = Tracer(
+            InMemoryExporter(), observer=recorded.append
+        )
+
+        with patch.object(
+            api_client.rest_client, "request", return_value=http_response(PAYLOAD)
+        ):
+            klines(api_client)
+
+        assert len(recorded) == 1
+
+    def test_request_attributes(self):
+        """Verificar la extracción de atributos de la URL."""
+        attributes = request_attributes(
+            "https://api/v1/bidAsk?coin=ETH&limit=5", base_path="/v1"
+        )
+
+        assert attributes == {"hyblock.resource": "/bidAsk", "hyblock.coin": "ETH"}
+
+    def test_exporter_is_abstract(self):
+        """Verificar que un exporter deba implementar todos los métodos."""
+
+        class SpansOnly(Exporter):
+            def start_span(self, name, attributes, parent=None):
+                pass
+
+            def end_span(self, span, attributes, error, exception=None):
+                pass
+
+        with pytest.raises(TypeError):
+            SpansOnly()
+
+
+class TestOpenTelemetryExporter:
+    """Tests para OpenTelemetryExporter."""
+
+    def test_exports_to_opentelemetry(self, http_response):
+        """Verificar el reenvío de spans y métricas a OpenTelemetry."""
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        spans = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(spans))
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+
+        api_client = hc.ApiClient(hc.Configuration(host="http://x"))
+        api_client.request_observer = Tracer(
+            OpenTelemetryExporter(tracer_provider, meter_provider)
+        )
+        with patch.object(
+            api_client.rest_client, "request", return_value=http_response(PAYLOAD)
+        ):
+            klines(api_client)
+
+        deserialize, call = spans.get_finished_spans()
+        assert call.name == "hyblock.call_api"
+        assert deserialize.name == "hyblock.response_deserialize"
+        assert deserialize.parent.span_id == call.context.span_id
+        assert deserialize.context.trace_id == call.context.trace_id
+        assert call.attributes["http.status_code"] == 200
+        metrics = reader.get_metrics_data().resource_metrics[0].scope_metrics[0]
+        assert {m.name for m in metrics.metrics} >= {
+            "hyblock.client.requests",
+            "hyblock.client.duration",
+        }
+
+    def test_call_api_span_is_current(self, http_response):
+        """Verificar que la petición se envíe con el span de call_api activo."""
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry import trace
+        from opentelemetry.sdk.trace import TracerProvider
+
+        api_client = hc.ApiClient(hc.Configuration(host="http://x"))
+        api_client.request_observer = Tracer(OpenTelemetryExporter(TracerProvider()))
+        current = []
+
+        def request(*args, **kwargs):
+            current.append(trace.get_current_span())
+            return http_response(PAYLOAD)
+
+        with patch.object(api_client.rest_client, "request", side_effect=request):
+            klines(api_client)
+
+        assert current[0].name == "hyblock.call_api"
+
+    def test_transport_error_span(self, unreachable_client):
+        """Verificar el estado y la excepción del span de una petición fallida."""
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+        from opentelemetry.trace import StatusCode
+
+        spans = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(spans))
+        unreachable_client.request_observer = Tracer(
+            OpenTelemetryExporter(tracer_provider)
+        )
+
+        with pytest.raises(MaxRetryError):
+            klines(unreachable_client)
+
+        (call,) = spans.get_finished_spans()
+        assert call.status.status_code is StatusCode.ERROR
+        assert call.events[0].name == "exception"